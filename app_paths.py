@@ -0,0 +1,22 @@
+import os
+
+APP_NAME = "SoftwareAcademySystemChecker"
+
+# Set to use a different (e.g. shared network) folder for the checker's caches
+CACHE_DIR_ENV = "UE_CHECK_CACHE_DIR"
+
+
+def cache_dir(*parts):
+    """Return (and create) a folder under the checker's per-user cache."""
+    base = os.environ.get(CACHE_DIR_ENV)
+    if not base:
+        if os.name == "nt":
+            root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+        base = os.path.join(root, APP_NAME)
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
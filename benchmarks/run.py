@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from unittest.mock import MagicMock, patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import system_check
+from specs import GIB, GPU, SystemSpecs
+from validation import REQUIREMENTS_UE5, evaluate_tiers, validate_specs
+
+# A run fails when a case is this much slower than in the baseline (0.25 = 25%)
+REGRESSION_THRESHOLD = 0.25
+# Cases faster than this are too noisy to fail a run on, in seconds
+REGRESSION_FLOOR = 0.0001
+BATCH_SIZES = (1_000, 100_000)
+
+TYPICAL_SPECS = SystemSpecs(
+    cpu_name="Intel(R) Core(TM) i7-8565U CPU @ 1.80GHz",
+    cpu_cores=4,
+    ram_bytes=16 * GIB,
+    disk_free_bytes=250 * GIB,
+    os_name="Windows 10",
+    gpus=(GPU("NVIDIA GeForce GTX 1080", "456.71", 8 * GIB, "NVIDIA", True),),
+)
+
+# Instant stand-ins for every probe, so only the check's own overhead is timed
+MOCK_PROBES = {
+    "CPU": lambda: {"cpu_name": TYPICAL_SPECS.cpu_name, "cpu_cores": 4},
+    "RAM": lambda: {"ram_bytes": TYPICAL_SPECS.ram_bytes},
+    "Disk Space": lambda: {"disk_free_bytes": TYPICAL_SPECS.disk_free_bytes},
+    "OS": lambda: {"os_name": TYPICAL_SPECS.os_name},
+    "GPU": lambda: {"gpus": TYPICAL_SPECS.gpus},
+}
+
+
+class Skip(Exception):
+    """Raised by a case that cannot run here (no GPU library, no display...)."""
+
+
+def per_call(fn, repeat):
+    """Best time of one fn() call, in seconds, over `repeat` timeit rounds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def once(fn, repeat):
+    """Best wall time of fn() over `repeat` single calls, for slow cases."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_check_specs_mocked(repeat):
+    with patch.object(system_check, "PROBES", MOCK_PROBES):
+        return per_call(system_check.check_system_specs, repeat)
+
+
+def bench_check_specs_real(repeat):
+    system_check.clear_gpu_cache()
+    system_check.clear_volume_cache()
+    return once(system_check.check_system_specs, repeat)
+
+
+def bench_validate_specs(repeat):
+    return per_call(lambda: validate_specs(TYPICAL_SPECS, REQUIREMENTS_UE5["recommended"]), repeat)
+
+
+def bench_evaluate_tiers(repeat):
+    return per_call(lambda: evaluate_tiers(TYPICAL_SPECS), repeat)
+
+
+def _mock_gpu():
+    gpu = MagicMock(driver="456.71", memoryTotal=8192, load=0.1)
+    gpu.name = "NVIDIA GeForce GTX 1080"
+    return gpu
+
+
+def bench_driver_check_mocked(repeat):
+    # A fresh enumeration and driver lookup each call, without nvidia-smi
+    def run():
+        system_check.clear_gpu_cache()
+        system_check.check_driver.cache_clear()
+        system_check.check_driver_and_link_user()
+
+    gputil = MagicMock(getGPUs=MagicMock(return_value=[_mock_gpu()]))
+    with patch.dict(sys.modules, {"GPUtil": gputil}), patch("webbrowser.open"):
+        return per_call(run, repeat)
+
+
+def bench_driver_check_real(repeat):
+    try:
+        import GPUtil
+    except ImportError:
+        raise Skip("GPUtil is not installed")
+
+    def run():
+        system_check.clear_gpu_cache()
+        system_check.check_driver_and_link_user()
+
+    with patch("webbrowser.open"):
+        return once(run, repeat)
+
+
+def bench_batch(size):
+    def bench(repeat):
+        try:
+            import numpy
+        except ImportError:
+            raise Skip("NumPy is not installed")
+        from validation import specs_to_columns, validate_batch
+
+        columns = specs_to_columns([TYPICAL_SPECS])
+        columns = {name: values * size for name, values in columns.items()}
+        return per_call(lambda: validate_batch(columns), repeat)
+
+    return bench
+
+
+def bench_first_window(repeat):
+    from startup import first_window_ms, has_display
+
+    if not has_display():
+        raise Skip("no display")
+    try:
+        return min(first_window_ms() for _ in range(repeat)) / 1000
+    except RuntimeError as e:
+        raise Skip(f"could not start GUI ({e})")
+
+
+# name -> (function(repeat) -> seconds, slow: uses real hardware or opens a window)
+CASES = {
+    "check_system_specs[mocked]": (bench_check_specs_mocked, False),
+    "check_system_specs[real]": (bench_check_specs_real, True),
+    "validate_specs": (bench_validate_specs, False),
+    "evaluate_tiers": (bench_evaluate_tiers, False),
+    "check_driver_and_link_user[mocked]": (bench_driver_check_mocked, False),
+    "check_driver_and_link_user[real]": (bench_driver_check_real, True),
+    **{f"validate_batch[{size}]": (bench_batch(size), False) for size in BATCH_SIZES},
+    "create_gui[first window]": (bench_first_window, True),
+}
+
+
+def run_cases(names, repeat, real_repeat):
+    """Time the named cases; returns (results, skipped) dictionaries."""
+    results = {}
+    skipped = {}
+    for name in names:
+        bench, real = CASES[name]
+        try:
+            seconds = bench(real_repeat if real else repeat)
+        except Skip as e:
+            skipped[name] = str(e)
+            print(f"{name:<38} skipped ({e})")
+            continue
+        results[name] = seconds
+        print(f"{name:<38} {seconds * 1000:12.4f} ms")
+    return results, skipped
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Cases more than `threshold` slower than `baseline`, as (name, old, new)."""
+    regressions = []
+    for name, seconds in results.items():
+        old = baseline.get(name)
+        if old is None or max(old, seconds) < REGRESSION_FLOOR:
+            continue
+        if seconds > old * (1 + threshold):
+            regressions.append((name, old, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time the checker's hot paths, save the results and compare runs."
+    )
+    parser.add_argument("--output", metavar="FILE", help="save the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="fail on regressions against this JSON run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="allowed slowdown before a case counts as a regression (default %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per case; the best is kept")
+    parser.add_argument("--real-repeat", type=int, default=1, help="runs of the slow cases")
+    parser.add_argument("--mocked-only", action="store_true", help="skip the slow cases")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="run only this case (repeatable)")
+    args = parser.parse_args(argv)
+
+    names = args.case or [name for name, (_, real) in CASES.items() if not (real and args.mocked_only)]
+    results, skipped = run_cases(names, args.repeat, args.real_repeat)
+
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+        "skipped": skipped,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old * 1000:.4f} ms -> {new * 1000:.4f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
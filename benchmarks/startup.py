@@ -0,0 +1,136 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startup budgets in milliseconds. Import budgets are the cumulative
+# `python -X importtime` figure for the module; the window budget runs from
+# interpreter start to the first drawn frame of create_gui().
+IMPORT_BUDGETS_MS = {
+    "system_check": 150,
+    "ue_check": 200,
+    "main_canvas": 300,
+}
+FIRST_WINDOW_BUDGET_MS = 1500
+
+# Modules that must not be loaded just by importing each entry point
+DEFERRED_MODULES = {
+    "system_check": ("GPUtil", "webbrowser"),
+    "ue_check": ("GPUtil", "tkinter", "PIL", "tkextrafont", "urllib.request"),
+    "main_canvas": ("PIL", "tkextrafont", "winreg", "ctypes", "GPUtil"),
+}
+
+FIRST_WINDOW_SCRIPT = """
+import time
+started = time.perf_counter()
+import tkinter
+
+def first_frame(self, n=0):
+    self.update()
+    print((time.perf_counter() - started) * 1000)
+    self.destroy()
+
+tkinter.Misc.mainloop = first_frame
+import main_canvas
+main_canvas.create_gui()
+"""
+
+
+def _python(args, **kwargs):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        **kwargs,
+    )
+
+
+def import_time_ms(module):
+    """Cumulative import time of `module` in a fresh interpreter, in ms."""
+    result = _python(["-X", "importtime", "-c", f"import {module}"], check=True)
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def deferred_modules_loaded(module):
+    """Names from DEFERRED_MODULES[module] that importing it loaded anyway."""
+    names = DEFERRED_MODULES[module]
+    script = (
+        f"import sys, {module}; "
+        f"print(','.join(n for n in {names!r} if n in sys.modules))"
+    )
+    out = _python(["-c", script], check=True).stdout.strip()
+    return [name for name in out.split(",") if name]
+
+
+def has_display():
+    return not sys.platform.startswith("linux") or bool(os.environ.get("DISPLAY"))
+
+
+def first_window_ms():
+    """Time from interpreter start to create_gui's first frame, in ms."""
+    started = time.perf_counter()
+    result = _python(["-c", FIRST_WINDOW_SCRIPT], timeout=60)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    # Interpreter start-up is not visible inside the script, so use wall time
+    return (time.perf_counter() - started) * 1000
+
+
+def best_of(measure, repeat):
+    return min(measure() for _ in range(repeat))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure start-up time and fail when it goes over budget."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the best is kept")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        elapsed = best_of(lambda: import_time_ms(module), args.repeat)
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        print(f"import {module:<14} {elapsed:8.1f} ms  (budget {budget} ms)  {status}")
+        if elapsed > budget:
+            over_budget.append(f"import {module}")
+
+        loaded = deferred_modules_loaded(module)
+        if loaded:
+            print(f"  {module} loads modules that should be deferred: {', '.join(loaded)}")
+            over_budget.append(f"eager imports in {module}")
+
+    if not has_display():
+        print("time to first window: skipped (no display)")
+    else:
+        try:
+            elapsed = best_of(first_window_ms, args.repeat)
+        except RuntimeError as e:
+            print(f"time to first window: could not start GUI ({e})")
+            over_budget.append("first window")
+        else:
+            status = "ok" if elapsed <= FIRST_WINDOW_BUDGET_MS else "OVER BUDGET"
+            print(
+                f"time to first window   {elapsed:8.1f} ms  "
+                f"(budget {FIRST_WINDOW_BUDGET_MS} ms)  {status}"
+            )
+            if elapsed > FIRST_WINDOW_BUDGET_MS:
+                over_budget.append("first window")
+
+    if over_budget:
+        print("Start-up budget exceeded: " + ", ".join(over_budget))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import json
+import sqlite3
+import time
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_DB = "fleet_reports.db"
+
+QUEUE_SIZE = 10000  # Reports waiting to be written before senders are pushed back
+BATCH_SIZE = 500  # Reports written per storage transaction
+FLUSH_INTERVAL = 0.25  # Longest time a report waits for its batch to fill, in seconds
+PUT_TIMEOUT = 0.5  # How long a sender waits for queue space before getting a 503
+MAX_BODY = 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    411: "Length Required",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+class Collector:
+    """Collects checker reports over HTTP and stores them in SQLite.
+
+    Reports are POSTed as JSON to /reports. They go onto a bounded queue and a
+    single writer task stores them in batches. When the queue is full a
+    sender waits up to `put_timeout` seconds and then gets a 503 with a
+    Retry-After header, so a burst from a whole lab slows the senders down
+    instead of growing memory without limit. GET /summary returns how many
+    machines are in each tier, counting each machine's latest report.
+    """
+
+    def __init__(
+        self,
+        db_path=DEFAULT_DB,
+        queue_size=QUEUE_SIZE,
+        batch_size=BATCH_SIZE,
+        flush_interval=FLUSH_INTERVAL,
+        put_timeout=PUT_TIMEOUT,
+    ):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.stored = 0
+        self.rejected = 0
+        self._server = None
+        self._writer_task = None
+        self._connections = set()
+        # Only the writer task touches the connection, one batch at a time
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS reports "
+            "(received_at REAL, host TEXT, tier TEXT, report TEXT)"
+        )
+        self._db.commit()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self._writer_task = asyncio.create_task(self._write_batches())
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        """Stop accepting reports, store everything queued and close storage."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+        await self.queue.join()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._db.close()
+
+    async def submit(self, report):
+        """Queue a report for storage. Returns False if the queue stayed full."""
+        row = (time.time(), str(report.get("host", "")), report.get("tier"), json.dumps(report))
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self.queue.put(row), self.put_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                return False
+        return True
+
+    def summary(self):
+        rows = self._db.execute(
+            "SELECT tier, COUNT(*) FROM "
+            "(SELECT host, tier, MAX(received_at) FROM reports GROUP BY host) "
+            "GROUP BY tier"
+        ).fetchall()
+        return {
+            "machines": {str(tier): count for tier, count in rows},
+            "stored": self.stored,
+            "queued": self.queue.qsize(),
+            "rejected": self.rejected,
+        }
+
+    async def _write_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            try:
+                await asyncio.to_thread(self._store, batch)
+                self.stored += len(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _store(self, batch):
+        with self._db:
+            self._db.executemany("INSERT INTO reports VALUES (?, ?, ?, ?)", batch)
+
+    async def _handle(self, reader, writer):
+        self._connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _version = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    # The body is left unread, so the connection cannot be reused
+                    status, body, extra = 413, {"error": "report too large"}, {}
+                    keep_alive = False
+                else:
+                    data = await reader.readexactly(length)
+                    status, body, extra = await self._route(method, path, headers, data)
+                await self._respond(writer, status, body, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _route(self, method, path, headers, data):
+        if method == "GET" and path == "/summary":
+            return 200, self.summary(), {}
+        if method != "POST" or path != "/reports":
+            return 404, {"error": "not found"}, {}
+
+        if "content-length" not in headers:
+            return 411, {"error": "Content-Length required"}, {}
+
+        try:
+            report = json.loads(data)
+        except ValueError:
+            return 400, {"error": "invalid JSON"}, {}
+        if not isinstance(report, dict):
+            return 400, {"error": "report must be a JSON object"}, {}
+
+        if not await self.submit(report):
+            return 503, {"error": "collector busy"}, {"Retry-After": "1"}
+        return 202, {"status": "queued"}, {}
+
+    async def _respond(self, writer, status, body, extra, keep_alive):
+        payload = json.dumps(body).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(payload)}",
+            "Connection: " + ("keep-alive" if keep_alive else "close"),
+        ]
+        head += [f"{name}: {value}" for name, value in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+        await writer.drain()
+
+
+async def serve(host, port, db_path):
+    collector = Collector(db_path)
+    host, port = await collector.start(host, port)
+    print(f"Collecting reports on http://{host}:{port}/reports (summary at /summary)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await collector.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Collect Unreal Engine checker reports from lab machines."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="use 0.0.0.0 to listen on the LAN")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite file to store reports in")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.db))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import asyncio
+import collections
+import functools
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+
+import timing
+
+PROBE_TIMEOUT = 10  # Seconds for quick tool probes such as `python --version`
+INSTALL_TIMEOUT = 1800  # Seconds for winget and pip installs
+OUTPUT_TAIL = 4000  # Characters of output kept for error reports
+STREAM_LINES = 200  # Lines of streamed output kept in the ring buffer
+STREAM_FLUSH_INTERVAL = 0.25  # Seconds between batches handed to on_output
+STREAM_LINE_LIMIT = 1024 * 1024  # Longest single line read from a stream
+
+
+@dataclass(frozen=True, slots=True)
+class CommandResult:
+    """Outcome of one external command.
+
+    `returncode` is None when the command could not be started (`error`
+    says why) or was killed after `timeout` seconds (`timed_out`). `output`
+    is the tail of the combined stdout and stderr.
+    """
+
+    cmd: tuple
+    returncode: int | None
+    duration: float
+    output: str = ""
+    timed_out: bool = False
+    error: str = ""
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+def command_outcome(result):
+    """Short outcome of a CommandResult for timing spans: "exit 0", "timed out"..."""
+    if result.timed_out:
+        return "timed out"
+    if result.returncode is None:
+        return "error"
+    return f"exit {result.returncode}"
+
+
+def _timed(fn):
+    """Record each command run by the coroutine fn as a timing span."""
+
+    @functools.wraps(fn)
+    async def wrapper(cmd, *args, **kwargs):
+        result = await fn(cmd, *args, **kwargs)
+        if timing.enabled():
+            program = (os.path.basename(result.cmd[0]),) if result.cmd else ()
+            name = " ".join(("command",) + program + result.cmd[1:3])
+            timing.record(name, time.perf_counter() - result.duration, command_outcome(result))
+        return result
+
+    return wrapper
+
+
+@_timed
+async def run_command_async(cmd, timeout=PROBE_TIMEOUT, tail=OUTPUT_TAIL):
+    """Run cmd as a subprocess without blocking the event loop."""
+    cmd = tuple(cmd)
+    started = time.monotonic()
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+    except OSError as e:
+        return CommandResult(cmd, None, time.monotonic() - started, error=str(e))
+
+    try:
+        out, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return CommandResult(
+            cmd,
+            None,
+            time.monotonic() - started,
+            timed_out=True,
+            error=f"Timed out after {timeout} seconds",
+        )
+
+    output = out.decode(errors="replace")[-tail:]
+    return CommandResult(cmd, process.returncode, time.monotonic() - started, output)
+
+
+def run_commands(commands, timeout=PROBE_TIMEOUT):
+    """Start all commands at once and return their results in the same order.
+
+    Independent probes (python, python3, winget, ...) therefore cost as long
+    as the slowest one instead of the sum of all of them.
+    """
+
+    async def run_all():
+        return await asyncio.gather(
+            *(run_command_async(cmd, timeout) for cmd in commands)
+        )
+
+    return list(asyncio.run(run_all()))
+
+
+def run_command(cmd, timeout=PROBE_TIMEOUT):
+    """Run a single command and wait for its CommandResult."""
+    return run_commands([cmd], timeout)[0]
+
+
+@_timed
+async def stream_command_async(
+    cmd,
+    on_output=None,
+    timeout=INSTALL_TIMEOUT,
+    max_lines=STREAM_LINES,
+    flush_interval=STREAM_FLUSH_INTERVAL,
+    tail=OUTPUT_TAIL,
+):
+    """Run cmd, reading its output line by line into a fixed-size ring buffer.
+
+    New lines are handed to on_output(lines) in batches, at most once every
+    `flush_interval` seconds, so a chatty pip install cannot flood the UI.
+    Only the last `max_lines` lines are ever held in memory; they become the
+    result's output for error reports.
+    """
+    cmd = tuple(cmd)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            limit=STREAM_LINE_LIMIT,
+        )
+    except OSError as e:
+        return CommandResult(cmd, None, loop.time() - started, error=str(e))
+
+    ring = collections.deque(maxlen=max_lines)
+    pending = collections.deque(maxlen=max_lines)
+
+    def flush():
+        if on_output is not None and pending:
+            on_output(list(pending))
+        pending.clear()
+
+    async def flush_periodically():
+        while True:
+            await asyncio.sleep(flush_interval)
+            flush()
+
+    async def read_lines():
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            text = line.decode(errors="replace").rstrip("\r\n")
+            ring.append(text)
+            pending.append(text)
+        await process.wait()
+
+    flusher = asyncio.create_task(flush_periodically())
+    try:
+        await asyncio.wait_for(read_lines(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        flush()
+        return CommandResult(
+            cmd,
+            None,
+            loop.time() - started,
+            "\n".join(ring)[-tail:],
+            timed_out=True,
+            error=f"Timed out after {timeout} seconds",
+        )
+    finally:
+        flusher.cancel()
+
+    flush()
+    return CommandResult(
+        cmd, process.returncode, loop.time() - started, "\n".join(ring)[-tail:]
+    )
+
+
+def stream_command(cmd, on_output=None, timeout=INSTALL_TIMEOUT, **kwargs):
+    """Blocking wrapper around stream_command_async."""
+    return asyncio.run(stream_command_async(cmd, on_output, timeout, **kwargs))
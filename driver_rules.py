@@ -0,0 +1,159 @@
+import functools
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+RULES_FILE = "driver_rules.json"
+
+# Vendor minimums used when the rules file is missing or unreadable, e.g. in
+# an executable built without it. These are the checker's original minimums.
+BUILTIN_RULES = {
+    "vendors": {
+        "NVIDIA": {
+            "aliases": ["nvidia", "geforce", "quadro", "tesla", "titan"],
+            "minimum": "456.38",
+            "download": "https://www.nvidia.com/Download/index.aspx",
+        },
+        "AMD": {
+            "aliases": ["amd", "ati", "radeon", "firepro"],
+            "minimum": "20.10.1",
+            "download": "https://www.amd.com/en/support",
+        },
+        "Intel": {
+            "aliases": ["intel", "iris", "uhd", "arc"],
+            "minimum": "27.20.100.8587",
+            "download": "https://www.intel.com/content/www/us/en/download-center/home.html",
+        },
+    },
+}
+
+# Trademark marks and vendor names are dropped before family lookup, so
+# "NVIDIA GeForce RTX 4090" and "GeForce RTX 4090" find the same family
+_NOISE_RE = re.compile(r"\((r|tm)\)|®|™")
+_LEADING_VENDOR_RE = re.compile(r"^(nvidia|amd|ati|intel)\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class DriverRule:
+    """Minimum driver for a vendor, or for one GPU family of that vendor."""
+
+    vendor: str
+    minimum: tuple
+    download: str
+
+
+@dataclass(frozen=True, slots=True)
+class DriverVerdict:
+    """Result of checking one (GPU name, driver version) pair."""
+
+    vendor: str | None
+    up_to_date: bool
+    minimum: str | None
+    download: str | None
+
+
+def parse_version(text):
+    """Driver version string -> comparable tuple of ints, e.g. "456.38" -> (456, 38).
+
+    Returns None when the text holds no numbers at all.
+    """
+    numbers = re.findall(r"\d+", text or "")
+    return tuple(int(n) for n in numbers) if numbers else None
+
+
+def _padded(version, length):
+    return version + (0,) * (length - len(version))
+
+
+def version_at_least(version, minimum):
+    length = max(len(version), len(minimum))
+    return _padded(version, length) >= _padded(minimum, length)
+
+
+def normalize_gpu_name(name):
+    name = _NOISE_RE.sub("", (name or "").lower())
+    name = " ".join(name.split())
+    return _LEADING_VENDOR_RE.sub("", name)
+
+
+class DriverRules:
+    """Indexed lookup of minimum drivers.
+
+    Vendors are found through a dict of name tokens (geforce, radeon, ...)
+    and GPU families through a character trie of family prefixes, so one
+    lookup costs as much as the GPU name is long however many families the
+    rules file lists. The longest matching family wins over the vendor rule.
+    """
+
+    def __init__(self, data):
+        self.vendors = {}
+        self.aliases = {}
+        for vendor, entry in data["vendors"].items():
+            self.vendors[vendor] = DriverRule(
+                vendor, parse_version(entry["minimum"]), entry["download"]
+            )
+            for alias in entry["aliases"]:
+                self.aliases[alias.lower()] = vendor
+
+        self.trie = {}
+        for entry in data.get("families", ()):
+            vendor = self.vendors[entry["vendor"]]
+            node = self.trie
+            for char in normalize_gpu_name(entry["prefix"]):
+                node = node.setdefault(char, {})
+            node[None] = DriverRule(
+                vendor.vendor, parse_version(entry["minimum"]), vendor.download
+            )
+
+    def family_rule(self, name):
+        """The rule of the longest family prefix of `name`, or None."""
+        node, found = self.trie, None
+        for char in normalize_gpu_name(name):
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+    def vendor_rule(self, name):
+        for token in re.split(r"[^a-z0-9]+", (name or "").lower()):
+            vendor = self.aliases.get(token)
+            if vendor is not None:
+                return self.vendors[vendor]
+        return None
+
+    def rule_for(self, name):
+        return self.family_rule(name) or self.vendor_rule(name)
+
+
+def rules_path():
+    # Bundled next to the executable by PyInstaller, next to this file otherwise
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, RULES_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def load_rules(path=None):
+    """The driver rules from the rules file, or BUILTIN_RULES if it cannot be read."""
+    path = path or rules_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            return DriverRules(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Could not read {path} ({e}); using the built-in driver minimums.")
+        return DriverRules(BUILTIN_RULES)
+
+
+@functools.lru_cache(maxsize=1024)
+def check_driver(gpu_name, driver_version):
+    """Check a GPU's driver against the rules file. Memoised per (name, driver)."""
+    rule = load_rules().rule_for(gpu_name)
+    if rule is None:
+        return DriverVerdict(None, False, None, None)
+
+    version = parse_version(driver_version)
+    up_to_date = version is not None and version_at_least(version, rule.minimum)
+    minimum = ".".join(str(n) for n in rule.minimum)
+    return DriverVerdict(rule.vendor, up_to_date, minimum, rule.download)
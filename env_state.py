@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import re
+import time
+
+from commands import CommandResult, run_command, PROBE_TIMEOUT
+from wheelhouse import install_requirements
+
+FINGERPRINT_FILE = ".requirements-fingerprint"
+UP_TO_DATE = "Requirements already satisfied."
+
+# Run inside the target interpreter: who it is and what is installed in it
+INSPECT_SCRIPT = (
+    "import json, sys, importlib.metadata as m; "
+    "print(json.dumps({'executable': sys.executable, 'version': sys.version, "
+    "'installed': {d.metadata['Name']: d.version for d in m.distributions() "
+    "if d.metadata['Name']}}))"
+)
+
+REQUIREMENT_RE = re.compile(
+    r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?P<specs>(?:[<>=!~]=?\s*[^,;\s]+\s*,?\s*)*)$"
+)
+SPEC_RE = re.compile(r"(~=|==|!=|<=|>=|<|>)\s*([^,\s]+)")
+
+
+def normalize_name(name):
+    """PEP 503 project name, so "PyGame" and "pygame" match."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def inspect_environment(python_exec):
+    """Interpreter and installed distributions of python_exec, or None.
+
+    The result is {"executable", "version", "installed"}, where installed
+    maps normalised project names to versions, as read by importlib.metadata
+    inside that interpreter.
+    """
+    result = run_command([python_exec, "-c", INSPECT_SCRIPT], PROBE_TIMEOUT)
+    if not result.ok:
+        return None
+    try:
+        state = json.loads(result.output.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        return None
+    state["installed"] = {
+        normalize_name(name): version for name, version in state["installed"].items()
+    }
+    return state
+
+
+def read_requirements(path):
+    """Requirement lines of a requirements file, without comments.
+
+    Returns None if the file uses pip options (-r, -e, --index-url, ...),
+    which only pip itself can follow.
+    """
+    requirements = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split(" #", 1)[0].strip()
+            if line.startswith("-"):
+                return None
+            if line and not line.startswith("#"):
+                requirements.append(line)
+    return requirements
+
+
+def _release(version):
+    """(1, 2, 0) for "1.2", or None for versions with pre/post/dev parts."""
+    if not re.fullmatch(r"\d+(\.\d+)*", version):
+        return None
+    parts = [int(part) for part in version.split(".")]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def _matches(installed, operator, wanted):
+    if operator == "==" and wanted.endswith(".*"):
+        return (installed + ".").startswith(wanted[:-1])
+    have, want = _release(installed), _release(wanted)
+    if have is None or want is None:
+        # Only exact pins can be checked without a full version parser
+        return operator == "==" and installed == wanted
+    if operator == "~=":
+        return have >= want and have[: len(want) - 1] == want[:-1]
+    return {
+        "==": have == want,
+        "!=": have != want,
+        ">=": have >= want,
+        "<=": have <= want,
+        ">": have > want,
+        "<": have < want,
+    }[operator]
+
+
+def is_satisfied(requirement, installed):
+    """Whether `requirement` (e.g. "colorama==0.4.6") is met by `installed`.
+
+    Lines with extras, markers or URLs cannot be judged here and count as
+    unsatisfied, so pip gets to decide.
+    """
+    match = REQUIREMENT_RE.match(requirement.strip())
+    if match is None:
+        return False
+    version = installed.get(normalize_name(match["name"]))
+    if version is None:
+        return False
+    return all(
+        _matches(version, operator, wanted)
+        for operator, wanted in SPEC_RE.findall(match["specs"])
+    )
+
+
+def unsatisfied(requirements, installed):
+    """The requirements that are missing or out of date, in order."""
+    return [req for req in requirements if not is_satisfied(req, installed)]
+
+
+def fingerprint(requirements_text, state):
+    """Hash of a requirements file, the interpreter and what is installed."""
+    digest = hashlib.sha256()
+    digest.update(requirements_text)
+    digest.update(json.dumps(state, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _up_to_date(python_exec, started):
+    return CommandResult(
+        (python_exec,), 0, time.monotonic() - started, UP_TO_DATE
+    )
+
+
+def ensure_requirements(python_exec, requirements, on_output=None):
+    """Install only those of `requirements` that python_exec does not already meet.
+
+    Returns the pip CommandResult, or an "already satisfied" result with
+    returncode 0 when there was nothing to do.
+    """
+    started = time.monotonic()
+    state = inspect_environment(python_exec)
+    missing = list(requirements) if state is None else unsatisfied(requirements, state["installed"])
+    if not missing:
+        return _up_to_date(python_exec, started)
+    return install_requirements(python_exec, missing, on_output)
+
+
+def ensure_requirements_file(python_exec, requirements_file, env_dir, on_output=None):
+    """Bring the venv at env_dir up to date with requirements_file.
+
+    A fingerprint of the file, the interpreter and the installed
+    distributions is kept in the venv. When it still matches, nothing runs;
+    otherwise only missing or out of date requirements are installed.
+    """
+    started = time.monotonic()
+    with open(requirements_file, "rb") as f:
+        requirements_text = f.read()
+    fingerprint_path = os.path.join(env_dir, FINGERPRINT_FILE)
+
+    state = inspect_environment(python_exec)
+    if state is None:
+        return install_requirements(
+            python_exec, ["-r", os.path.abspath(requirements_file)], on_output
+        )
+    try:
+        with open(fingerprint_path, encoding="utf-8") as f:
+            if f.read().strip() == fingerprint(requirements_text, state):
+                return _up_to_date(python_exec, started)
+    except OSError:
+        pass
+
+    requirements = read_requirements(requirements_file)
+    if requirements is None:
+        missing = ["-r", os.path.abspath(requirements_file)]
+    else:
+        missing = unsatisfied(requirements, state["installed"])
+    result = _up_to_date(python_exec, started)
+    if missing:
+        result = install_requirements(python_exec, missing, on_output)
+        if not result.ok:
+            return result
+        state = inspect_environment(python_exec)
+
+    if state is not None:
+        with open(fingerprint_path, "w", encoding="utf-8") as f:
+            f.write(fingerprint(requirements_text, state))
+    return result
@@ -0,0 +1,121 @@
+import os
+import select
+import sys
+import time
+
+INSTALL_WAIT_TIMEOUT = 12  # Seconds to wait for a freshly installed tool to appear
+POLL_INTERVAL = 0.1  # First polling interval; doubles up to MAX_POLL_INTERVAL
+MAX_POLL_INTERVAL = 2.0
+
+# inotify event mask: anything that can make a new executable show up
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+def _nearest_existing(folder):
+    """The folder itself, or its closest ancestor that exists."""
+    folder = os.path.abspath(folder)
+    while not os.path.isdir(folder):
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+    return folder
+
+
+class InotifyWatcher:
+    """Wakes up when anything is created or changed in a set of folders (Linux).
+
+    Folders that do not exist yet are watched through their closest existing
+    ancestor and picked up directly once they have been created.
+    """
+
+    def __init__(self, folders):
+        import ctypes
+        import ctypes.util
+
+        self.folders = list(folders)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched = set()
+        self._add_watches()
+
+    def _add_watches(self):
+        for folder in self.folders:
+            target = _nearest_existing(folder)
+            if target is None or target in self._watched:
+                continue
+            if self._libc.inotify_add_watch(self._fd, os.fsencode(target), IN_WATCH_MASK) >= 0:
+                self._watched.add(target)
+
+    def wait(self, timeout):
+        """Block until a change is seen or `timeout` seconds pass."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self._fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        # A watched ancestor may now contain the folder we are waiting for
+        self._add_watches()
+        return True
+
+    def close(self):
+        os.close(self._fd)
+
+
+def watch_folders(folders):
+    """An InotifyWatcher for `folders`, or None where inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return InotifyWatcher(folders)
+    except (OSError, AttributeError):
+        return None
+
+
+def wait_for_tool(
+    is_ready,
+    folders,
+    timeout=INSTALL_WAIT_TIMEOUT,
+    poll_interval=POLL_INTERVAL,
+    max_poll_interval=MAX_POLL_INTERVAL,
+    use_events=True,
+):
+    """Wait until is_ready() returns True, or give up after `timeout` seconds.
+
+    On Linux the install folders are watched with inotify and is_ready() is
+    re-checked as soon as something in them changes. Elsewhere (and as a
+    safety net) is_ready() is polled, starting at `poll_interval` and backing
+    off up to `max_poll_interval`. Returns whether the tool became ready.
+    """
+    if is_ready():
+        return True
+
+    watcher = watch_folders(folders) if use_events else None
+    deadline = time.monotonic() + timeout
+    interval = poll_interval
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if watcher is not None:
+                watcher.wait(min(max_poll_interval, remaining))
+            else:
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 2, max_poll_interval)
+            if is_ready():
+                return True
+    finally:
+        if watcher is not None:
+            watcher.close()
@@ -1,14 +1,15 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import webbrowser
-from PIL import Image, ImageTk
 import subprocess
 import os
 import sys
-from tkextrafont import Font
+import multiprocessing
 
-from system_check import check_system_specs, check_driver_and_link_user
-from validation import validate_specs
+import system_check
+from commands import run_commands
+from validation import evaluate_tiers, REQUIREMENTS_UE5, REQUIREMENTS_UE4
+from specs import as_system_specs
 
 
 # Helper function to get the correct path when bundled with PyInstaller
@@ -36,73 +37,45 @@ DRIVER_DOWNLOAD_LINKS = {
 }
 
 # Unreal Engine Requirements (Minimum, Recommended, and Unreal Engine 4)
-MINIMUM_REQUIREMENTS_UE5 = {
-    "CPU": 2,  # 2 cores
-    "RAM": 4,  # 4 GB
-    "Disk Space": 100,  # 100 GB free
-    "GPU": False,  # Dedicated GPU not required
-}
-
-RECOMMENDED_REQUIREMENTS_UE5 = {
-    "CPU": 4,  # 4 cores or more
-    "RAM": 8,  # 8 GB
-    "Disk Space": 100,  # 100 GB free
-    "GPU": True,  # Dedicated GPU required
-}
-
-MINIMUM_REQUIREMENTS_UE4 = {
-    "CPU": 2,  # 2 cores
-    "RAM": 4,  # 4 GB
-    "Disk Space": 50,  # 50 GB free
-    "GPU": False,  # Dedicated GPU not required
-}
-
-RECOMMENDED_REQUIREMENTS_UE4 = {
-    "CPU": 4,  # 4 cores or more
-    "RAM": 8,  # 8 GB
-    "Disk Space": 50,  # 50 GB free
-    "GPU": True,  # Dedicated GPU required
-}
+MINIMUM_REQUIREMENTS_UE5 = REQUIREMENTS_UE5["minimum"]
+RECOMMENDED_REQUIREMENTS_UE5 = REQUIREMENTS_UE5["recommended"]
+MINIMUM_REQUIREMENTS_UE4 = REQUIREMENTS_UE4["minimum"]
+RECOMMENDED_REQUIREMENTS_UE4 = REQUIREMENTS_UE4["recommended"]
 
 
 def test_unreal_engine(detailed_button, detailed_widget, is_testing=False):
     """Display Unreal Engine test results and show detailed information, including driver guidance."""
-    specs = check_system_specs()
+    # Looked up on the module at call time so tests can patch system_check
+    specs = as_system_specs(system_check.check_system_specs())
     ue4_fallback = False  # To track if UE4 is selected as fallback
     detailed_info = "--- Current System Specs ---\n"
 
     # Add current system specs to the detailed info
-    for key, value in specs.items():
+    for key, value in specs.display().items():
         detailed_info += f"{key}: {value}\n"
 
     detailed_info += "\n--- Unreal Engine 5 Requirements ---\n"
     detailed_info += f"Minimum Requirements: {MINIMUM_REQUIREMENTS_UE5}\n"
     detailed_info += f"Recommended Requirements: {RECOMMENDED_REQUIREMENTS_UE5}\n"
 
-    # First, check against Unreal Engine 5 recommended requirements
-    validation_errors = validate_specs(specs, RECOMMENDED_REQUIREMENTS_UE5)
+    # Check every Unreal Engine 5 and 4 tier in one pass
+    tiers = evaluate_tiers(specs)
+    validation_errors = []
 
-    if not validation_errors:
+    if tiers.tier == "ue5_recommended":
         output = "Yes, your system can run Unreal Engine 5!"
+    elif tiers.tier == "ue5_minimum":
+        output = (
+            "Your system meets the minimum requirements for Unreal Engine 5, "
+            "but may not perform optimally."
+        )
+    elif tiers.tier is not None:
+        output = "Your system can run Unreal Engine 4, but not Unreal Engine 5."
+        ue4_fallback = True  # Mark that UE4 fallback was selected
+        validation_errors = tiers.failures["ue5_minimum"]
     else:
-        # If recommended fails, check against minimum UE5
-        validation_errors = validate_specs(specs, MINIMUM_REQUIREMENTS_UE5)
-        if not validation_errors:
-            output = (
-                "Your system meets the minimum requirements for Unreal Engine 5, "
-                "but may not perform optimally."
-            )
-        else:
-            # If UE5 minimum requirements fail, check for Unreal Engine 4
-            validation_errors_ue4 = validate_specs(specs, MINIMUM_REQUIREMENTS_UE4)
-            if not validation_errors_ue4:
-                output = "Your system can run Unreal Engine 4, but not Unreal Engine 5."
-                ue4_fallback = True  # Mark that UE4 fallback was selected
-            else:
-                output = "No, your system cannot run Unreal Engine 4 or 5."
-                validation_errors = (
-                    validation_errors_ue4  # Use UE4 errors if UE5 failed
-                )
+        output = "No, your system cannot run Unreal Engine 4 or 5."
+        validation_errors = tiers.failures["ue4_minimum"]  # Use UE4 errors if UE5 failed
 
     # If running tests, return the output instead of showing a messagebox
     if is_testing:
@@ -125,7 +98,7 @@ def test_unreal_engine(detailed_button, detailed_widget, is_testing=False):
         )
 
     # Check for driver guidance
-    driver_message = check_driver_and_link_user()
+    driver_message = system_check.check_driver_and_link_user()
     if driver_message:
         if "outdated" in driver_message:
             messagebox.showerror("Driver Guidance", driver_message[0])
@@ -167,27 +140,9 @@ def install_python_pygame():
 
 def check_python_installed():
     """Check if Python is installed."""
-    try:
-        # Check if Python or Python3 is installed on the system
-        subprocess.run(
-            ["python", "--version"],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        return True
-    except Exception:
-        try:
-            # Some systems may have Python installed as "python3"
-            subprocess.run(
-                ["python3", "--version"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            return True
-        except Exception:
-            return False
+    # Some systems may have Python installed as "python3", so probe both at once
+    results = run_commands([["python", "--version"], ["python3", "--version"]])
+    return any(result.ok for result in results)
 
 
 def install_pygame():
@@ -231,6 +186,10 @@ def toggle_detailed_view(detailed_widget, details_button):
 
 def create_gui():
     """Create the GUI window."""
+    # Image and font support are only needed once the window is built
+    from PIL import Image, ImageTk
+    from tkextrafont import Font
+
     root = tk.Tk()
 
     root.title("Software Academy - System Checker & Python Installer")
@@ -328,4 +287,6 @@ def create_gui():
 
 
 if __name__ == "__main__":
+    # Lets the CPU benchmark's worker processes start in a PyInstaller build
+    multiprocessing.freeze_support()
     create_gui()
@@ -1,17 +1,22 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from tkinter import messagebox as tk_messagebox, scrolledtext
 import webbrowser
-from PIL import Image, ImageTk
 import subprocess
 import os
 import sys
-import time
+import multiprocessing
 import shutil
-import winreg
-import ctypes
-from tkextrafont import Font
-from system_check import check_system_specs, check_driver_and_link_user
-from validation import validate_specs
+import timing
+from system_check import check_system_specs, check_driver_and_link_user, BENCHMARK_ENV
+from validation import evaluate_tiers, REQUIREMENTS_UE5, REQUIREMENTS_UE4
+from report import build_report, send_report
+from task_runner import TaskRunner, MainThreadProxy
+from commands import stream_command, INSTALL_TIMEOUT
+from tool_discovery import discover, install_locations
+from install_watcher import wait_for_tool
+from env_state import ensure_requirements, ensure_requirements_file, UP_TO_DATE
+from venv_templates import provision_environment, venv_python
+from resource_sampler import ResourceSampler, SAMPLE_ENV
 
 
 # Helper function to get the correct path when bundled with PyInstaller
@@ -39,27 +44,31 @@ DRIVER_DOWNLOAD_LINKS = {
     "Intel": "https://www.intel.com/content/www/us/en/download-center/home.html",
 }
 
-# Unreal Engine Requirements
-REQUIREMENTS_UE5 = {
-    "minimum": {"CPU": 2, "RAM": 4, "Disk Space": 100, "GPU": False},
-    "recommended": {"CPU": 4, "RAM": 8, "Disk Space": 100, "GPU": True},
-}
-
-REQUIREMENTS_UE4 = {
-    "minimum": {"CPU": 2, "RAM": 4, "Disk Space": 50, "GPU": False},
-    "recommended": {"CPU": 4, "RAM": 8, "Disk Space": 50, "GPU": True},
-}
-
 INSTALL_PYTHON_VIDEO_WIN = "https://www.youtube.com/watch?v=cTwD_LC5F9A"
 INSTALL_PYTHON_VIDEO_MAC = "https://www.youtube.com/watch?v=YigK5HwxV3M"
 PYTHON_DOWNLOAD_LINK = "https://www.python.org/downloads/"
 
 loading_overlay = None
 loading_text = None
+loading_detail = None
+loading_canvas = None
+# after() id of the pending loading animation tick, cancelled on hide
+loading_animation = None
+task_runner = None
+# Running ResourceSampler when UE_CHECK_SAMPLE is set, else None
+sampler = None
+
+# Installers and checks run on a TaskRunner worker; their message boxes are
+# forwarded to the Tk thread.
+messagebox = MainThreadProxy(tk_messagebox, lambda: task_runner)
+
+LOADING_ANIMATION_MS = 400
+LOADING_DETAIL_LINES = 3
+LOADING_DETAIL_WIDTH = 90
 
 
 def show_loading_overlay(canvas: tk.Canvas, message="Loading..."):
-    global loading_overlay, loading_text
+    global loading_overlay, loading_text, loading_detail, loading_canvas
     canvas.update_idletasks()  # Ensure canvas size is correct
 
     width = canvas.winfo_width()
@@ -80,13 +89,94 @@ def show_loading_overlay(canvas: tk.Canvas, message="Loading..."):
         tags="loading",
     )
 
+    # Latest output lines of whatever is running, filled by show_loading_detail
+    loading_detail = canvas.create_text(
+        width // 2,
+        height - 20,
+        text="",
+        fill="white",
+        font=("Courier", 9),
+        anchor="s",
+        tags="loading",
+    )
+    loading_canvas = canvas
+
     canvas.update()
 
 
 def hide_loading_overlay(canvas: tk.Canvas):
+    global loading_animation
+    if loading_animation is not None:
+        canvas.after_cancel(loading_animation)
+        loading_animation = None
     canvas.delete("loading")
 
 
+def animate_loading_overlay(canvas: tk.Canvas, message, step=0, item=None):
+    """Cycle dots after the loading message until its overlay is hidden.
+
+    The loop keeps to the text item it started on, so it stops once that
+    overlay is gone rather than animating one shown later.
+    """
+    global loading_animation
+    item = loading_text if item is None else item
+    if item is None or item != loading_text or not canvas.find_withtag(item):
+        return
+    canvas.itemconfigure(item, text=message + "." * (step % 4))
+    loading_animation = canvas.after(
+        LOADING_ANIMATION_MS, animate_loading_overlay, canvas, message, step + 1, item
+    )
+
+
+def show_loading_detail(lines):
+    """Show the last few output lines under the loading message (Tk thread)."""
+    if loading_canvas is None or not loading_canvas.find_withtag(loading_detail):
+        return
+    shown = [line[:LOADING_DETAIL_WIDTH] for line in lines[-LOADING_DETAIL_LINES:]]
+    loading_canvas.itemconfigure(loading_detail, text="\n".join(shown))
+
+
+def report_progress(lines):
+    """Output callback for stream_command: forward lines to the overlay."""
+    if task_runner is None:
+        return
+    task_runner.post(show_loading_detail, lines)
+
+
+def run_on_ui(fn, *args):
+    """Call fn on the Tk thread, waiting for it when called from a worker."""
+    if task_runner is None:
+        return fn(*args)
+    return task_runner.call(fn, *args)
+
+
+def run_in_background(root, canvas, message, work, on_done=None):
+    """Run work() on the task runner while the window shows an animated overlay.
+
+    Buttons are disabled until the work finishes; on_done(result) is then
+    called on the Tk thread. Clicks while a task is running are ignored.
+    """
+    if task_runner.busy:
+        return
+
+    set_widgets_state(root, "disabled")
+    show_loading_overlay(canvas, message)
+    animate_loading_overlay(canvas, message.rstrip("."))
+
+    def finish(result):
+        hide_loading_overlay(canvas)
+        set_widgets_state(root, "normal")
+        if on_done:
+            on_done(result)
+
+    def fail(error):
+        hide_loading_overlay(canvas)
+        set_widgets_state(root, "normal")
+        messagebox.showerror("Something went wrong", f"{message.rstrip('.')} failed:\n\n{error}")
+
+    task_runner.submit(work, finish, fail)
+
+
 def set_widgets_state(parent: tk.Canvas, state):
     for widget in parent.winfo_children():
         try:
@@ -99,33 +189,44 @@ def find_vscode_executable():
     """
     Try to find VS Code. Returns an executable/command string or None.
     Checks: 'code' on PATH, common install locations, and Code.exe.
+    Results come from the tool discovery index, so repeat calls are cheap.
     """
-    # If 'code' is on PATH, that's perfect for scripting later
-    code_cmd = shutil.which("code")
-    if code_cmd:
-        return code_cmd
-
-    # Windows common paths
-    if os.name == "nt":
-        # User-scope installs
-        local = os.environ.get("LOCALAPPDATA")
-        if local:
-            user_code = os.path.join(local, "Programs", "Microsoft VS Code", "Code.exe")
-            if os.path.isfile(user_code):
-                return user_code
-
-        # System-scope installs
-        for base in (os.environ.get("PROGRAMFILES"), os.environ.get("PROGRAMFILES(X86)")):
-            if base:
-                sys_code = os.path.join(base, "Microsoft VS Code", "Code.exe")
-                if os.path.isfile(sys_code):
-                    return sys_code
-
-    return None
+    return discover("code")["code"].path
 
 def is_vscode_installed():
     return find_vscode_executable() is not None
 
+
+def path_folders():
+    return [folder for folder in os.environ.get("PATH", "").split(os.pathsep) if folder]
+
+
+def vscode_install_folders():
+    """Folders where a new VS Code install is expected to appear."""
+    return [os.path.dirname(location) for location in install_locations("code")] + path_folders()
+
+
+def python_install_folders():
+    """Folders where a new Python install is expected to appear."""
+    folders = path_folders()
+    local = os.environ.get("LOCALAPPDATA")
+    if local:
+        folders += [
+            os.path.join(local, "Programs", "Python"),
+            os.path.join(local, "Microsoft", "WindowsApps"),
+        ]
+    return folders
+
+
+def python_ready():
+    """Re-read PATH from the registry (Windows) and check for Python."""
+    if os.name == "nt":
+        try:
+            refresh_path_from_registry()
+        except OSError:
+            pass
+    return is_python_installed()
+
 def install_vscode_with_winget(scope="user"):
     """
     Install VS Code via Winget. Returns True on success.
@@ -156,12 +257,9 @@ def install_vscode_with_winget(scope="user"):
     #     ok, out = ok2, out2
 
     if ok:
-        
-        # Give PATH shims a moment to appear, then re-check
-        for _ in range(6):
-            time.sleep(2)
-            if is_vscode_installed():
-                return True
+        # Return as soon as VS Code shows up in its install folder or on PATH
+        if wait_for_tool(is_vscode_installed, vscode_install_folders()):
+            return True
 
     # Surface useful output on failure
     messagebox.showerror(
@@ -191,50 +289,63 @@ def ensure_vscode_available():
 def run_check_unreal_engine_compatibility(
     root, canvas, detail_button, detail_widget, test_mode=False
 ):
-    set_widgets_state(root, "disabled")
-    show_loading_overlay(canvas, "Checking system requirements...")
+    run_in_background(
+        root,
+        canvas,
+        "Checking system requirements...",
+        lambda: profiled_check(detail_button, detail_widget, test_mode),
+    )
 
-    check_unreal_engine_compatibility(detail_button, detail_widget, test_mode)
 
-    hide_loading_overlay(canvas)
-    set_widgets_state(root, "normal")
+def profiled_check(detail_button, detail_widget, test_mode=False):
+    """Run the check, writing a cProfile dump when UE_CHECK_PROFILE names a file."""
+    path = os.environ.get(timing.PROFILE_ENV)
+    if not path:
+        return check_unreal_engine_compatibility(detail_button, detail_widget, test_mode)
+    with timing.profile(path):
+        return check_unreal_engine_compatibility(detail_button, detail_widget, test_mode)
 
 
 def check_unreal_engine_compatibility(detail_button, detail_widget, test_mode=False):
     """Check system compatibility with Unreal Engine and display results."""
-    system_specs = check_system_specs()
+    if timing.enabled():
+        timing.enable()  # Only this check's spans are shown
+    system_specs = check_system_specs(sampler, benchmarks=bool(os.environ.get(BENCHMARK_ENV)))
     ue4_fallback = False
     detailed_info = "--- Current System Specs ---\n"
 
-    for spec, value in system_specs.items():
+    for spec, value in system_specs.display().items():
         detailed_info += f"{spec}: {value}\n"
 
     detailed_info += "\n--- Unreal Engine 5 Requirements ---\n"
     detailed_info += f"Minimum: {REQUIREMENTS_UE5['minimum']}\n"
     detailed_info += f"Recommended: {REQUIREMENTS_UE5['recommended']}\n"
 
-    validation_errors = validate_specs(system_specs, REQUIREMENTS_UE5["recommended"])
+    detailed_info += "\n--- Unreal Engine 4 Requirements ---\n"
+    detailed_info += f"Minimum: {REQUIREMENTS_UE4['minimum']}\n"
+    detailed_info += f"Recommended: {REQUIREMENTS_UE4['recommended']}\n"
+
+    tiers = evaluate_tiers(system_specs)
+    validation_errors = []
 
-    if not validation_errors:
+    if tiers.tier == "ue5_recommended":
         result = "Your system meets Unreal Engine 5 recommended requirements!"
+    elif tiers.tier == "ue5_minimum":
+        result = "Your system meets Unreal Engine 5 minimum requirements."
+    elif tiers.tier is not None:
+        result = "Your system can run Unreal Engine 4, but not Unreal Engine 5."
+        ue4_fallback = True
+        validation_errors = tiers.failures["ue5_minimum"]
     else:
-        validation_errors = validate_specs(system_specs, REQUIREMENTS_UE5["minimum"])
-        if not validation_errors:
-            result = "Your system meets Unreal Engine 5 minimum requirements."
-        else:
-            validation_errors_ue4 = validate_specs(
-                system_specs, REQUIREMENTS_UE4["minimum"]
-            )
-            if not validation_errors_ue4:
-                result = "Your system can run Unreal Engine 4, but not Unreal Engine 5."
-                ue4_fallback = True
-            else:
-                result = "Your system cannot run Unreal Engine 4 or 5."
-                validation_errors = validation_errors_ue4
+        result = "Your system cannot run Unreal Engine 4 or 5."
+        validation_errors = tiers.failures["ue4_minimum"]
 
     if test_mode:
         return result
 
+    # Only sends when a fleet collector is configured
+    send_report(build_report(system_specs, tiers))
+
     messagebox.showinfo("System Check Result", result)
 
     if validation_errors:
@@ -248,6 +359,10 @@ def check_unreal_engine_compatibility(detail_button, detail_widget, test_mode=Fa
             "Your system cannot run Unreal Engine 5, but it can run Unreal Engine 4.\n"
         )
 
+    detailed_info += "\n--- Tools ---\n"
+    for name, tool in survey_environment().items():
+        detailed_info += f"{name}: {tool.version or tool.path or 'not found'}\n"
+
     driver_message = check_driver_and_link_user()
     if driver_message:
         detailed_info += driver_message[1]
@@ -256,6 +371,13 @@ def check_unreal_engine_compatibility(detail_button, detail_widget, test_mode=Fa
         else:
             messagebox.showinfo("Driver Guidance", driver_message[0])
 
+    if timing.enabled():
+        detailed_info += timing.format_spans()
+
+    run_on_ui(show_detailed_info, detail_button, detail_widget, detailed_info)
+
+
+def show_detailed_info(detail_button, detail_widget, detailed_info):
     detail_widget.config(state=tk.NORMAL)
     detail_widget.delete(1.0, tk.END)
     detail_widget.insert(tk.INSERT, detailed_info)
@@ -273,65 +395,60 @@ def offer_vscode_extensions():
     if messagebox.askyesno("VS Code Extensions", "Install the Python extension for VS Code?"):
         try:
             # Works when 'code' CLI is available; if exe path is Code.exe, it also accepts '--install-extension'
-            subprocess.run([code_cli, "--install-extension", "ms-python.python"], check=True)
+            with timing.span("command code --install-extension"):
+                subprocess.run([code_cli, "--install-extension", "ms-python.python"], check=True)
             messagebox.showinfo("VS Code", "Python extension installed.")
         except subprocess.CalledProcessError:
             messagebox.showwarning("VS Code", "Could not install extension automatically.")
     
 
 def run_install_vscode(root, canvas):
-    set_widgets_state(root, "disabled")
-    show_loading_overlay(canvas, "Installing VSCode & Extensions...")
-    
-    exe = ensure_vscode_available()
-    if exe:
-        messagebox.showinfo("VS Code", "Visual Studio Code is installed and ready to use!")
-        #offer_vscode_extensions()
-        hide_loading_overlay(canvas)
-        set_widgets_state(root, "normal")
-        show_restart_screen(root, canvas, "VSCode")
-        return
+    def done(exe):
+        if exe:
+            messagebox.showinfo("VS Code", "Visual Studio Code is installed and ready to use!")
+            #offer_vscode_extensions()
+            show_restart_screen(root, canvas, "VSCode")
+            return
 
-    # Fallback for non-Windows or if Winget failed/unavailable
-    messagebox.showinfo(
-        "VS Code Not Installed",
-        "Automatic install is unavailable. Redirecting to the official download page..."
+        # Fallback for non-Windows or if Winget failed/unavailable
+        messagebox.showinfo(
+            "VS Code Not Installed",
+            "Automatic install is unavailable. Redirecting to the official download page..."
+        )
+        webbrowser.open("https://code.visualstudio.com/download")
+
+    run_in_background(
+        root, canvas, "Installing VSCode & Extensions...", ensure_vscode_available, done
     )
-    webbrowser.open("https://code.visualstudio.com/download")
-    
-    hide_loading_overlay(canvas)
-    set_widgets_state(root, "normal")
     
     
 
 
 
 def run_setup_ai_ml_environment(root, canvas):
-    if not is_python_installed():
-        messagebox.showinfo(
-            "Python Not Found",
-            "Python is not installed. Please install Python first. Redirecting to installation page...",
-        )
-        webbrowser.open(PYTHON_DOWNLOAD_LINK)
-        messagebox.showinfo(
-            "How to video", "Here is a short video on how to install Python."
-        )
-        if os.name == "nt":
-            webbrowser.open(INSTALL_PYTHON_VIDEO_WIN)
-        else:
-            webbrowser.open(INSTALL_PYTHON_VIDEO_MAC)
-        messagebox.showinfo(
-            "Re-try", "Click this button again after installing Python."
-        )
-        return
-    
-    set_widgets_state(root, "disabled")
-    show_loading_overlay(canvas, "Setting up AI environment...")
+    def work():
+        survey_environment()
+        if not is_python_installed():
+            messagebox.showinfo(
+                "Python Not Found",
+                "Python is not installed. Please install Python first. Redirecting to installation page...",
+            )
+            webbrowser.open(PYTHON_DOWNLOAD_LINK)
+            messagebox.showinfo(
+                "How to video", "Here is a short video on how to install Python."
+            )
+            if os.name == "nt":
+                webbrowser.open(INSTALL_PYTHON_VIDEO_WIN)
+            else:
+                webbrowser.open(INSTALL_PYTHON_VIDEO_MAC)
+            messagebox.showinfo(
+                "Re-try", "Click this button again after installing Python."
+            )
+            return
 
-    setup_ai_ml_environment()
-    
-    hide_loading_overlay(canvas)
-    set_widgets_state(root, "normal")
+        setup_ai_ml_environment()
+
+    run_in_background(root, canvas, "Setting up AI environment...", work)
     
 
 
@@ -349,27 +466,6 @@ def setup_ai_ml_environment():
         if not proceed:
             return
 
-    # Step 2: Create virtual environment
-    try:
-        subprocess.run(["python", "-m", "venv", "venv"], check=True)
-    except subprocess.CalledProcessError:
-        try:
-            subprocess.run(["python3", "-m", "venv", "venv"], check=True)
-        except subprocess.CalledProcessError:
-            messagebox.showerror(
-                "Error",
-                "Failed to create virtual environment.\nMake sure Python 3 is installed and available in PATH.",
-            )
-            return
-
-    # Step 3: Activate and install requirements
-    # NOTE: Activation is usually for terminal environments; here we just install using the correct pip
-    pip_executable = (
-        os.path.join("venv", "Scripts", "pip.exe")
-        if os.name == "nt"
-        else os.path.join("venv", "bin", "pip")
-    )
-
     if not os.path.isfile("ai_requirements.txt"):
         messagebox.showerror(
             "Missing File",
@@ -377,40 +473,72 @@ def setup_ai_ml_environment():
         )
         return
 
-    try:
-        subprocess.run(
-            [pip_executable, "install", "-r", "ai_requirements.txt"], check=True
+    # Step 2: Create the virtual environment with the requirements installed
+    # NOTE: Activation is usually for terminal environments; here we just install using the venv's Python
+    if os.path.isdir("venv"):
+        # Keep an existing environment and only install what it is missing,
+        # through the wheelhouse, streamed so the overlay shows pip's progress
+        result = ensure_requirements_file(
+            venv_python("venv"), "ai_requirements.txt", "venv", report_progress
         )
+        if result.ok and result.output == UP_TO_DATE:
+            messagebox.showinfo(
+                "Success", "Environment is already set up and up to date."
+            )
+            return
+    else:
+        # A fresh environment is cloned from a cached template built once per
+        # interpreter and requirements file, which takes seconds
+        for python_cmd in ("python", "python3"):
+            result = provision_environment(
+                python_cmd, "venv", "ai_requirements.txt", report_progress
+            )
+            if result.returncode is not None or result.timed_out:
+                break
+        else:
+            messagebox.showerror(
+                "Error",
+                "Failed to create virtual environment.\nMake sure Python 3 is installed and available in PATH.",
+            )
+            return
+
+    if result.ok:
         messagebox.showinfo(
             "Success", "Environment setup complete and requirements installed."
         )
-    except subprocess.CalledProcessError:
+    else:
         messagebox.showerror(
-            "Installation Error", "Failed to install packages from ai_requirements.txt."
+            "Installation Error",
+            "Failed to install packages from ai_requirements.txt.\n\n"
+            "Output:\n" + (result.output[-1200:] or result.error or "No output."),
         )
-        
-        
-def show_restart_screen(root, canvas, package):
-    set_widgets_state(root, "disabled")
-    r = range(5)
-    for i in r:
-        show_loading_overlay(canvas, f"{package} installed, closing in.. {len(r) - i}\nRe-open to continue")
-        time.sleep(1)
-    sys.exit()
-    
-    
 
 
-def run_install_python_and_pygame(root, canvas):
+def show_restart_screen(root, canvas, package, seconds=5):
     set_widgets_state(root, "disabled")
-    show_loading_overlay(canvas, "Setting up Python...")
 
-    install_python_and_pygame()
+    # Counted down with after() so the window keeps repainting
+    def countdown(remaining):
+        if remaining == 0:
+            root.destroy()
+            sys.exit()
+        hide_loading_overlay(canvas)
+        show_loading_overlay(canvas, f"{package} installed, closing in.. {remaining}\nRe-open to continue")
+        root.after(1000, countdown, remaining - 1)
 
-    hide_loading_overlay(canvas)
-    set_widgets_state(root, "normal")
+    countdown(seconds)
+    
     
-    show_restart_screen(root, canvas, "Python")
+
+
+def run_install_python_and_pygame(root, canvas):
+    run_in_background(
+        root,
+        canvas,
+        "Setting up Python...",
+        install_python_and_pygame,
+        lambda _result: show_restart_screen(root, canvas, "Python"),
+    )
     
     # if messagebox.askyesno("VSCode", "Would you like to install Visual Studio Code as well?"):
     #     install_vscode_with_winget()
@@ -419,6 +547,7 @@ def run_install_python_and_pygame(root, canvas):
 
 def install_python_and_pygame():
     """Check Python installation and install PyGame."""
+    survey_environment()
     if not is_python_installed():
         install_python_with_winget()
 
@@ -444,45 +573,40 @@ def install_python_and_pygame():
 
 def is_python_installed():
     """Check if Python is installed on the system."""
-    try:
-        subprocess.run(
-            ["python", "--version"],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        return True
-    except Exception:
-        try:
-            subprocess.run(
-                ["python3", "--version"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            return True
-        except Exception:
-            return False     
-        
- 
-def _run(cmd):
+    # Answered from the tool discovery index; python and python3 are only
+    # re-probed (concurrently) when PATH or the interpreter changed.
+    return any(tool.ok for tool in discover("python", "python3").values())
+
+
+def survey_environment():
+    """Look up python, python3, winget and VS Code in one round.
+
+    Returns a dict of tool name -> ToolInfo. Stale entries are probed
+    concurrently, so this takes about as long as the slowest single probe.
+    The setup flows call it first, so their later tool checks are answered
+    from the index instead of each probing in turn.
+    """
+    return discover("python", "python3", "winget", "code")
+
+
+def _run(cmd, timeout=INSTALL_TIMEOUT):
     """Run a command, return (ok, stdout+stderr)."""
-    try:
-        cp = subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-        return cp.returncode == 0, (cp.stdout or "")
-    except Exception as e:
-        return False, str(e)  
+    result = stream_command(cmd, report_progress, timeout)
+    if result.error:
+        return False, result.error
+    return result.ok, result.output
 
 
 def is_winget_available():
     if os.name != "nt":
         return False
-    ok, _out = _run(["winget", "--version"])
-    return ok
+    return discover("winget")["winget"].ok
 
 
 def refresh_path_from_registry():
     """Pull latest PATH from Windows registry into current process env."""
+    import winreg  # Windows only
+
     paths = []
 
     # Machine-wide PATH
@@ -508,6 +632,8 @@ def refresh_path_from_registry():
 
 def broadcast_env_change():
     """Notify Windows that environment variables have changed."""
+    import ctypes
+
     HWND_BROADCAST = 0xFFFF
     WM_SETTINGCHANGE = 0x001A
     SMTO_ABORTIFHUNG = 0x0002
@@ -571,19 +697,16 @@ def install_python_with_winget(package_id="Python.Python.3.12", retries=1):
     # Give the system a moment to update PATH/registry shims
     if ok:
         refresh_windows_path()
-        for _ in range(6):
-            time.sleep(2)
-            if is_python_installed():
-                return True
-            
+        if wait_for_tool(python_ready, python_install_folders()):
+            return True
+
         # Python may be installed but PATH not updated, restarting app seems to fix
         messagebox.showinfo(
                 "Restart Required",
                 "Python was installed, but Windows hasn't exposed it to this session yet.\n\n"
                 "Please restart this tool and select the same button continue."
             )
-        quit() # Closes window without return, leaves loading screen to hang forever
-        sys.exit()
+        sys.exit()  # The task runner closes the window
     
 
     # If it still failed, surface output to help users
@@ -595,11 +718,13 @@ def install_python_with_winget(package_id="Python.Python.3.12", retries=1):
 
 def install_pygame():
     """Install PyGame using pip."""
-    try:
-        python_exec = "python" if getattr(sys, "frozen", False) else sys.executable
-        subprocess.run([python_exec, "-m", "pip", "install", "pygame"], check=True)
+    python_exec = "python" if getattr(sys, "frozen", False) else sys.executable
+    result = ensure_requirements(python_exec, ["pygame"], report_progress)
+    if result.ok and result.output == UP_TO_DATE:
+        messagebox.showinfo("PyGame Installation", "PyGame is already installed.")
+    elif result.ok:
         messagebox.showinfo("PyGame Installation", "PyGame installed successfully!")
-    except subprocess.CalledProcessError:
+    else:
         messagebox.showerror(
             "Installation Failed", "Failed to install PyGame. Try manually."
         )
@@ -653,8 +778,20 @@ def create_multiline_button(
 
 def create_gui():
     """Create the main GUI window."""
+    global task_runner, sampler
+    # Image and font support are only needed once the window is built
+    from PIL import Image, ImageTk
+    from tkextrafont import Font
+
     root = tk.Tk()
     root.title("Software Academy - System Checker & Python Installer")
+    task_runner = TaskRunner(root)
+    root.protocol("WM_DELETE_WINDOW", task_runner.close)
+    if os.environ.get(SAMPLE_ENV):
+        # Sampled for as long as the window is open, so a check sees real headroom
+        sampler = ResourceSampler().start()
+    if os.environ.get(timing.TIMING_ENV):
+        timing.enable()
 
     favicon = ImageTk.PhotoImage(
         Image.open(resource_path("images/favicon.ico")).resize(
@@ -759,4 +896,6 @@ def create_gui():
 
 
 if __name__ == "__main__":
+    # Lets the CPU benchmark's worker processes start in a PyInstaller build
+    multiprocessing.freeze_support()
     create_gui()
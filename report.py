@@ -0,0 +1,46 @@
+import json
+import os
+import platform
+import time
+
+# Set to the collector's URL (e.g. http://lab-server:8765/reports) to send
+# every check result to a fleet collector.
+COLLECTOR_URL_ENV = "UE_CHECK_COLLECTOR"
+SEND_TIMEOUT = 2
+
+
+def build_report(specs, tiers):
+    """Build the JSON-friendly report for one compatibility check."""
+    return {
+        "host": platform.node(),
+        "timestamp": time.time(),
+        "tier": tiers.tier,
+        "failures": tiers.failures,
+        "specs": specs.as_dict(),
+    }
+
+
+def send_report(report, url=None, timeout=SEND_TIMEOUT):
+    """POST a report to the fleet collector.
+
+    Uses `url`, or the UE_CHECK_COLLECTOR environment variable when no URL
+    is given. Returns True if the collector accepted the report and False if
+    no collector is configured or it could not be reached.
+    """
+    url = url or os.environ.get(COLLECTOR_URL_ENV)
+    if not url:
+        return False
+
+    import urllib.request  # Only loaded when a collector is configured
+
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(report).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return 200 <= response.status < 300
+    except (OSError, ValueError):
+        return False
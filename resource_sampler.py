@@ -0,0 +1,155 @@
+import collections
+import math
+import threading
+import time
+
+import psutil
+
+SAMPLE_INTERVAL = 0.5  # Seconds between samples
+MAX_SAMPLE_INTERVAL = 10.0  # Slowest rate the sampler backs off to
+SAMPLE_WINDOW = 240  # Samples kept in the ring buffer (2 minutes at the default rate)
+GPU_SAMPLE_EVERY = 10  # GPU load needs nvidia-smi, so it is read every Nth sample
+# Share of one CPU core the sampler may use, counting the nvidia-smi runs.
+# When it goes over, the sampling interval doubles.
+OVERHEAD_BUDGET = 0.01
+# Headroom is reported as the free capacity available at least this share
+# of the time, i.e. the 10th percentile of free CPU, RAM and GPU.
+HEADROOM_PERCENTILE = 10
+SWAP_PERCENTILE = 90
+
+# Set to 1 to sample in the background for as long as the GUI is open
+SAMPLE_ENV = "UE_CHECK_SAMPLE"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values`, or None for no values."""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+def _gpu_free_percent():
+    import GPUtil  # Loaded on first use, as in system_check
+
+    gpus = GPUtil.getGPUs()
+    if not gpus:
+        return None
+    gpu = max(gpus, key=lambda g: getattr(g, "memoryTotal", 0) or 0)
+    return (1 - gpu.load) * 100
+
+
+class ResourceSampler:
+    """Record CPU, memory, swap and GPU usage in the background.
+
+    Opt-in: nothing is sampled until start(). Each sample is
+    (time, free CPU %, available RAM bytes, swap bytes/s, free GPU %) and
+    only the last `window` samples are kept. The sampler measures its own
+    cost and slows down to stay within `overhead_budget` of one core.
+    """
+
+    def __init__(
+        self,
+        interval=SAMPLE_INTERVAL,
+        window=SAMPLE_WINDOW,
+        gpu_every=GPU_SAMPLE_EVERY,
+        overhead_budget=OVERHEAD_BUDGET,
+    ):
+        self.interval = interval
+        self.gpu_every = gpu_every
+        self.overhead_budget = overhead_budget
+        self.samples = collections.deque(maxlen=window)
+        self._cost = 0.0
+        self._started = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._gpu_free = None
+        self._swap = None
+        self._swap_at = None
+
+    @property
+    def overhead(self):
+        """Share of one core used by sampling so far."""
+        if self._started is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started
+        return self._cost / elapsed if elapsed > 0 else 0.0
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        psutil.cpu_percent(interval=None)  # The first reading only sets the baseline
+        self._swap = self._swap_total()
+        self._swap_at = time.monotonic()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _swap_total(self):
+        swap = psutil.swap_memory()
+        return swap.sin + swap.sout
+
+    def sample(self, read_gpu=False):
+        """Take one sample now and add it to the ring buffer."""
+        cpu_started = time.thread_time()
+        wall_started = time.monotonic()
+
+        now = time.monotonic()
+        swap = self._swap_total()
+        swap_rate = 0.0
+        if self._swap is not None and now > self._swap_at:
+            swap_rate = (swap - self._swap) / (now - self._swap_at)
+        self._swap, self._swap_at = swap, now
+
+        gpu_cost = 0.0
+        if read_gpu:
+            try:
+                self._gpu_free = _gpu_free_percent()
+            except Exception:
+                self._gpu_free = None
+            # nvidia-smi runs in its own process, so count its wall time
+            gpu_cost = time.monotonic() - wall_started
+
+        self.samples.append(
+            (
+                now,
+                100.0 - psutil.cpu_percent(interval=None),
+                psutil.virtual_memory().available,
+                swap_rate,
+                self._gpu_free,
+            )
+        )
+        self._cost += time.thread_time() - cpu_started + gpu_cost
+
+    def _run(self):
+        count = 0
+        while not self._stop.wait(self.interval):
+            self.sample(read_gpu=self.gpu_every and count % self.gpu_every == 0)
+            count += 1
+            if self.overhead > self.overhead_budget:
+                self.interval = min(self.interval * 2, MAX_SAMPLE_INTERVAL)
+
+    def headroom(self):
+        """Free capacity over the sampling window, as SystemSpecs fields.
+
+        Values are None until there are samples (or, for the GPU, when no
+        GPU load could be read).
+        """
+        samples = list(self.samples)
+        cpu_free = percentile([s[1] for s in samples], HEADROOM_PERCENTILE)
+        cores = psutil.cpu_count(logical=True) or 1
+        ram = percentile([s[2] for s in samples], HEADROOM_PERCENTILE)
+        return {
+            "cpu_headroom_cores": None if cpu_free is None else round(cpu_free / 100 * cores, 2),
+            "ram_headroom_bytes": ram,
+            "swap_bytes_per_sec": percentile([s[3] for s in samples], SWAP_PERCENTILE),
+            "gpu_headroom_percent": percentile([s[4] for s in samples], HEADROOM_PERCENTILE),
+        }
@@ -0,0 +1,227 @@
+from dataclasses import asdict, dataclass, field
+
+GIB = 1024**3
+UNAVAILABLE = "Unavailable"
+# Disk speed classes from system_check.disk_benchmark, slowest first
+DISK_CLASSES = ("HDD", "SATA SSD", "NVMe")
+
+
+@dataclass(frozen=True, slots=True)
+class GPU:
+    """A single graphics adapter as reported by the GPU probe.
+
+    vram_bytes, vendor and driver_up_to_date are None when unknown.
+    """
+
+    name: str
+    driver: str
+    vram_bytes: int | None = None
+    vendor: str | None = None
+    driver_up_to_date: bool | None = None
+
+
+def best_gpu(gpus):
+    """The adapter to judge the machine by: most VRAM, then an up to date driver.
+
+    Returns None for no adapters. Ties keep enumeration order.
+    """
+    return max(
+        gpus,
+        key=lambda gpu: (gpu.vram_bytes or 0, bool(gpu.driver_up_to_date)),
+        default=None,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Volume:
+    """A mounted disk volume and its space, as reported by the disk probe."""
+
+    mountpoint: str
+    fstype: str
+    free_bytes: int
+    total_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class SystemSpecs:
+    """Raw hardware figures gathered by system_check.check_system_specs.
+
+    Numbers are kept as numbers (cores, bytes) so validation can compare them
+    directly; display() renders the text shown in the GUI. A field is None when
+    its probe timed out or failed, and probe_errors says which and why.
+    disk_free_bytes is the free space on install_volume, the volume best
+    suited for installing Unreal Engine out of all mounted `volumes`.
+    """
+
+    cpu_name: str = ""
+    cpu_cores: int | None = None
+    # Kernel rounds per second from system_check.cpu_benchmark
+    cpu_single_score: float | None = None
+    cpu_multi_score: float | None = None
+    cpu_scaling: float | None = None
+    ram_bytes: int | None = None
+    # From system_check.memory_benchmark; None without NumPy
+    mem_copy_gbps: float | None = None
+    mem_triad_gbps: float | None = None
+    mem_latency_ns: float | None = None
+    disk_free_bytes: int | None = None
+    install_volume: str = ""
+    # From system_check.disk_benchmark on install_volume
+    disk_read_mbps: float | None = None
+    disk_write_mbps: float | None = None
+    disk_random_iops: float | None = None
+    disk_class: str = ""
+    volumes: tuple = ()
+    os_name: str = ""
+    gpus: tuple = ()
+    gpu_status: str = ""
+    # Free capacity measured over time by resource_sampler; None unless sampled
+    cpu_headroom_cores: float | None = None
+    ram_headroom_bytes: int | None = None
+    gpu_headroom_percent: float | None = None
+    swap_bytes_per_sec: float | None = None
+    probe_errors: dict = field(default_factory=dict)
+
+    @property
+    def has_gpu(self):
+        return bool(self.gpus)
+
+    @property
+    def best_gpu(self):
+        return best_gpu(self.gpus)
+
+    @property
+    def disk_class_level(self):
+        """Index of disk_class in DISK_CLASSES, None if not measured."""
+        if self.disk_class not in DISK_CLASSES:
+            return None
+        return DISK_CLASSES.index(self.disk_class)
+
+    def as_dict(self):
+        """Return the raw figures as plain JSON-friendly data."""
+        data = asdict(self)
+        data["gpus"] = [asdict(gpu) for gpu in self.gpus]
+        data["volumes"] = [asdict(volume) for volume in self.volumes]
+        data["has_gpu"] = self.has_gpu
+        data["disk_class_level"] = self.disk_class_level
+        return data
+
+    def display(self):
+        """Render the specs as the label -> text mapping shown to the user."""
+        errors = self.probe_errors
+
+        if self.cpu_cores is None:
+            cpu = errors.get("CPU", UNAVAILABLE)
+        else:
+            cpu = f"{self.cpu_name} ({self.cpu_cores} cores)"
+
+        if self.ram_bytes is None:
+            ram = errors.get("RAM", UNAVAILABLE)
+        else:
+            ram = f"{round(self.ram_bytes / GIB, 2)} GB"
+
+        if self.disk_free_bytes is None:
+            disk = errors.get("Disk Space", UNAVAILABLE)
+        else:
+            disk = f"{round(self.disk_free_bytes / GIB, 2)} GB free"
+            if self.install_volume:
+                disk += f" on {self.install_volume}"
+
+        if "GPU" in errors:
+            gpu = errors["GPU"]
+        elif self.gpus:
+            best = self.best_gpu
+            gpu = f"Dedicated GPU found: {best.name} (Driver version: {best.driver})"
+            if len(self.gpus) > 1:
+                gpu += f" (+{len(self.gpus) - 1} more)"
+        else:
+            gpu = self.gpu_status or "No dedicated GPU found"
+
+        shown = {
+            "CPU": cpu,
+            "RAM": ram,
+            "Disk Space": disk,
+            "OS": errors.get("OS", self.os_name),
+            "GPU": gpu,
+        }
+        if self.cpu_single_score is not None:
+            benchmark = f"single-core {round(self.cpu_single_score)}"
+            if self.cpu_multi_score is not None:
+                benchmark += (
+                    f", all cores {round(self.cpu_multi_score)}"
+                    f" ({round(self.cpu_scaling * 100)}% scaling)"
+                )
+            shown["CPU Benchmark"] = benchmark
+        elif "CPU Benchmark" in errors:
+            shown["CPU Benchmark"] = errors["CPU Benchmark"]
+        if self.disk_read_mbps is not None:
+            # No class when the reads could not bypass the OS cache
+            disk_class = self.disk_class or "Unknown"
+            shown["Disk Benchmark"] = (
+                f"{disk_class} class: read {round(self.disk_read_mbps)} MB/s, "
+                f"write {round(self.disk_write_mbps)} MB/s, "
+                f"{round(self.disk_random_iops)} random reads/s"
+            )
+        elif "Disk Benchmark" in errors:
+            shown["Disk Benchmark"] = errors["Disk Benchmark"]
+        if self.mem_triad_gbps is not None:
+            shown["Memory Benchmark"] = (
+                f"copy {round(self.mem_copy_gbps, 1)} GB/s, "
+                f"triad {round(self.mem_triad_gbps, 1)} GB/s, "
+                f"latency {round(self.mem_latency_ns)} ns"
+            )
+        elif "Memory Benchmark" in errors:
+            shown["Memory Benchmark"] = errors["Memory Benchmark"]
+        if self.ram_headroom_bytes is not None:
+            headroom = (
+                f"{self.cpu_headroom_cores} cores, "
+                f"{round(self.ram_headroom_bytes / GIB, 2)} GB RAM free"
+            )
+            if self.gpu_headroom_percent is not None:
+                headroom += f", GPU {round(self.gpu_headroom_percent)}% idle"
+            shown["Headroom"] = headroom
+        return shown
+
+    @classmethod
+    def from_display(cls, specs):
+        """Build a record from the older label -> text mapping.
+
+        Kept for callers and tests that still pass dictionaries of display
+        strings such as {"CPU": "4 cores", "RAM": "8 GB", ...}.
+        """
+        cpu_text = specs.get("CPU", "")
+        try:
+            if "(" in cpu_text:
+                # Handle cases like "Intel(R) Core(TM) i7-8565U CPU @ 1.80GHz (4 cores)"
+                cpu_cores = int(cpu_text.split("(")[-1].split(" ")[0])
+            else:
+                cpu_cores = int(cpu_text.split(" ")[0])  # Handle simpler case
+        except (ValueError, IndexError):
+            cpu_cores = None
+
+        gpu_text = specs.get("GPU", "")
+        gpus = () if "No dedicated GPU" in gpu_text else (GPU(gpu_text, ""),)
+
+        return cls(
+            cpu_name=cpu_text.rsplit(" (", 1)[0] if "(" in cpu_text else "",
+            cpu_cores=cpu_cores,
+            ram_bytes=_parse_gb(specs.get("RAM", "")),
+            disk_free_bytes=_parse_gb(specs.get("Disk Space", "")),
+            os_name=specs.get("OS", ""),
+            gpus=gpus,
+            gpu_status=gpu_text,
+        )
+
+
+def _parse_gb(text):
+    try:
+        return int(float(text.split(" ")[0]) * GIB)
+    except (ValueError, IndexError):
+        return None
+
+
+def as_system_specs(specs):
+    """Accept either a SystemSpecs record or an older display dictionary."""
+    if isinstance(specs, SystemSpecs):
+        return specs
+    return SystemSpecs.from_display(specs)
@@ -1,107 +1,816 @@
+import os
 import psutil
 import platform
 import shutil
-import GPUtil
-import webbrowser
-
-# Define the minimum required driver versions for Unreal Engine
-MINIMUM_DRIVER_VERSION_NVIDIA = "456.38"
-MINIMUM_DRIVER_VERSION_AMD = "20.10.1"
-MINIMUM_DRIVER_VERSION_INTEL = "27.20.100.8587"
-
-# Define driver download links
-DRIVER_DOWNLOAD_LINKS = {
-    "NVIDIA": "https://www.nvidia.com/Download/index.aspx",
-    "AMD": "https://www.amd.com/en/support",
-    "Intel": "https://www.intel.com/content/www/us/en/download-center/home.html",
-}
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import timing
+from driver_rules import check_driver
+from specs import GPU, SystemSpecs, Volume, UNAVAILABLE, best_gpu
+
+# How long a GPU snapshot is reused before nvidia-smi is run again, in seconds
+GPU_CACHE_TTL = 300
+# How long callers wait for one GPU enumeration, counted from its start
+GPU_TIMEOUT = 15
+
+_gpu_cache = {"gpus": None, "taken_at": 0.0, "pending": None, "started_at": 0.0}
+_gpu_cache_lock = threading.Lock()
+
+
+def _enumerate_gpus():
+    with timing.span("import GPUtil"):
+        import GPUtil  # Loaded on first use; it is only needed for the GPU probe
+
+    with timing.span("GPUtil.getGPUs"):
+        return GPUtil.getGPUs()
+
+
+def _gpu_enumeration_done(future):
+    with _gpu_cache_lock:
+        if _gpu_cache["pending"] is not future:
+            return  # Cleared while it ran
+        _gpu_cache["pending"] = None
+        if future.exception() is None:
+            _gpu_cache["gpus"] = future.result()
+            _gpu_cache["taken_at"] = time.monotonic()
+
+
+def get_gpus(ttl=None, timeout=None):
+    """Return the installed GPUs from a shared snapshot.
+
+    GPUtil.getGPUs() starts an nvidia-smi process, so the result is kept for
+    `ttl` seconds (GPU_CACHE_TTL by default) and shared by every caller.
+    The enumeration runs on its own daemon thread; callers arriving while it
+    runs wait for it instead of starting a second one, but never longer than
+    `timeout` seconds (GPU_TIMEOUT by default) after it started. A hung
+    nvidia-smi therefore raises TimeoutError for every caller instead of
+    blocking them. Failed enumerations are not cached.
+    """
+    ttl = GPU_CACHE_TTL if ttl is None else ttl
+    timeout = GPU_TIMEOUT if timeout is None else timeout
+    with _gpu_cache_lock:
+        gpus = _gpu_cache["gpus"]
+        if gpus is not None and time.monotonic() - _gpu_cache["taken_at"] < ttl:
+            return gpus
+        future = _gpu_cache["pending"]
+        started = future is None
+        if started:
+            future = _start_probe(_enumerate_gpus, "GPU enumeration")
+            _gpu_cache["pending"] = future
+            _gpu_cache["started_at"] = time.monotonic()
+        deadline = _gpu_cache["started_at"] + timeout
+
+    if started:
+        # Added outside the lock: a finished future runs the callback at once
+        future.add_done_callback(_gpu_enumeration_done)
+    return future.result(timeout=max(0, deadline - time.monotonic()))
+
+
+def clear_gpu_cache():
+    """Forget the GPU snapshot so the next check enumerates again."""
+    with _gpu_cache_lock:
+        _gpu_cache["gpus"] = None
+        _gpu_cache["taken_at"] = 0.0
+        _gpu_cache["pending"] = None
+
+
+def describe_gpus(gpus):
+    """GPU records for every adapter of one enumeration, drivers checked in one pass.
+
+    GPUtil reports memoryTotal in MB.
+    """
+    records = []
+    for gpu in gpus:
+        verdict = check_driver(gpu.name, gpu.driver)
+        memory = getattr(gpu, "memoryTotal", None)
+        records.append(
+            GPU(
+                gpu.name,
+                gpu.driver,
+                vram_bytes=int(memory * 1024**2) if isinstance(memory, (int, float)) else None,
+                vendor=verdict.vendor,
+                driver_up_to_date=verdict.up_to_date,
+            )
+        )
+    return tuple(records)
 
 
 def check_gpu():
     """Check if a dedicated GPU is present and provide driver status."""
     try:
-        gpus = GPUtil.getGPUs()
+        gpus = describe_gpus(get_gpus())
         if not gpus:
             return "No dedicated GPU found"
 
-        # Check the GPU driver
-        gpu_name = gpus[0].name
-        driver_version = gpus[0].driver
-        return f"Dedicated GPU found: {gpu_name} (Driver version: {driver_version})"
+        # Check the GPU driver of the best adapter
+        best = best_gpu(gpus)
+        return f"Dedicated GPU found: {best.name} (Driver version: {best.driver})"
     except Exception:
         return "Error retrieving GPU information. Ensure the drivers are installed."
 
 
 def get_gpu_info():
-    gpus = GPUtil.getGPUs()
-    if gpus:
-        return {"name": gpus[0].name, "driver_version": gpus[0].driver}
+    best = best_gpu(describe_gpus(get_gpus()))
+    if best:
+        return {"name": best.name, "driver_version": best.driver}
     return None
 
 
 def is_driver_up_to_date(gpu_name, driver_version):
-    if "NVIDIA" in gpu_name:
-        return driver_version >= MINIMUM_DRIVER_VERSION_NVIDIA, DRIVER_DOWNLOAD_LINKS[
-            "NVIDIA"
-        ]
-    elif "AMD" in gpu_name:
-        return driver_version >= MINIMUM_DRIVER_VERSION_AMD, DRIVER_DOWNLOAD_LINKS[
-            "AMD"
-        ]
-    elif "Intel" in gpu_name:
-        return driver_version >= MINIMUM_DRIVER_VERSION_INTEL, DRIVER_DOWNLOAD_LINKS[
-            "Intel"
-        ]
-    return False, None
+    """(up to date?, download link) for a GPU, judged by driver_rules.json."""
+    verdict = check_driver(gpu_name, driver_version)
+    return verdict.up_to_date, verdict.download
 
 
+@timing.timed("driver check")
 def check_driver_and_link_user():
     driver_details = "\n--- Driver information ---\n"
-    gpu_info = get_gpu_info()
-    if gpu_info:
-        is_up_to_date, download_link = is_driver_up_to_date(
-            gpu_info["name"], gpu_info["driver_version"]
+    try:
+        gpus = describe_gpus(get_gpus())
+    except FutureTimeoutError:
+        # nvidia-smi did not answer; the GPU probe already reports it
+        print("GPU enumeration timed out.")
+        return None
+    if not gpus:
+        print("No GPU detected.")
+        return None
+
+    outdated = [gpu for gpu in gpus if not gpu.driver_up_to_date]
+    for gpu in gpus:
+        if len(gpus) > 1:
+            status = "up to date" if gpu.driver_up_to_date else "outdated"
+            driver_details += f"{gpu.name}: driver {gpu.driver} ({status})\n"
+        else:
+            driver_details += f"Current driver verison: {gpu.driver}\n"
+
+    if not outdated:
+        names = " and ".join(gpu.name for gpu in gpus)
+        return (
+            f"Your {names} driver is up to date for Unreal Engine.",
+            driver_details,
         )
-        driver_details += f"Current driver verison: {gpu_info['driver_version']}\n"
-        if is_up_to_date:
-            return (
-                f"Your {gpu_info['name']} driver is up to date for Unreal Engine.",
-                driver_details,
-            )
+
+    import webbrowser
+
+    # One download page per vendor, even with several outdated adapters
+    for link in dict.fromkeys(is_driver_up_to_date(gpu.name, gpu.driver)[1] for gpu in outdated):
+        if link:
+            webbrowser.open(link)
+    names = " and ".join(gpu.name for gpu in outdated)
+    return (
+        f"Your {names} driver is outdated. Please update it.",
+        driver_details,
+    )
+
+
+# Per-probe timeouts in seconds. The GPU probe starts nvidia-smi, so it gets
+# the most slack; everything else should answer almost instantly.
+PROBE_TIMEOUTS = {
+    "CPU": 5,
+    "RAM": 5,
+    "Disk Space": 10,
+    "OS": 5,
+    "GPU": 15,
+    "CPU Benchmark": 10,
+    "Memory Benchmark": 10,
+    "Disk Benchmark": 10,
+}
+DEFAULT_PROBE_TIMEOUT = 10
+PROBE_TIMED_OUT = "Timed out"
+PROBE_FAILED = UNAVAILABLE
+
+
+def probe_cpu():
+    return {
+        "cpu_name": platform.processor(),
+        "cpu_cores": psutil.cpu_count(logical=False),  # Physical cores
+    }
+
+
+# CPU benchmark: a fixed integer kernel run for a share of CPU_BENCHMARK_BUDGET
+# seconds, first on one core and then on every core at once.
+CPU_BENCHMARK_BUDGET = 3.0
+CPU_BENCHMARK_ROUND = 10_000  # Kernel iterations per scored round
+
+
+def _cpu_kernel(iterations=CPU_BENCHMARK_ROUND):
+    x = 0
+    for i in range(iterations):
+        x = (x * 31 + i) & 0xFFFFFFFF
+    return x
+
+
+# Set in each pool worker by _set_ready_barrier
+_ready_barrier = None
+
+
+def _set_ready_barrier(barrier):
+    global _ready_barrier
+    _ready_barrier = barrier
+
+
+def _worker_ready(timeout):
+    """No-op task that returns once every pool worker has picked one up."""
+    _ready_barrier.wait(timeout)
+
+
+def _cpu_rounds(start_at, end_at):
+    """Run kernel rounds between two wall-clock times; (rounds, seconds) actually run.
+
+    Pool workers wait for `start_at` so they all run side by side, whatever
+    their start-up time was.
+    """
+    time.sleep(max(0.0, start_at - time.time()))
+    started = time.time()
+    rounds = 0
+    while time.time() < end_at:
+        _cpu_kernel()
+        rounds += 1
+    return rounds, time.time() - started
+
+
+def cpu_benchmark(budget=None, workers=None):
+    """Single-core and all-core CPU scores, in kernel rounds per second.
+
+    A process pool with one worker per logical core (or `workers`) is
+    started first, and every worker has run a no-op task before any timing
+    starts. One worker then runs the kernel for under half of `budget`
+    (CPU_BENCHMARK_BUDGET by default), and afterwards all of them run it at
+    once. The kernel never runs in this process, so it does not compete for
+    the GIL with the other probes. Scaling is the multi-core score over the
+    single score times the workers, 1.0 meaning perfect scaling. If no
+    process pool can be started, the single score is measured in this
+    process and the multi-core figures are None.
+    """
+    budget = CPU_BENCHMARK_BUDGET if budget is None else budget
+    workers = workers or psutil.cpu_count(logical=True) or 1
+    result = {"cpu_single_score": None, "cpu_multi_score": None, "cpu_scaling": None}
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawned rather than forked: the other probes are running on threads
+    context = multiprocessing.get_context("spawn")
+
+    # Worker start-up gets up to a third of the budget. The pool starts its
+    # workers on demand, so one no-op task per worker is run first and the
+    # barrier keeps any worker from taking two. The single-core window then
+    # gets just under half of what is left and the all-core window the rest,
+    # leaving a little for shutting the pool down
+    started = time.time()
+    try:
+        barrier = context.Barrier(workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_set_ready_barrier,
+            initargs=(barrier,),
+        ) as pool:
+            warm_up = budget / 3
+            ready = [pool.submit(_worker_ready, warm_up) for _ in range(workers)]
+            for future in ready:
+                future.result(timeout=warm_up)
+            now = time.time()
+            end = started + budget * 0.9
+            single_window = (now, now + (end - now) * 0.45)
+            multi_window = (now + (end - now) * 0.5, end)
+            single_run = pool.submit(_cpu_rounds, *single_window)
+            rounds, seconds = single_run.result(timeout=budget)
+            futures = [pool.submit(_cpu_rounds, *multi_window) for _ in range(workers)]
+            runs = [future.result(timeout=budget) for future in futures]
+    except Exception:
+        now = time.time()
+        rounds, seconds = _cpu_rounds(now, min(now + budget * 0.25, started + budget))
+        if seconds > 0:
+            result["cpu_single_score"] = rounds / seconds
+        return result
+
+    single = rounds / seconds if seconds > 0 else None
+    multi = sum(rounds / seconds for rounds, seconds in runs if seconds > 0)
+    result.update(cpu_single_score=single, cpu_multi_score=multi)
+    if single:
+        result["cpu_scaling"] = multi / (single * workers)
+    return result
+
+
+def probe_cpu_benchmark():
+    scores = cpu_benchmark()
+    return {key: None if value is None else round(value, 2) for key, value in scores.items()}
+
+
+# Memory benchmark: streaming bandwidth over arrays too big for the CPU caches
+# and pointer-chasing latency, all within MEMORY_BENCHMARK_BUDGET seconds.
+MEMORY_BENCHMARK_BUDGET = 1.5
+MEMORY_BUFFER_BYTES = 64 * 1024**2  # Per array; triad uses three
+LATENCY_CACHED_SLOTS = 1024  # A chain this short stays in L1 and times only the loop
+LATENCY_STEPS = 10_000  # Pointer-chase steps between clock checks
+
+
+def _best_seconds(operation, deadline):
+    """Fastest of repeated runs of operation() until `deadline` (at least one)."""
+    best = None
+    while True:
+        started = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        if time.perf_counter() + elapsed > deadline:
+            return best
+
+
+def _chase_ns(chain, deadline):
+    """Nanoseconds per step following `chain` (slot -> next slot) until `deadline`."""
+    view = memoryview(chain)
+    i = steps = 0
+    started = time.perf_counter()
+    while steps == 0 or time.perf_counter() < deadline:
+        for _ in range(LATENCY_STEPS):
+            i = view[i]
+        steps += LATENCY_STEPS
+    return (time.perf_counter() - started) / steps * 1e9
+
+
+def _random_cycle(np, slots, rng):
+    """One random cycle through every slot, so each load depends on the last."""
+    order = rng.permutation(slots)
+    chain = np.empty(slots, dtype=np.int64)
+    chain[order] = np.roll(order, -1)
+    return chain
+
+
+def _stream_seconds(np, n, copy_deadline, triad_deadline):
+    """Best copy and triad times over three arrays of n floats, freed on return."""
+    a = np.ones(n)
+    b = np.ones(n)
+    c = np.ones(n)
+    copy = _best_seconds(lambda: np.copyto(b, a), copy_deadline)
+
+    def triad():
+        np.multiply(c, 3.0, out=a)
+        np.add(a, b, out=a)
+
+    return copy, _best_seconds(triad, triad_deadline)
+
+
+def memory_benchmark(budget=None, buffer_bytes=None):
+    """Memory copy and triad bandwidth in GB/s and load latency in ns.
+
+    Needs NumPy; raises ImportError without it. Copy counts one read and one
+    write per element, triad (a = b + s * c) two reads and one write, as
+    STREAM does. Latency is the time per step of a random pointer chase over
+    the buffer, less the same loop over a chain that fits in L1, so Python's
+    own overhead is not counted. The buffer shrinks on machines with little
+    free memory.
+    """
+    import numpy as np
+
+    budget = MEMORY_BENCHMARK_BUDGET if budget is None else budget
+    started = time.perf_counter()
+    buffer_bytes = buffer_bytes or min(
+        MEMORY_BUFFER_BYTES, psutil.virtual_memory().available // 16
+    )
+    n = max(1, buffer_bytes // 8)
+
+    # Each phase runs until its share of the budget, counted from the start,
+    # so allocating and shuffling the buffers is paid for out of the budget too
+    copy, triad = _stream_seconds(np, n, started + budget * 0.25, started + budget * 0.4)
+
+    rng = np.random.default_rng(0)
+    chain = _random_cycle(np, n, rng)
+    chased = _chase_ns(chain, started + budget * 0.85)
+    del chain
+    looped = _chase_ns(
+        _random_cycle(np, LATENCY_CACHED_SLOTS, rng), started + budget * 0.95
+    )
+
+    return {
+        "mem_copy_gbps": 2 * n * 8 / copy / 1e9,
+        "mem_triad_gbps": 3 * n * 8 / triad / 1e9,
+        "mem_latency_ns": max(0.0, chased - looped),
+    }
+
+
+def probe_memory_benchmark():
+    try:
+        results = memory_benchmark()
+    except ImportError:
+        return {}  # NumPy is optional; the specs simply have no memory figures
+    return {key: round(value, 2) for key, value in results.items()}
+
+
+def probe_ram():
+    return {"ram_bytes": psutil.virtual_memory().total}
+
+
+# Each volume gets this long to report its usage; network mounts can hang
+VOLUME_TIMEOUT = 3
+# How long a volume scan is reused before the volumes are read again, in seconds
+VOLUME_CACHE_TTL = 30
+
+_volume_cache = {"volumes": None, "taken_at": 0.0}
+_volume_cache_lock = threading.Lock()
+
+
+def _is_candidate_partition(partition):
+    # Empty CD/DVD drives and unformatted partitions have nothing to install onto
+    return bool(partition.fstype) and "cdrom" not in partition.opts
+
+
+def scan_volumes(timeout=None):
+    """Read free and total space of every mounted volume at the same time.
+
+    Volumes that do not answer within `timeout` seconds (VOLUME_TIMEOUT by
+    default, e.g. a stale network drive) or that cannot be read are left out.
+    """
+    timeout = VOLUME_TIMEOUT if timeout is None else timeout
+    partitions = [p for p in psutil.disk_partitions(all=False) if _is_candidate_partition(p)]
+
+    def usage_probe(partition):
+        def disk_usage():
+            return psutil.disk_usage(partition.mountpoint)
+
+        return disk_usage
+
+    started = time.monotonic()
+    futures = [(p, _start_probe(usage_probe(p), f"disk usage {p.mountpoint}")) for p in partitions]
+
+    volumes = []
+    for partition, future in futures:
+        try:
+            usage = future.result(timeout=max(0, started + timeout - time.monotonic()))
+        except Exception:
+            continue  # Timed out or unreadable
+        volumes.append(
+            Volume(partition.mountpoint, partition.fstype, usage.free, usage.total)
+        )
+    return tuple(volumes)
+
+
+def get_volumes(ttl=None):
+    """Return the mounted volumes from a shared snapshot kept for `ttl` seconds."""
+    ttl = VOLUME_CACHE_TTL if ttl is None else ttl
+    with _volume_cache_lock:
+        volumes = _volume_cache["volumes"]
+        if volumes is not None and time.monotonic() - _volume_cache["taken_at"] < ttl:
+            return volumes
+
+        volumes = scan_volumes()
+        _volume_cache["volumes"] = volumes
+        _volume_cache["taken_at"] = time.monotonic()
+        return volumes
+
+
+def clear_volume_cache():
+    """Forget the volume snapshot so the next check scans again."""
+    with _volume_cache_lock:
+        _volume_cache["volumes"] = None
+        _volume_cache["taken_at"] = 0.0
+
+
+def best_volume(volumes):
+    """The volume with the most free space, or None if there are none.
+
+    If any volume meets the Unreal Engine disk requirement, this one does,
+    so validation judges disk space against it.
+    """
+    return max(volumes, key=lambda volume: volume.free_bytes, default=None)
+
+
+def probe_disk():
+    volumes = get_volumes()
+    best = best_volume(volumes)
+    if best is None:
+        # No volume could be listed; fall back to the current drive
+        total, used, free = shutil.disk_usage("/")
+        return {"disk_free_bytes": free}
+    return {
+        "disk_free_bytes": best.free_bytes,
+        "install_volume": best.mountpoint,
+        "volumes": volumes,
+    }
+
+
+# Disk benchmark on the install volume, bounded in time and size
+DISK_BENCHMARK_BUDGET = 2.0
+DISK_BENCHMARK_BYTES = 256 * 1024**2  # Largest test file
+DISK_BLOCK_BYTES = 4 * 1024**2  # Sequential transfer size
+DISK_RANDOM_BYTES = 4096  # Random read size
+# Slowest sequential read (MB/s) and random reads per second for each class.
+# Random reads are issued one at a time (queue depth 1), where many NVMe
+# drives reach only 10-20k IOPS, so NVMe is told apart by sequential read
+# alone: the SATA bus tops out near 600 MB/s.
+DISK_CLASS_RULES = (
+    ("NVMe", 1500, 0),
+    ("SATA SSD", 250, 2000),
+)
+
+
+def classify_disk(read_mbps, random_iops):
+    """HDD, SATA SSD or NVMe class from measured read speeds."""
+    for name, min_read, min_iops in DISK_CLASS_RULES:
+        if read_mbps >= min_read and random_iops >= min_iops:
+            return name
+    return "HDD"
+
+
+def _benchmark_folder(mountpoint):
+    """A writable folder on the volume mounted at `mountpoint`."""
+    import tempfile
+
+    device = os.stat(mountpoint).st_dev
+    for folder in (mountpoint, tempfile.gettempdir(), os.path.expanduser("~")):
+        try:
+            if os.stat(folder).st_dev == device and os.access(folder, os.W_OK):
+                return folder
+        except OSError:
+            continue
+    raise PermissionError(f"No writable folder on {mountpoint}")
+
+
+def _open_no_buffering(path):
+    """Open path on Windows with FILE_FLAG_NO_BUFFERING and write-through."""
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    )
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    handle = kernel32.CreateFileW(
+        path,
+        0x80000000 | 0x40000000,  # GENERIC_READ | GENERIC_WRITE
+        0,
+        None,
+        3,  # OPEN_EXISTING
+        0x20000000 | 0x80000000,  # FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH
+        None,
+    )
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    fd = msvcrt.open_osfhandle(handle, os.O_RDWR | os.O_BINARY)
+    return open(fd, "r+b", buffering=0)
+
+
+def _open_uncached(path):
+    """Open path for unbuffered binary I/O, bypassing the OS cache if possible.
+
+    Returns (file, bypassed). Linux uses O_DIRECT and Windows
+    FILE_FLAG_NO_BUFFERING, both of which need the aligned buffers mmap
+    provides; macOS uses F_NOCACHE. Elsewhere the cache stays.
+    """
+    flags = os.O_RDWR | getattr(os, "O_BINARY", 0)
+    direct = getattr(os, "O_DIRECT", 0)
+    if direct:
+        try:
+            return open(os.open(path, flags | direct), "r+b", buffering=0), True
+        except OSError:
+            pass  # e.g. tmpfs does not support O_DIRECT
+    if sys.platform == "win32":
+        try:
+            return _open_no_buffering(path), True
+        except OSError:
+            pass
+    f = open(os.open(path, flags), "r+b", buffering=0)
+    if sys.platform == "darwin":
+        import fcntl
+
+        fcntl.fcntl(f.fileno(), getattr(fcntl, "F_NOCACHE", 48), 1)
+        return f, True
+    return f, False
+
+
+def _drop_cache(f):
+    """Ask the OS to forget the file's cached pages; False if it cannot."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return True
+
+
+def disk_benchmark(mountpoint, budget=None, max_bytes=None):
+    """Sequential read/write MB/s and 4 KiB random reads per second on a volume.
+
+    Writes a temporary file of up to `max_bytes` (DISK_BENCHMARK_BYTES) in
+    large blocks, reads it back, then reads random 4 KiB blocks from it,
+    each phase stopping at its share of `budget` seconds. The file is
+    always removed. Where the OS cache can neither be bypassed nor dropped,
+    reads would be served from memory, so the speeds are still reported but
+    disk_class is left empty and a "Disk Class" requirement counts as unreadable.
+    """
+    import mmap
+    import random
+    import tempfile
+
+    budget = DISK_BENCHMARK_BUDGET if budget is None else budget
+    max_bytes = max_bytes or DISK_BENCHMARK_BYTES
+    started = time.perf_counter()
+
+    block = mmap.mmap(-1, DISK_BLOCK_BYTES)  # Page aligned, as O_DIRECT needs
+    block.write(os.urandom(DISK_BLOCK_BYTES))
+    small = mmap.mmap(-1, DISK_RANDOM_BYTES)
+
+    fd, path = tempfile.mkstemp(prefix="ue-check-", dir=_benchmark_folder(mountpoint))
+    os.close(fd)
+    try:
+        f, bypassed = _open_uncached(path)
+        with f:
+            written = 0
+            write_started = time.perf_counter()
+            # Cached writes are flushed block by block, so the flush is
+            # timed and cannot run on past the write phase
+            while written < max_bytes and time.perf_counter() < started + budget * 0.3:
+                written += f.write(block)
+                if not bypassed:
+                    os.fsync(f.fileno())
+            os.fsync(f.fileno())
+            write_seconds = time.perf_counter() - write_started
+            uncached = bypassed or _drop_cache(f)
+
+            f.seek(0)
+            read = 0
+            read_started = time.perf_counter()
+            while read < written and time.perf_counter() < started + budget * 0.6:
+                read += f.readinto(block)
+            read_seconds = time.perf_counter() - read_started
+
+            blocks = max(1, written // DISK_RANDOM_BYTES)
+            reads = 0
+            random_started = time.perf_counter()
+            while reads == 0 or time.perf_counter() < started + budget * 0.85:
+                f.seek(random.randrange(blocks) * DISK_RANDOM_BYTES)
+                f.readinto(small)
+                reads += 1
+            random_seconds = time.perf_counter() - random_started
+    finally:
+        # The rest of the budget is left for deleting the file
+        os.remove(path)
+
+    read_mbps = read / read_seconds / 1e6
+    random_iops = reads / random_seconds
+    return {
+        "disk_write_mbps": written / write_seconds / 1e6,
+        "disk_read_mbps": read_mbps,
+        "disk_random_iops": random_iops,
+        "disk_class": classify_disk(read_mbps, random_iops) if uncached else "",
+    }
+
+
+def probe_disk_benchmark():
+    best = best_volume(get_volumes())
+    if best is None:
+        return {}
+    results = disk_benchmark(best.mountpoint)
+    return {
+        key: round(value, 1) if isinstance(value, float) else value
+        for key, value in results.items()
+    }
+
+
+def probe_os():
+    return {"os_name": platform.system() + " " + platform.release()}
+
+
+def probe_gpu():
+    try:
+        gpus = get_gpus()
+    except Exception:
+        return {
+            "gpu_status": "Error retrieving GPU information. Ensure the drivers are installed."
+        }
+    return {
+        "gpus": describe_gpus(gpus),
+        "gpu_status": check_gpu(),
+    }
+
+
+# Probes run by check_system_specs, in the order they are reported.
+PROBES = {
+    "CPU": probe_cpu,
+    "RAM": probe_ram,
+    "Disk Space": probe_disk,
+    "OS": probe_os,
+    "GPU": probe_gpu,
+}
+
+# Opt-in probes: they take seconds and load the machine (the disk benchmark
+# writes a test file), so they only run with check_system_specs(benchmarks=True),
+# in this order and never at the same time as each other or the probes above.
+BENCHMARK_PROBES = {
+    "CPU Benchmark": probe_cpu_benchmark,
+    "Memory Benchmark": probe_memory_benchmark,
+    "Disk Benchmark": probe_disk_benchmark,
+}
+
+# Set to 1 to run the benchmark probes on every GUI hardware check
+# (ue_check has --benchmark)
+BENCHMARK_ENV = "UE_CHECK_BENCHMARK"
+
+
+def _start_probe(probe, name=None):
+    """Start a probe on its own daemon thread and return a Future for its result.
+
+    Daemon threads are used instead of a ThreadPoolExecutor because the
+    executor joins its workers at interpreter exit, so a hung nvidia-smi
+    would keep the checker from closing after the probe already timed out.
+    The probe is recorded as a timing span named "probe <name>".
+    """
+    future = Future()
+    name = name or probe.__name__
+
+    def worker():
+        if not future.set_running_or_notify_cancel():
+            return
+        result = error = None
+        # The span closes before the result is handed over, so it is
+        # already recorded when run_probes returns
+        with timing.thread_profile(), timing.span(f"probe {name}") as span:
+            try:
+                result = probe()
+            except Exception as e:
+                error = e
+                if span is not None:
+                    span.outcome = type(e).__name__
+        if error is None:
+            future.set_result(result)
         else:
-            webbrowser.open(download_link)
-            return (
-                f"Your {gpu_info['name']} driver is outdated. Please update it.",
-                driver_details,
-            )
-    else:
-        print("No GPU detected.")
+            future.set_exception(error)
+
+    threading.Thread(target=worker, name=f"probe-{probe.__name__}", daemon=True).start()
+    return future
 
 
-def check_system_specs():
-    """Retrieve system specifications: CPU, RAM, Disk Space, OS, and GPU."""
-    specs = {}
+def run_probes(probes=None, timeouts=None):
+    """Run all probes at the same time and collect their results.
 
-    # CPU
-    cpu_info = platform.processor()
-    cpu_cores = psutil.cpu_count(logical=False)  # Physical cores
-    specs["CPU"] = f"{cpu_info} ({cpu_cores} cores)"
+    Every probe gets its own timeout, measured from the moment the probes
+    were started. A probe that does not answer in time is reported as
+    PROBE_TIMED_OUT and one that raises as PROBE_FAILED, so a single stuck
+    probe never holds up the rest of the check. With timing on, a probe that
+    timed out is recorded as a span with the outcome "timed out".
+    """
+    probes = PROBES if probes is None else probes
+    timeouts = PROBE_TIMEOUTS if timeouts is None else timeouts
 
-    # RAM
-    ram = round(psutil.virtual_memory().total / (1024**3), 2)  # Convert to GB
-    specs["RAM"] = f"{ram} GB"
+    started = time.monotonic()
+    span_started = time.perf_counter()
+    futures = {name: _start_probe(probe, name) for name, probe in probes.items()}
 
-    # Disk space
-    total, used, free = shutil.disk_usage("/")
-    free_gb = round(free / (1024**3), 2)  # Convert to GB
-    specs["Disk Space"] = f"{free_gb} GB free"
+    results = {}
+    for name, future in futures.items():
+        deadline = started + timeouts.get(name, DEFAULT_PROBE_TIMEOUT)
+        try:
+            results[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            results[name] = PROBE_TIMED_OUT
+            timing.record(f"probe {name}", span_started, "timed out")
+        except Exception:
+            results[name] = PROBE_FAILED
+    return results
 
-    # OS
-    os_info = platform.system() + " " + platform.release()
-    specs["OS"] = os_info
 
-    # GPU
-    gpu_info = check_gpu()
-    specs["GPU"] = gpu_info
+def _import_benchmark_modules():
+    """Load what the benchmark probes import lazily, on the calling thread.
 
-    return specs
+    Several probe threads importing at the same time can deadlock in the
+    import system (seen with setuptools' distutils hook on Python 3.11, e.g.
+    with a GPU probe that is still importing GPUtil after timing out), so this
+    runs before the benchmarks are started.
+    """
+    import concurrent.futures.process  # noqa: F401
+    import mmap  # noqa: F401
+    import multiprocessing  # noqa: F401
+    import random  # noqa: F401
+    import tempfile  # noqa: F401
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+
+
+def check_system_specs(sampler=None, benchmarks=False):
+    """Retrieve system specifications: CPU, RAM, Disk Space, OS, and GPU.
+
+    With a running resource_sampler.ResourceSampler, the headroom it has
+    measured so far is included too. With `benchmarks`, the CPU, memory and
+    disk benchmarks run after the other probes, one at a time and each with
+    its own timeout, so they do not slow each other down.
+    """
+    fields = {} if sampler is None else sampler.headroom()
+    results = run_probes(PROBES)
+    if benchmarks:
+        _import_benchmark_modules()
+        for name, probe in BENCHMARK_PROBES.items():
+            results.update(run_probes({name: probe}))
+    probe_errors = {}
+    for name, result in results.items():
+        if isinstance(result, dict):
+            fields.update(result)
+        else:
+            probe_errors[name] = result
+    return SystemSpecs(probe_errors=probe_errors, **fields)
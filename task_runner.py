@@ -0,0 +1,163 @@
+import queue
+import sys
+import threading
+
+POLL_MS = 50  # How often the Tk thread picks up results from workers
+
+
+class WindowClosed(RuntimeError):
+    """Raised in a worker that needs the Tk thread after the window was closed."""
+
+
+class TaskRunner:
+    """Run slow work off the Tk main thread and hand results back to it.
+
+    Tk is not thread safe, so workers never touch widgets. They put callbacks
+    on a queue which the Tk thread drains every `poll_ms` through root.after,
+    keeping the event loop (and the loading overlay) alive while pip, winget
+    or the hardware probes run. One task runs at a time; `busy` is True while
+    it does.
+
+    Tasks run on daemon threads, as the hardware probes do, so a task still
+    running when the window is closed does not keep the process alive.
+    """
+
+    def __init__(self, root, poll_ms=POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.busy = False
+        self._closed = False
+        self._queue = queue.Queue()
+        self._waiting = set()  # Events of call()s waiting on the Tk thread
+        self._lock = threading.Lock()
+        self._ui_thread = threading.get_ident()
+        root.after(poll_ms, self._poll)
+
+    def in_ui_thread(self):
+        return threading.get_ident() == self._ui_thread
+
+    def submit(self, work, on_done=None, on_error=None):
+        """Run work() on the worker thread.
+
+        on_done(result) or on_error(exception) is then called on the Tk thread.
+        A SystemExit raised by the work closes the window, as it would have
+        when the work ran on the Tk thread.
+        """
+        self.busy = True
+
+        def job():
+            try:
+                result = work()
+            except SystemExit as e:
+                self.post(self._exit, e.code)
+                return
+            except Exception as e:
+                self.post(self._finish, on_error, e)
+                return
+            self.post(self._finish, on_done, result)
+
+        thread = threading.Thread(target=job, name="gui-task", daemon=True)
+        thread.start()
+        return thread
+
+    def post(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread without waiting for it."""
+        self._queue.put((fn, args))
+
+    def call(self, fn, *args, **kwargs):
+        """Run fn on the Tk thread and return its result.
+
+        Called from the Tk thread this is a plain call; from a worker it
+        blocks until the Tk thread has run fn (e.g. a message box was closed).
+        Raises WindowClosed if the window is closed before that happens.
+        """
+        if self.in_ui_thread():
+            return fn(*args, **kwargs)
+
+        done = threading.Event()
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = fn(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        with self._lock:
+            if self._closed:
+                raise WindowClosed("The window was closed.")
+            self._waiting.add(done)
+        self.post(run)
+        done.wait()
+        with self._lock:
+            self._waiting.discard(done)
+        if "error" in outcome:
+            raise outcome["error"]
+        if "result" not in outcome:
+            raise WindowClosed("The window was closed.")
+        return outcome["result"]
+
+    def close(self):
+        """Close the window; use as the WM_DELETE_WINDOW handler.
+
+        Workers waiting in call() are released with WindowClosed, since no
+        one drains the queue once the event loop has stopped.
+        """
+        with self._lock:
+            self._closed = True
+            waiting, self._waiting = self._waiting, set()
+        for done in waiting:
+            done.set()
+        self.root.destroy()
+
+    def _finish(self, callback, value):
+        self.busy = False
+        if callback is not None:
+            callback(value)
+
+    def _exit(self, code):
+        self.busy = False
+        self.close()
+        sys.exit(code)
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    fn, args = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                fn(*args)
+        finally:
+            # Keep polling even if a callback raised, unless the window closed
+            if not self._closed:
+                self.root.after(self.poll_ms, self._poll)
+
+
+class MainThreadProxy:
+    """Forward attribute calls to `target` on the Tk thread.
+
+    Wrapping tkinter.messagebox with this lets code running on a TaskRunner
+    worker keep calling messagebox.showinfo(...) and friends. `get_runner`
+    returns the current TaskRunner, or None before the GUI exists, in which
+    case calls go straight through.
+    """
+
+    def __init__(self, target, get_runner):
+        self._target = target
+        self._get_runner = get_runner
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            runner = self._get_runner()
+            if runner is None:
+                return attribute(*args, **kwargs)
+            return runner.call(attribute, *args, **kwargs)
+
+        return call
@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+RUN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "run.py")
+
+
+def run_benchmarks(*args):
+    return subprocess.run(
+        [sys.executable, RUN, "--repeat", "1", *args], capture_output=True, text=True
+    )
+
+
+# Results are saved as JSON, and comparing against the same run passes
+def test_results_saved_as_json(tmp_path):
+    output = tmp_path / "run.json"
+    result = run_benchmarks("--case", "evaluate_tiers", "--case", "validate_specs", "--output", str(output))
+    assert result.returncode == 0, result.stderr
+
+    saved = json.loads(output.read_text())
+    assert set(saved["results"]) == {"evaluate_tiers", "validate_specs"}
+    assert run_benchmarks("--case", "evaluate_tiers", "--compare", str(output), "--threshold", "10").returncode == 0
+
+
+# A case slower than the baseline by more than the threshold fails the run
+def test_regression_fails_run(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"check_system_specs[mocked]": 1e-6}}))
+
+    result = run_benchmarks("--case", "check_system_specs[mocked]", "--compare", str(baseline))
+    assert result.returncode == 1
+    assert "REGRESSION check_system_specs[mocked]" in result.stdout
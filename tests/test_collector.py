@@ -0,0 +1,95 @@
+import asyncio
+import json
+import sqlite3
+from collector import Collector
+from report import send_report
+
+
+async def post_reports(port, reports):
+    """Stand-in client: POST reports over one keep-alive connection."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    statuses = []
+    for report in reports:
+        body = json.dumps(report).encode()
+        writer.write(
+            b"POST /reports HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        await reader.readexactly(int(headers["content-length"]))
+        statuses.append(int(status_line.split()[1]))
+    writer.close()
+    return statuses
+
+
+# Reports from many machines end up in storage, batched by the writer
+def test_collector_stores_reports(tmp_path):
+    db_path = tmp_path / "reports.db"
+
+    async def scenario():
+        collector = Collector(str(db_path), batch_size=100)
+        _host, port = await collector.start("127.0.0.1", 0)
+        machines = [
+            [{"host": f"seat-{m}", "tier": "ue5_minimum", "run": r} for r in range(50)]
+            for m in range(20)
+        ]
+        results = await asyncio.gather(*(post_reports(port, reports) for reports in machines))
+        await collector.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert all(status == 202 for statuses in results for status in statuses)
+    with sqlite3.connect(db_path) as db:
+        assert db.execute("SELECT COUNT(*) FROM reports").fetchone()[0] == 1000
+        assert db.execute("SELECT COUNT(DISTINCT host) FROM reports").fetchone()[0] == 20
+
+
+# A full queue pushes back with 503 instead of growing without limit
+def test_collector_backpressure(tmp_path):
+    async def scenario():
+        collector = Collector(str(tmp_path / "reports.db"), queue_size=1, put_timeout=0.05)
+        _host, port = await collector.start("127.0.0.1", 0)
+        # Stall the writer so the queue cannot drain
+        collector._writer_task.cancel()
+        statuses = await post_reports(port, [{"host": "seat-1"}, {"host": "seat-2"}])
+        summary = collector.summary()
+        collector._db.close()
+        return statuses, summary
+
+    statuses, summary = asyncio.run(scenario())
+    assert statuses == [202, 503]
+    assert summary["rejected"] == 1
+
+
+# The checker's own report sender talks to the collector
+def test_send_report_to_collector(tmp_path):
+    async def scenario():
+        collector = Collector(str(tmp_path / "reports.db"), flush_interval=0.01)
+        _host, port = await collector.start("127.0.0.1", 0)
+        url = f"http://127.0.0.1:{port}/reports"
+        sent = await asyncio.to_thread(send_report, {"host": "seat-1", "tier": "ue4_minimum"}, url)
+        await collector.queue.join()
+        summary = collector.summary()
+        await collector.stop()
+        return sent, summary
+
+    sent, summary = asyncio.run(scenario())
+    assert sent
+    assert summary["machines"] == {"ue4_minimum": 1}
+
+
+# Without a configured collector nothing is sent
+def test_send_report_without_collector(monkeypatch):
+    monkeypatch.delenv("UE_CHECK_COLLECTOR", raising=False)
+    assert send_report({"host": "seat-1"}) is False
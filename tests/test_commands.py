@@ -0,0 +1,66 @@
+import sys
+import time
+from commands import run_command, run_commands, stream_command
+
+
+def sleeper(seconds, text="done"):
+    return [sys.executable, "-c", f"import time; time.sleep({seconds}); print({text!r})"]
+
+
+# Independent probes run at the same time
+def test_commands_run_concurrently():
+    started = time.monotonic()
+    results = run_commands([sleeper(0.5, "a"), sleeper(0.5, "b"), sleeper(0.5, "c")])
+    elapsed = time.monotonic() - started
+
+    assert [result.output.strip() for result in results] == ["a", "b", "c"]
+    assert all(result.ok for result in results)
+    assert elapsed < 1.2
+
+
+# A hung command is killed at its timeout and reported as such
+def test_command_timeout():
+    result = run_command(sleeper(10), timeout=0.3)
+    assert result.timed_out
+    assert not result.ok
+    assert result.duration < 5
+
+
+# Missing tools and failing commands come back as structured results
+def test_missing_and_failing_commands():
+    missing, failing = run_commands(
+        [["definitely-not-a-real-tool", "--version"], [sys.executable, "-c", "raise SystemExit(3)"]]
+    )
+    assert missing.returncode is None and missing.error
+    assert failing.returncode == 3
+
+
+# Only the tail of long output is kept
+def test_output_tail():
+    result = run_command([sys.executable, "-c", "print('x' * 10000 + 'END')"])
+    assert result.output.rstrip().endswith("END")
+    assert len(result.output) <= 4000
+
+
+# Streamed output arrives in rate-limited batches and only the tail is kept
+def test_stream_command_ring_buffer():
+    script = (
+        "import time\n"
+        "for i in range(5000):\n"
+        "    print('line', i)\n"
+        "    if i % 1000 == 0: time.sleep(0.1)\n"
+    )
+    batches = []
+    result = stream_command(
+        [sys.executable, "-c", script],
+        batches.append,
+        max_lines=50,
+        flush_interval=0.05,
+    )
+
+    assert result.ok
+    assert result.output.splitlines() == [f"line {i}" for i in range(4950, 5000)]
+    # Far fewer UI updates than lines, and no batch larger than the buffer
+    assert 1 < len(batches) < 100
+    assert all(len(batch) <= 50 for batch in batches)
+    assert batches[-1][-1] == "line 4999"
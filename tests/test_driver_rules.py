@@ -0,0 +1,62 @@
+import time
+from driver_rules import DriverRules, check_driver, load_rules, parse_version
+from system_check import is_driver_up_to_date
+
+
+# Versions compare as numbers, not strings ("99.0" used to beat "456.38")
+def test_versions_compare_numerically():
+    assert is_driver_up_to_date("NVIDIA GTX 1080", "99.0")[0] is False
+    assert is_driver_up_to_date("NVIDIA GTX 1080", "1000.1")[0] is True
+    assert is_driver_up_to_date("AMD Radeon RX 580", "20.10")[0] is False
+    assert parse_version("27.20.100.8587") == (27, 20, 100, 8587)
+
+
+# Vendors are found from product names too, and unknown GPUs have no link
+def test_vendor_lookup():
+    assert check_driver("GeForce GTX 1660", "460.89").vendor == "NVIDIA"
+    assert check_driver("Intel(R) UHD Graphics 620", "27.20.100.9000").up_to_date
+    assert is_driver_up_to_date("Matrox G200", "1.0") == (False, None)
+
+
+# A GPU family's own minimum wins over its vendor's
+def test_family_minimum_overrides_vendor():
+    verdict = check_driver("NVIDIA GeForce RTX 4090", "516.94")
+    assert verdict.minimum == "522.25"
+    assert not verdict.up_to_date
+    assert check_driver("NVIDIA GeForce RTX 3080", "516.94").up_to_date
+
+
+# Verdicts are memoised per (name, driver) pair
+def test_check_driver_is_memoised():
+    check_driver.cache_clear()
+    check_driver("NVIDIA GeForce RTX 3080", "531.18")
+    check_driver("NVIDIA GeForce RTX 3080", "531.18")
+    assert check_driver.cache_info().hits == 1
+
+
+# Lookup cost does not grow with the number of families in the rules file
+def test_lookup_scales_to_thousands_of_families():
+    data = {
+        "vendors": {"NVIDIA": {"aliases": ["nvidia"], "minimum": "400", "download": ""}},
+        "families": [
+            {"vendor": "NVIDIA", "prefix": f"model {i}", "minimum": f"{i}.0"}
+            for i in range(5000)
+        ],
+    }
+    rules = DriverRules(data)
+    started = time.perf_counter()
+    for _ in range(10000):
+        rule = rules.rule_for("NVIDIA Model 4321")
+    assert time.perf_counter() - started < 1
+    assert rule.minimum == (4321, 0)
+
+
+# A missing or broken rules file (e.g. a build without it) falls back to the built-in minimums
+def test_unreadable_rules_file_uses_builtin_minimums(tmp_path):
+    broken = tmp_path / "driver_rules.json"
+    broken.write_text("{not json", encoding="utf-8")
+    for path in (str(tmp_path / "missing.json"), str(broken)):
+        rules = load_rules(path)
+        assert rules.rule_for("NVIDIA GeForce RTX 4090").minimum == (456, 38)
+        assert rules.rule_for("AMD Radeon RX 7900 XT").minimum == (20, 10, 1)
+        assert rules.rule_for("Intel(R) UHD Graphics 630").vendor == "Intel"
@@ -0,0 +1,60 @@
+import sys
+from unittest.mock import patch
+import env_state
+from commands import CommandResult
+
+
+def _state(installed):
+    return {"executable": "/venv/bin/python", "version": "3.12.0", "installed": installed}
+
+
+# Pins, ranges and compatible releases are checked against installed versions
+def test_is_satisfied():
+    installed = {"colorama": "0.4.6", "pygame": "2.5.2"}
+    assert env_state.is_satisfied("colorama==0.4.6", installed)
+    assert env_state.is_satisfied("PyGame>=2.0,<3", installed)
+    assert env_state.is_satisfied("pygame~=2.5", installed)
+    assert not env_state.is_satisfied("colorama==0.4.5", installed)
+    assert not env_state.is_satisfied("numpy", installed)
+    # Extras and markers are left to pip
+    assert not env_state.is_satisfied("pygame[extra]", installed)
+
+
+# The real interpreter reports its installed distributions
+def test_inspect_environment_reads_metadata():
+    state = env_state.inspect_environment(sys.executable)
+    assert state["version"] == sys.version
+    assert "pytest" in state["installed"]
+
+
+# A matching fingerprint means no pip run at all; a changed file installs only what is missing
+@patch("env_state.install_requirements")
+@patch("env_state.inspect_environment")
+def test_ensure_requirements_file(mock_inspect, mock_install, tmp_path):
+    requirements = tmp_path / "ai_requirements.txt"
+    requirements.write_text("# AI packages\ncolorama==0.4.6\n")
+    mock_inspect.return_value = _state({"colorama": "0.4.6"})
+
+    first = env_state.ensure_requirements_file("python", str(requirements), str(tmp_path))
+    assert first.output == env_state.UP_TO_DATE
+    assert (tmp_path / env_state.FINGERPRINT_FILE).exists()
+
+    second = env_state.ensure_requirements_file("python", str(requirements), str(tmp_path))
+    assert second.output == env_state.UP_TO_DATE
+    assert mock_inspect.call_count == 2
+    mock_install.assert_not_called()
+
+    requirements.write_text("colorama==0.4.6\nnumpy>=1.26\n")
+    mock_install.return_value = CommandResult(("pip",), 0, 1.0)
+    env_state.ensure_requirements_file("python", str(requirements), str(tmp_path))
+    mock_install.assert_called_once_with("python", ["numpy>=1.26"], None)
+
+
+# pip is skipped when pygame is already installed
+@patch("env_state.install_requirements")
+@patch("env_state.inspect_environment", return_value=_state({"pygame": "2.5.2"}))
+def test_ensure_requirements_skips_installed(mock_inspect, mock_install):
+    result = env_state.ensure_requirements("python", ["pygame"])
+    assert result.ok
+    assert result.output == env_state.UP_TO_DATE
+    mock_install.assert_not_called()
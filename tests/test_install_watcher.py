@@ -0,0 +1,59 @@
+import sys
+import threading
+import time
+import pytest
+from install_watcher import wait_for_tool
+
+
+def fake_installer(folder, delay):
+    """Drop a tool binary into a (not yet existing) folder after `delay` seconds."""
+    def install():
+        time.sleep(delay)
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "tool").write_text("#!/bin/sh\n")
+
+    thread = threading.Thread(target=install)
+    thread.start()
+    return thread
+
+
+# On Linux the watcher wakes on the install instead of waiting out a poll interval
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_returns_as_soon_as_tool_appears(tmp_path):
+    install_dir = tmp_path / "Programs" / "Tool"
+    installer = fake_installer(install_dir, 0.3)
+
+    started = time.monotonic()
+    ready = wait_for_tool(
+        lambda: (install_dir / "tool").exists(),
+        [install_dir],
+        timeout=10,
+        max_poll_interval=5,
+    )
+    elapsed = time.monotonic() - started
+    installer.join()
+
+    assert ready
+    assert elapsed < 1.5
+
+
+# Without events the polling fallback still finds the tool
+def test_polling_fallback(tmp_path):
+    install_dir = tmp_path / "bin"
+    installer = fake_installer(install_dir, 0.2)
+
+    ready = wait_for_tool(
+        lambda: (install_dir / "tool").exists(),
+        [install_dir],
+        timeout=5,
+        use_events=False,
+    )
+    installer.join()
+    assert ready
+
+
+# Gives up after the timeout when nothing is installed
+def test_timeout(tmp_path):
+    started = time.monotonic()
+    assert not wait_for_tool(lambda: False, [tmp_path], timeout=0.3)
+    assert time.monotonic() - started < 1
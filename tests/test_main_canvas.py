@@ -0,0 +1,74 @@
+from unittest.mock import patch
+import main_canvas
+from tool_discovery import ToolInfo
+
+
+class FakeCanvas:
+    """Stands in for tk.Canvas: items are ids, after() callbacks run on tick()."""
+
+    def __init__(self):
+        self.items = {}
+        self.pending = {}
+        self.next_id = 0
+
+    def create_text(self, text):
+        self.next_id += 1
+        self.items[self.next_id] = text
+        return self.next_id
+
+    def find_withtag(self, item):
+        return (item,) if item in self.items else ()
+
+    def itemconfigure(self, item, text):
+        self.items[item] = text
+
+    def after(self, ms, callback, *args):
+        self.next_id += 1
+        self.pending[self.next_id] = (callback, args)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def delete(self, tag):
+        self.items.clear()
+
+    def tick(self):
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+
+
+# An animation left from an earlier overlay never writes over the next overlay's text
+def test_old_loading_animation_leaves_new_overlay_alone():
+    canvas = FakeCanvas()
+    first = canvas.create_text("Setting up Python...")
+    with patch("main_canvas.loading_text", first):
+        main_canvas.animate_loading_overlay(canvas, "Setting up Python")
+        main_canvas.hide_loading_overlay(canvas)
+
+    second = canvas.create_text("Python installed, closing in.. 5")
+    with patch("main_canvas.loading_text", second):
+        # A tick that was already due when the overlay was replaced
+        main_canvas.animate_loading_overlay(canvas, "Setting up Python", 1, first)
+        canvas.tick()
+
+    assert canvas.items[second] == "Python installed, closing in.. 5"
+    assert not canvas.pending
+
+
+# Python setup looks up every tool in one concurrent round before checking any
+@patch("main_canvas.install_pygame")
+@patch("main_canvas.messagebox.showinfo")
+def test_python_setup_surveys_tools_first(mock_showinfo, mock_install_pygame):
+    lookups = []
+
+    def discover(*names):
+        lookups.append(names)
+        return {name: ToolInfo(name, f"/usr/bin/{name}", "1.0", True) for name in names}
+
+    with patch("main_canvas.discover", side_effect=discover):
+        main_canvas.install_python_and_pygame()
+
+    assert lookups[0] == ("python", "python3", "winget", "code")
+    mock_install_pygame.assert_called_once()
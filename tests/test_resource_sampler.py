@@ -0,0 +1,63 @@
+import time
+from unittest.mock import patch, MagicMock
+from resource_sampler import ResourceSampler, percentile, OVERHEAD_BUDGET, SAMPLE_INTERVAL
+from specs import SystemSpecs, GIB
+from validation import validate_specs
+
+
+# Nearest-rank percentiles ignore missing readings
+def test_percentile():
+    assert percentile([5, 1, 4, 2, 3], 10) == 1
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile([None, 7], 90) == 7
+    assert percentile([], 50) is None
+
+
+# The ring buffer keeps only the newest samples and reports low-percentile headroom
+@patch("psutil.cpu_count", return_value=8)
+@patch("psutil.cpu_percent", side_effect=[75.0, 50.0, 90.0, 25.0])
+@patch("psutil.virtual_memory")
+def test_headroom_from_ring_buffer(mock_memory, mock_cpu, mock_count):
+    mock_memory.side_effect = [MagicMock(available=n * GIB) for n in (9, 6, 1, 4)]
+    sampler = ResourceSampler(window=3)
+    for _ in range(4):
+        sampler.sample()
+
+    assert len(sampler.samples) == 3
+    headroom = sampler.headroom()
+    # Free CPU was 50, 10 and 75 percent: the worst is 0.8 of 8 cores
+    assert headroom["cpu_headroom_cores"] == 0.8
+    assert headroom["ram_headroom_bytes"] == 1 * GIB
+    assert headroom["gpu_headroom_percent"] is None
+
+
+# At the default rate one sample costs a small fraction of the overhead budget
+def test_sample_cost_within_budget():
+    sampler = ResourceSampler()
+    started = time.thread_time()
+    for _ in range(50):
+        sampler.sample()
+    per_sample = (time.thread_time() - started) / 50
+    assert per_sample / SAMPLE_INTERVAL < OVERHEAD_BUDGET
+
+
+# A sampler over its budget slows itself down
+def test_sampler_backs_off_over_budget():
+    sampler = ResourceSampler(interval=0.01, gpu_every=0, overhead_budget=1e-6).start()
+    time.sleep(0.3)
+    sampler.stop()
+    assert sampler.samples
+    assert sampler.interval > 0.01
+
+
+# Sampled headroom can be used as a requirement; unsampled headroom cannot pass
+def test_headroom_requirements():
+    requirements = {"RAM Headroom": 4, "CPU Headroom": 2}
+    busy = SystemSpecs(ram_headroom_bytes=1 * GIB, cpu_headroom_cores=3.5)
+    assert validate_specs(busy, requirements) == [
+        "Not enough free RAM while in use (at least 4 GB free required)."
+    ]
+    assert validate_specs(SystemSpecs(), requirements) == [
+        "CPU headroom was not sampled.",
+        "RAM headroom was not sampled.",
+    ]
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import pytest
+
+
+def modules_loaded_by(module, names):
+    script = (
+        f"import sys, {module}; "
+        f"print(','.join(n for n in {names!r} if n in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return [name for name in out.split(",") if name]
+
+
+# GPUtil and webbrowser are only loaded when the GPU probe or driver step runs
+def test_system_check_defers_optional_imports():
+    assert modules_loaded_by("system_check", ("GPUtil", "webbrowser")) == []
+
+
+# Images, fonts and Windows APIs are loaded when the window is built, not on import
+def test_main_canvas_defers_heavy_imports():
+    pytest.importorskip("tkinter")
+    names = ("PIL", "tkextrafont", "winreg", "ctypes", "GPUtil")
+    assert modules_loaded_by("main_canvas", names) == []
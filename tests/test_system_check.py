@@ -0,0 +1,351 @@
+import time
+import pytest
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import patch, MagicMock
+from system_check import (
+    run_probes,
+    get_gpus,
+    get_gpu_info,
+    clear_gpu_cache,
+    check_gpu,
+    check_driver_and_link_user,
+    check_system_specs,
+    clear_volume_cache,
+    probe_disk,
+    probe_gpu,
+    cpu_benchmark,
+    memory_benchmark,
+    disk_benchmark,
+    classify_disk,
+    PROBE_TIMED_OUT,
+    PROBE_FAILED,
+)
+from specs import SystemSpecs, GIB
+from validation import validate_specs
+
+
+def slow_probe(result, delay):
+    def probe():
+        time.sleep(delay)
+        return result
+    return probe
+
+
+# Probes should run side by side, so the check takes as long as the slowest one
+def test_probes_run_concurrently():
+    probes = {
+        "CPU": slow_probe("4 cores", 0.3),
+        "RAM": slow_probe("8 GB", 0.3),
+        "GPU": slow_probe("Dedicated GPU", 0.3),
+    }
+    started = time.monotonic()
+    results = run_probes(probes, timeouts={})
+    elapsed = time.monotonic() - started
+
+    assert results == {"CPU": "4 cores", "RAM": "8 GB", "GPU": "Dedicated GPU"}
+    assert elapsed < 0.6
+
+
+# A probe that hangs is reported as timed out without blocking the others
+def test_probe_timeout_returns_partial_results():
+    probes = {
+        "CPU": slow_probe("4 cores", 0),
+        "GPU": slow_probe("Dedicated GPU", 5),
+    }
+    started = time.monotonic()
+    results = run_probes(probes, timeouts={"CPU": 1, "GPU": 0.2})
+    elapsed = time.monotonic() - started
+
+    assert results["CPU"] == "4 cores"
+    assert results["GPU"] == PROBE_TIMED_OUT
+    assert elapsed < 1
+
+
+# A probe that raises does not take the whole check down
+def test_failing_probe_is_marked_unavailable():
+    def broken():
+        raise OSError("no such device")
+
+    results = run_probes({"Disk Space": broken}, timeouts={})
+    assert results["Disk Space"] == PROBE_FAILED
+
+
+@pytest.fixture
+def mock_get_gpus():
+    gpu = MagicMock()
+    gpu.name = "NVIDIA GTX 1080"
+    gpu.driver = "456.71"
+    clear_gpu_cache()
+    with patch("GPUtil.getGPUs", return_value=[gpu]) as mock:
+        yield mock
+    clear_gpu_cache()
+
+
+# One check and the driver step share a single GPU enumeration
+def test_gpu_enumerated_once_per_check(mock_get_gpus):
+    assert "NVIDIA GTX 1080" in check_gpu()
+    assert get_gpu_info() == {"name": "NVIDIA GTX 1080", "driver_version": "456.71"}
+    check_driver_and_link_user()
+
+    assert mock_get_gpus.call_count == 1
+
+
+# Snapshots expire after the TTL and can be cleared explicitly
+def test_gpu_cache_ttl_and_clear(mock_get_gpus):
+    get_gpus()
+    get_gpus(ttl=0)
+    assert mock_get_gpus.call_count == 2
+
+    clear_gpu_cache()
+    get_gpus()
+    assert mock_get_gpus.call_count == 3
+
+
+# A hung nvidia-smi times out every caller instead of blocking the driver step
+@patch("system_check.GPU_TIMEOUT", 0.3)
+@patch("GPUtil.getGPUs", side_effect=lambda: time.sleep(2))
+def test_hung_gpu_enumeration_times_out(mock_gpus):
+    clear_gpu_cache()
+    started = time.monotonic()
+    with pytest.raises(FutureTimeoutError):
+        get_gpus()
+    assert check_driver_and_link_user() is None
+    assert time.monotonic() - started < 1
+    assert mock_gpus.call_count == 1
+    clear_gpu_cache()
+
+
+# check_system_specs returns raw numbers, with failed probes recorded by name
+def test_check_system_specs_returns_typed_record():
+    probes = {
+        "CPU": lambda: {"cpu_name": "Test CPU", "cpu_cores": 8},
+        "RAM": lambda: {"ram_bytes": 16 * GIB},
+        "GPU": slow_probe({"gpus": ()}, 5),
+    }
+    with patch("system_check.PROBES", probes), patch(
+        "system_check.PROBE_TIMEOUTS", {"GPU": 0.1}
+    ):
+        specs = check_system_specs()
+
+    assert isinstance(specs, SystemSpecs)
+    assert specs.cpu_cores == 8
+    assert specs.ram_bytes == 16 * GIB
+    assert specs.probe_errors == {"GPU": PROBE_TIMED_OUT}
+    assert specs.display()["GPU"] == PROBE_TIMED_OUT
+
+
+# The benchmarks only run when asked for
+def test_benchmarks_are_opt_in():
+    runs = []
+
+    def benchmark():
+        runs.append(1)
+        return {"cpu_single_score": 100.0}
+
+    probes = {"CPU": lambda: {"cpu_cores": 8}}
+    with patch("system_check.PROBES", probes), patch(
+        "system_check.BENCHMARK_PROBES", {"CPU Benchmark": benchmark}
+    ):
+        quick = check_system_specs()
+        full = check_system_specs(benchmarks=True)
+
+    assert runs == [1]
+    assert quick.cpu_single_score is None and "CPU Benchmark" not in quick.display()
+    assert full.cpu_single_score == 100.0
+
+
+# Benchmarks run after the regular probes and never overlap one another
+def test_benchmarks_run_one_at_a_time():
+    spans = {}
+
+    def timed_probe(name, delay):
+        def probe():
+            started = time.monotonic()
+            time.sleep(delay)
+            spans[name] = (started, time.monotonic())
+            return {}
+
+        return probe
+
+    probes = {"CPU": timed_probe("CPU", 0.1), "GPU": timed_probe("GPU", 0.2)}
+    benchmarks = {
+        name: timed_probe(name, 0.1)
+        for name in ("CPU Benchmark", "Memory Benchmark", "Disk Benchmark")
+    }
+    with patch("system_check.PROBES", probes), patch("system_check.BENCHMARK_PROBES", benchmarks):
+        check_system_specs(benchmarks=True)
+
+    regular_end = max(spans["CPU"][1], spans["GPU"][1])
+    runs = [spans[name] for name in benchmarks]
+    assert all(start >= regular_end for start, _ in runs)
+    assert all(earlier[1] <= later[0] for earlier, later in zip(runs, runs[1:]))
+
+
+def _partition(mountpoint, fstype="ntfs", opts="rw,fixed"):
+    partition = MagicMock(mountpoint=mountpoint, fstype=fstype, opts=opts)
+    return partition
+
+
+def _usage(mountpoint):
+    if mountpoint == "Z:\\":
+        time.sleep(5)  # A network drive that never answers
+    free = {"C:\\": 40 * GIB, "D:\\": 300 * GIB}[mountpoint]
+    return MagicMock(free=free, total=500 * GIB)
+
+
+# Every volume is read at once; a hung one is skipped and the roomiest volume is reported
+@patch("system_check.VOLUME_TIMEOUT", 0.2)
+@patch("psutil.disk_usage", side_effect=_usage)
+@patch(
+    "psutil.disk_partitions",
+    return_value=[
+        _partition("C:\\"),
+        _partition("D:\\"),
+        _partition("E:\\", fstype="", opts="cdrom"),
+        _partition("Z:\\"),
+    ],
+)
+def test_disk_probe_picks_best_volume(mock_partitions, mock_usage):
+    clear_volume_cache()
+    started = time.monotonic()
+    result = probe_disk()
+    assert time.monotonic() - started < 1
+
+    assert result["install_volume"] == "D:\\"
+    assert result["disk_free_bytes"] == 300 * GIB
+    assert [volume.mountpoint for volume in result["volumes"]] == ["C:\\", "D:\\"]
+
+    # The scan is cached briefly
+    probe_disk()
+    assert mock_partitions.call_count == 1
+    clear_volume_cache()
+
+
+def _adapter(name, driver, memory_mb):
+    gpu = MagicMock(driver=driver, memoryTotal=memory_mb)
+    gpu.name = name
+    return gpu
+
+
+# Every adapter is reported; the one with the most VRAM is the one judged
+@patch("webbrowser.open")
+@patch(
+    "GPUtil.getGPUs",
+    return_value=[
+        _adapter("NVIDIA T400", "99.0", 2048),
+        _adapter("NVIDIA GeForce RTX 3080", "531.18", 10240),
+    ],
+)
+def test_all_gpus_from_one_enumeration(mock_get_gpus, mock_open):
+    clear_gpu_cache()
+    gpus = probe_gpu()["gpus"]
+    assert [gpu.vram_bytes for gpu in gpus] == [2048 * 1024**2, 10240 * 1024**2]
+    assert [gpu.driver_up_to_date for gpu in gpus] == [False, True]
+    assert gpus[1].vendor == "NVIDIA"
+
+    specs = SystemSpecs(gpus=gpus)
+    assert specs.best_gpu.name == "NVIDIA GeForce RTX 3080"
+    assert "RTX 3080" in specs.display()["GPU"]
+    assert get_gpu_info()["name"] == "NVIDIA GeForce RTX 3080"
+
+    # The outdated secondary adapter is still flagged, in the same pass
+    message, details = check_driver_and_link_user()
+    assert "NVIDIA T400 driver is outdated" in message
+    assert "RTX 3080: driver 531.18 (up to date)" in details
+    mock_open.assert_called_once()
+    assert mock_get_gpus.call_count == 1
+    clear_gpu_cache()
+
+
+# The CPU benchmark reports single and all-core scores within its time budget
+def test_cpu_benchmark_within_budget():
+    started = time.monotonic()
+    scores = cpu_benchmark(budget=1.0, workers=2)
+    elapsed = time.monotonic() - started
+
+    assert scores["cpu_single_score"] > 0
+    assert scores["cpu_multi_score"] > 0
+    assert scores["cpu_scaling"] == pytest.approx(
+        scores["cpu_multi_score"] / (scores["cpu_single_score"] * 2)
+    )
+    assert scores["cpu_scaling"] <= 2
+    assert elapsed < 1.5
+
+
+# Requirement profiles can ask for minimum benchmark scores
+def test_cpu_score_requirement():
+    specs = SystemSpecs(cpu_single_score=400.0, cpu_multi_score=3000.0)
+    assert validate_specs(specs, {"CPU Single Score": 500, "CPU Multi Score": 2000}) == [
+        "Single-core CPU speed is too low (score of at least 500 required)."
+    ]
+
+
+# The memory benchmark measures bandwidth and latency within its time budget
+def test_memory_benchmark_within_budget():
+    pytest.importorskip("numpy")
+    started = time.monotonic()
+    results = memory_benchmark(budget=0.5, buffer_bytes=8 * 1024**2)
+    elapsed = time.monotonic() - started
+
+    assert results["mem_copy_gbps"] > 0
+    assert results["mem_triad_gbps"] > 0
+    assert results["mem_latency_ns"] >= 0
+    assert elapsed < 1
+
+
+# The disk benchmark measures the volume with a temporary file it cleans up
+def test_disk_benchmark(tmp_path):
+    started = time.monotonic()
+    results = disk_benchmark(str(tmp_path), budget=0.5, max_bytes=16 * 1024**2)
+    elapsed = time.monotonic() - started
+
+    assert results["disk_write_mbps"] > 0
+    assert results["disk_read_mbps"] > 0
+    assert results["disk_random_iops"] > 0
+    assert results["disk_class"] in ("HDD", "SATA SSD", "NVMe")
+    assert elapsed < 0.75
+    assert not list(tmp_path.iterdir())
+
+
+# Reads that may come from the OS cache give no disk class, so the requirement is unreadable
+@patch("system_check._drop_cache", return_value=False)
+def test_disk_benchmark_without_cache_bypass(mock_drop, tmp_path):
+    def cached_open(path):
+        return open(path, "r+b", buffering=0), False
+
+    with patch("system_check._open_uncached", cached_open):
+        results = disk_benchmark(str(tmp_path), budget=0.3, max_bytes=4 * 1024**2)
+
+    assert results["disk_read_mbps"] > 0
+    assert results["disk_class"] == ""
+    specs = SystemSpecs(**results)
+    assert specs.display()["Disk Benchmark"].startswith("Unknown class")
+    assert validate_specs(specs, {"Disk Class": "HDD"}) == [
+        "Unable to read the disk benchmark from system specs."
+    ]
+
+
+# NVMe is told apart by sequential read alone: random reads run at queue depth 1
+def test_disk_class_boundaries():
+    assert classify_disk(1500, 12000) == "NVMe"
+    assert classify_disk(3500, 500) == "NVMe"
+    assert classify_disk(1499, 90000) == "SATA SSD"
+    assert classify_disk(250, 2000) == "SATA SSD"
+    assert classify_disk(249, 9000) == "HDD"
+    assert classify_disk(540, 1999) == "HDD"
+
+
+# Disk classes follow read speed and random reads, and tiers can require one
+def test_disk_class_requirement():
+    assert classify_disk(120, 150) == "HDD"
+    assert classify_disk(540, 9000) == "SATA SSD"
+    assert classify_disk(3500, 90000) == "NVMe"
+
+    requirements = {"Disk Class": "SATA SSD"}
+    assert validate_specs(SystemSpecs(disk_class="NVMe"), requirements) == []
+    assert validate_specs(SystemSpecs(disk_class="HDD"), requirements) == [
+        "Disk is too slow (at least SATA SSD class required)."
+    ]
+    assert validate_specs(SystemSpecs(), requirements) == [
+        "Unable to read the disk benchmark from system specs."
+    ]
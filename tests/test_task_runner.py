@@ -0,0 +1,120 @@
+import threading
+import time
+import pytest
+from task_runner import TaskRunner, MainThreadProxy, WindowClosed
+
+
+class FakeRoot:
+    """Stands in for tk.Tk: after() callbacks are run by pump()."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.destroyed = False
+
+    def after(self, ms, callback, *args):
+        self.scheduled.append((callback, args))
+
+    def destroy(self):
+        self.destroyed = True
+
+    def pump(self, until, timeout=2):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            scheduled, self.scheduled = self.scheduled, []
+            for callback, args in scheduled:
+                callback(*args)
+            time.sleep(0.01)
+
+
+# Work runs off the Tk thread and its result comes back on the Tk thread
+def test_submit_marshals_result_to_ui_thread():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    seen = {}
+
+    def work():
+        seen["work_thread"] = threading.get_ident()
+        return 42
+
+    def done(result):
+        seen["result"] = result
+        seen["done_thread"] = threading.get_ident()
+
+    runner.submit(work, done)
+    assert runner.busy
+    root.pump(lambda: "result" in seen)
+
+    assert seen["result"] == 42
+    assert seen["work_thread"] != threading.get_ident()
+    assert seen["done_thread"] == threading.get_ident()
+    assert not runner.busy
+
+
+# Message boxes called from a worker run on the Tk thread and return their answer
+def test_proxy_calls_wait_for_ui_thread():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    calls = []
+
+    class FakeMessagebox:
+        @staticmethod
+        def askyesno(title, message):
+            calls.append(threading.get_ident())
+            return True
+
+    messagebox = MainThreadProxy(FakeMessagebox, lambda: runner)
+    outcome = {}
+    runner.submit(
+        lambda: messagebox.askyesno("Warning", "Continue?"),
+        lambda answer: outcome.update(answer=answer),
+    )
+    root.pump(lambda: "answer" in outcome)
+
+    assert outcome["answer"] is True
+    assert calls == [threading.get_ident()]
+
+
+# Errors are reported on the Tk thread and SystemExit closes the window
+def test_errors_and_exit():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    errors = []
+
+    def broken():
+        raise RuntimeError("winget missing")
+
+    runner.submit(broken, on_error=errors.append)
+    root.pump(lambda: errors)
+    assert str(errors[0]) == "winget missing"
+
+    def leave():
+        raise SystemExit(0)
+
+    runner.submit(leave)
+    with pytest.raises(SystemExit):
+        root.pump(lambda: root.destroyed)
+    assert root.destroyed
+
+
+# Closing the window releases a worker waiting on a message box
+def test_close_releases_waiting_worker():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    outcome = {}
+
+    def ask():
+        # Never pumped, so this waits until the window is closed
+        try:
+            runner.call(lambda: True)
+        except WindowClosed:
+            outcome["closed"] = True
+
+    worker = runner.submit(ask)
+    time.sleep(0.1)
+    runner.close()
+    worker.join(timeout=1)
+
+    assert worker.daemon
+    assert not worker.is_alive()
+    assert outcome == {"closed": True}
+    assert root.destroyed
@@ -0,0 +1,93 @@
+import json
+import pstats
+import sys
+import time
+import pytest
+from unittest.mock import patch
+import timing
+import ue_check
+from commands import run_command
+from system_check import run_probes
+from validation import evaluate_tiers
+from specs import SystemSpecs, GIB
+
+
+@pytest.fixture
+def recording():
+    timing.enable()
+    yield
+    timing.disable()
+
+
+def outcomes():
+    return {span.name: span.outcome for span in timing.spans()}
+
+
+# With timing off, a span is one shared no-op context and nothing is kept
+def test_spans_cost_nothing_when_off():
+    timing.disable()
+    assert timing.span("a") is timing.span("b")
+    with timing.span("probe CPU") as span:
+        assert span is None
+    assert timing.spans() == []
+
+
+# Every probe is recorded with its outcome: ok, the exception raised, or timed out
+def test_probe_spans(recording):
+    def broken():
+        raise OSError("no such device")
+
+    probes = {
+        "CPU": lambda: {"cpu_cores": 4},
+        "Disk Space": broken,
+        "GPU": lambda: time.sleep(5),
+    }
+    run_probes(probes, timeouts={"GPU": 0.2})
+
+    assert outcomes() == {
+        "probe CPU": "ok",
+        "probe Disk Space": "OSError",
+        "probe GPU": "timed out",
+    }
+    gpu = next(span for span in timing.spans() if span.name == "probe GPU")
+    assert 0.2 <= gpu.duration < 1
+
+
+# Validation passes and subprocess calls are timed too
+def test_validation_and_command_spans(recording):
+    evaluate_tiers(SystemSpecs(cpu_cores=4, ram_bytes=8 * GIB))
+    run_command([sys.executable, "-c", "raise SystemExit(3)"])
+
+    recorded = outcomes()
+    assert recorded["evaluate_tiers"] == "ok"
+    command = next(name for name in recorded if name.startswith("command "))
+    assert command.endswith("-c raise SystemExit(3)")
+    assert recorded[command] == "exit 3"
+
+
+# --timing adds start, end, duration and outcome of each span to the JSON report
+@patch("ue_check.driver_status", return_value=None)
+@patch("ue_check.check_system_specs", return_value=SystemSpecs(cpu_cores=2))
+def test_json_report_includes_timing(mock_specs, mock_driver, capsys):
+    try:
+        ue_check.main(["--json", "--timing"])
+    finally:
+        timing.disable()
+    report = json.loads(capsys.readouterr().out)
+
+    span = next(span for span in report["timing"] if span["name"] == "evaluate_tiers")
+    assert set(span) == {"name", "start", "end", "duration", "outcome"}
+    assert span["end"] >= span["start"]
+
+
+# The profile dump includes work done on the probe threads
+def test_profile_dump_covers_probe_threads(tmp_path):
+    def busy_probe():
+        return sum(i * i for i in range(10000))
+
+    path = tmp_path / "check.prof"
+    with timing.profile(str(path)):
+        run_probes({"CPU": busy_probe}, timeouts={})
+
+    functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+    assert "busy_probe" in functions
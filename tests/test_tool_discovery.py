@@ -0,0 +1,65 @@
+import os
+import stat
+import pytest
+from unittest.mock import patch
+from tool_discovery import ToolIndex
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="uses shell-script stand-in tools")
+
+
+def make_tool(folder, name, version):
+    path = folder / name
+    path.write_text(f"#!/bin/sh\necho '{version}'\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+@pytest.fixture
+def bin_dir(tmp_path, monkeypatch):
+    folder = tmp_path / "bin"
+    folder.mkdir()
+    monkeypatch.setenv("PATH", str(folder))
+    return folder
+
+
+# A tool is probed once, then answered from the index until something changes
+def test_lookup_is_cached_until_binary_changes(tmp_path, bin_dir):
+    tool = make_tool(bin_dir, "python", "Python 3.12.1")
+    index = ToolIndex(str(tmp_path / "tools.json"))
+
+    info = index.lookup("python")["python"]
+    assert info.ok and info.path == str(tool) and info.version == "Python 3.12.1"
+
+    with patch("tool_discovery.run_commands", side_effect=AssertionError("re-probed")):
+        assert index.lookup("python")["python"] == info
+        # The index survives a restart
+        assert ToolIndex(str(tmp_path / "tools.json")).lookup("python")["python"] == info
+
+    make_tool(bin_dir, "python", "Python 3.13.0")
+    os.utime(tool, ns=(0, tool.stat().st_mtime_ns + 10**9))
+    assert index.lookup("python")["python"].version == "Python 3.13.0"
+
+
+# A missing tool is remembered until a PATH folder changes
+def test_missing_tool_rechecked_when_path_folder_changes(tmp_path, bin_dir):
+    index = ToolIndex(str(tmp_path / "tools.json"))
+    assert index.lookup("python3")["python3"].path is None
+
+    with patch("tool_discovery.locate", side_effect=AssertionError("re-searched")):
+        assert not index.lookup("python3")["python3"].ok
+
+    make_tool(bin_dir, "python3", "Python 3.12.1")
+    os.utime(bin_dir, ns=(0, bin_dir.stat().st_mtime_ns + 10**9))
+    assert index.lookup("python3")["python3"].ok
+
+
+# Changing PATH itself also invalidates entries
+def test_path_change_invalidates(tmp_path, bin_dir, monkeypatch):
+    index = ToolIndex(str(tmp_path / "tools.json"))
+    assert index.lookup("winget")["winget"].path is None
+
+    other = tmp_path / "other"
+    other.mkdir()
+    make_tool(other, "winget", "v1.7")
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_dir), str(other)]))
+    assert index.lookup("winget")["winget"].version == "v1.7"
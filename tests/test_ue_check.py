@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+import ue_check
+from specs import SystemSpecs, GIB
+
+
+MIN_UE5_SPECS = SystemSpecs(
+    cpu_name="Test CPU",
+    cpu_cores=2,
+    ram_bytes=4 * GIB,
+    disk_free_bytes=100 * GIB,
+    os_name="Linux",
+)
+
+
+# The JSON report carries the tier, failures and raw specs, and the exit code follows the tier
+@patch("ue_check.driver_status", return_value=None)
+@patch("ue_check.check_system_specs", return_value=MIN_UE5_SPECS)
+def test_json_output_and_exit_code(mock_specs, mock_driver, capsys):
+    code = ue_check.main(["--json"])
+    report = json.loads(capsys.readouterr().out)
+
+    assert code == ue_check.EXIT_CODES["ue5_minimum"]
+    assert report["tier"] == "ue5_minimum"
+    assert report["specs"]["cpu_cores"] == 2
+    assert "Dedicated GPU required but not found." in report["failures"]["ue5_recommended"]
+
+
+@patch("ue_check.driver_status", return_value=None)
+@patch("ue_check.check_system_specs", return_value=MIN_UE5_SPECS)
+def test_summary_line(mock_specs, mock_driver, capsys):
+    ue_check.main([])
+    out = capsys.readouterr().out
+    assert out.startswith("ue5_minimum: this system meets Unreal Engine 5 minimum requirements")
+
+
+# Tier exit codes never collide with error (1) or usage (2) codes
+def test_exit_codes_are_distinct():
+    codes = list(ue_check.EXIT_CODES.values())
+    assert len(set(codes)) == len(codes)
+    assert 1 not in codes and 2 not in codes
+
+
+# The headless entry point must not pull in any GUI modules
+def test_cli_does_not_import_gui_modules():
+    script = (
+        "import sys, ue_check; "
+        "print(sorted(m for m in ('tkinter', 'PIL', 'tkextrafont') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    assert out.strip() == "[]"
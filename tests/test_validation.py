@@ -1,5 +1,13 @@
 import pytest
-from validation import validate_specs
+from validation import (
+    validate_specs,
+    evaluate_tiers,
+    compile_tiers,
+    validate_batch,
+    specs_to_columns,
+    TIERS,
+)
+from specs import SystemSpecs, GPU, GIB
 
 # Test valid specs for Unreal Engine 5 recommended requirements
 def test_validate_ue5_recommended():
@@ -51,3 +59,114 @@ def test_invalid_cpu():
     }
     errors = validate_specs(specs, requirements)
     assert "CPU does not meet the requirement" in errors[0]
+
+
+# CPU names containing parentheses are no longer re-parsed from display text
+def test_typed_specs_with_parentheses_in_cpu_name():
+    specs = SystemSpecs(
+        cpu_name="Intel(R) Core(TM) i7-8565U CPU @ 1.80GHz",
+        cpu_cores=4,
+        ram_bytes=16 * GIB,
+        disk_free_bytes=150 * GIB,
+        gpus=(GPU("NVIDIA GTX 1080", "456.71"),),
+    )
+    requirements = {
+        'CPU': 4,
+        'RAM': 8,
+        'Disk Space': 100,
+        'GPU': True
+    }
+    assert validate_specs(specs, requirements) == []
+    assert specs.display()["CPU"] == "Intel(R) Core(TM) i7-8565U CPU @ 1.80GHz (4 cores)"
+
+
+# A probe that timed out is reported instead of failing to parse
+def test_timed_out_probe():
+    specs = SystemSpecs(
+        cpu_cores=4,
+        ram_bytes=None,
+        disk_free_bytes=150 * GIB,
+        probe_errors={"RAM": "Timed out"},
+    )
+    requirements = {
+        'CPU': 2,
+        'RAM': 4,
+        'Disk Space': 100,
+        'GPU': False
+    }
+    assert validate_specs(specs, requirements) == ["Unable to read RAM from system specs."]
+    assert specs.display()["RAM"] == "Timed out"
+
+
+# One pass over the specs reports the best tier met and every tier's failures
+def test_evaluate_tiers_single_pass():
+    specs = SystemSpecs(cpu_cores=2, ram_bytes=4 * GIB, disk_free_bytes=60 * GIB)
+    result = evaluate_tiers(specs)
+
+    assert result.tier == "ue4_minimum"
+    assert result.failures["ue5_minimum"] == [
+        "Not enough disk space (at least 100 GB required)."
+    ]
+    assert result.meets("ue4_minimum")
+    assert not result.meets("ue4_recommended")
+
+
+# The single-pass evaluator agrees with validate_specs for every tier
+def test_evaluate_tiers_matches_validate_specs():
+    specs = SystemSpecs(cpu_cores=4, ram_bytes=6 * GIB, disk_free_bytes=120 * GIB)
+    result = evaluate_tiers(specs)
+
+    for name, requirements in TIERS:
+        assert result.failures[name] == validate_specs(specs, requirements)
+    assert result.tier == "ue5_minimum"
+
+
+# Checks shared between tiers are compiled once
+def test_compile_tiers_deduplicates_checks():
+    compiled = compile_tiers()
+    keys = [(check.attribute, check.threshold) for check in compiled.checks]
+    assert len(keys) == len(set(keys))
+    assert list(compiled.tiers) == [name for name, _ in TIERS]
+
+
+# Batch validation gives the same verdict as the scalar evaluator
+def test_validate_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(1234)
+    records = [
+        SystemSpecs(
+            cpu_cores=None if i % 97 == 0 else int(rng.integers(1, 9)),
+            ram_bytes=int(rng.choice([2, 4, 8, 16])) * GIB - int(rng.integers(0, 2)),
+            disk_free_bytes=int(rng.integers(10, 200)) * GIB,
+            gpus=(GPU("NVIDIA GTX 1080", "456.71"),) if rng.random() < 0.5 else (),
+        )
+        for i in range(500)
+    ]
+
+    batch = validate_batch(specs_to_columns(records))
+
+    for i, specs in enumerate(records):
+        expected = evaluate_tiers(specs)
+        code = int(batch.tier_codes[i])
+        assert (batch.tier_names[code] if code >= 0 else None) == expected.tier
+        for name in batch.tier_names:
+            assert bool(batch.tier_failures(name)[i]) == bool(expected.failures[name])
+
+
+# Latency-style requirements pass at or below the limit, in both evaluators
+def test_at_most_requirement():
+    np = pytest.importorskip("numpy")
+    tiers = (("fast", {"Memory Latency": 100, "Memory Bandwidth": 10}),)
+    compiled = compile_tiers(tiers)
+    records = [
+        SystemSpecs(mem_latency_ns=80.0, mem_triad_gbps=20.0),
+        SystemSpecs(mem_latency_ns=120.0, mem_triad_gbps=20.0),
+        SystemSpecs(),
+    ]
+
+    assert [evaluate_tiers(r, compiled).tier for r in records] == ["fast", None, None]
+    assert evaluate_tiers(records[1], compiled).failures["fast"] == [
+        "Memory latency is too high (at most 100 ns allowed)."
+    ]
+    batch = validate_batch(specs_to_columns(records, compiled), compiled)
+    assert np.array_equal(batch.tier_codes, [0, -1, -1])
@@ -0,0 +1,74 @@
+import os
+import pathlib
+import subprocess
+import sys
+import pytest
+import venv_templates
+import wheelhouse
+from tests.helpers import build_wheel
+
+
+@pytest.fixture
+def demo_requirements(tmp_path, monkeypatch):
+    """A requirements file whose only package already sits in the wheelhouse."""
+    monkeypatch.setenv("UE_CHECK_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv(wheelhouse.WHEELHOUSE_ENV, str(tmp_path / "wheelhouse"))
+    build_wheel(pathlib.Path(wheelhouse.wheelhouse_dir(wheelhouse.wheelhouse_key(sys.executable))))
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("demo_pkg\n")
+    return requirements
+
+
+def _run(python, *args):
+    return subprocess.run([python, *args], capture_output=True, text=True)
+
+
+# The second environment is a clone of the template built for the first
+@pytest.mark.skipif(os.name == "nt", reason="clone layout checked on POSIX")
+def test_provision_builds_template_once_then_clones(tmp_path, demo_requirements, monkeypatch):
+    first = venv_templates.provision_environment(
+        sys.executable, str(tmp_path / "env1"), str(demo_requirements)
+    )
+    assert first.ok, first.output
+
+    # No further venv creation or pip runs: the template is reused
+    monkeypatch.setattr(venv_templates, "build_template", None)
+    second = venv_templates.provision_environment(
+        sys.executable, str(tmp_path / "env2"), str(demo_requirements)
+    )
+    assert second.ok
+    assert second.cmd[0] == "clone"
+
+    python = venv_templates.venv_python(str(tmp_path / "env2"))
+    imported = _run(python, "-c", "import demo_pkg, sys; print(demo_pkg.VALUE, sys.prefix)")
+    assert imported.stdout.split() == ["42", str(tmp_path / "env2")]
+    assert _run(python, "-m", "pip", "--version").returncode == 0
+    # Activated environments get a working pip command, as with python -m venv
+    pip = tmp_path / "env2" / "bin" / "pip"
+    version = _run(str(pip), "--version").stdout
+    assert version.startswith("pip ") and str(tmp_path / "env2") in version
+
+    # Paths in the clone point at the clone, not the template
+    activate = (tmp_path / "env2" / "bin" / "activate").read_text()
+    assert str(tmp_path / "env2") in activate
+    assert "venv-templates" not in activate
+
+
+# Changing the requirements file means a new template
+def test_template_key_follows_requirements(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("demo_pkg\n")
+    identity = ("/usr/bin/python3", "3.12.0")
+    key = venv_templates.template_key(identity, requirements)
+    requirements.write_text("demo_pkg==2.0\n")
+    assert venv_templates.template_key(identity, requirements) != key
+
+
+# An interpreter that does not run is reported instead of raising
+def test_provision_missing_interpreter(tmp_path, demo_requirements):
+    result = venv_templates.provision_environment(
+        "no-such-python-here", str(tmp_path / "env"), str(demo_requirements)
+    )
+    assert result.returncode is None
+    assert result.error
+    assert not (tmp_path / "env").exists()
@@ -0,0 +1,71 @@
+import functools
+import http.server
+import sys
+import threading
+import pytest
+from unittest.mock import patch
+import wheelhouse
+from tests.helpers import build_wheel
+from commands import CommandResult
+
+
+@pytest.fixture
+def local_index(tmp_path):
+    """Stand-in package index (PEP 503 simple layout) served from a temp folder."""
+    root = tmp_path / "index"
+    project = root / "simple" / "demo-pkg"
+    project.mkdir(parents=True)
+    wheel = build_wheel(project)
+    (project / "index.html").write_text(f'<a href="{wheel.name}">{wheel.name}</a>\n')
+
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(root))
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/simple"
+    server.shutdown()
+
+
+# The first install fills the wheelhouse; later installs need no index at all
+def test_install_fills_and_reuses_wheelhouse(tmp_path, local_index, monkeypatch):
+    server, index_url = local_index
+    monkeypatch.setenv(wheelhouse.WHEELHOUSE_ENV, str(tmp_path / "wheelhouse"))
+
+    first = wheelhouse.install_requirements(
+        sys.executable,
+        ["demo_pkg"],
+        index_url=index_url,
+        install_args=["--target", str(tmp_path / "seat1")],
+    )
+    assert first.ok, first.output
+    assert (tmp_path / "seat1" / "demo_pkg" / "__init__.py").exists()
+
+    server.shutdown()  # The index is gone; the second seat installs from the wheelhouse
+    second = wheelhouse.install_requirements(
+        sys.executable,
+        ["demo_pkg"],
+        index_url=index_url,
+        install_args=["--target", str(tmp_path / "seat2")],
+    )
+    assert second.ok, second.output
+    assert (tmp_path / "seat2" / "demo_pkg" / "__init__.py").exists()
+
+
+# Wheels are kept per platform and Python version
+def test_wheelhouse_key_matches_interpreter():
+    key = wheelhouse.wheelhouse_key(sys.executable)
+    assert key.endswith("cp%d%d" % sys.version_info[:2])
+
+
+# When no wheel can be built for the wheelhouse, the plain online install still runs
+def test_falls_back_to_online_install(tmp_path, monkeypatch):
+    monkeypatch.setenv(wheelhouse.WHEELHOUSE_ENV, str(tmp_path / "wheelhouse"))
+    results = [CommandResult(("pip", "wheel"), 1, 0.0), CommandResult(("pip", "install"), 0, 0.0)]
+    with patch("wheelhouse.stream_command", side_effect=results) as mock_stream:
+        result = wheelhouse.install_requirements(sys.executable, ["pygame"])
+
+    assert result.ok
+    commands = [call.args[0] for call in mock_stream.call_args_list]
+    assert commands[0][3] == "wheel" and "--wheel-dir" in commands[0]
+    assert commands[1][3] == "install" and "--no-index" not in commands[1]
@@ -0,0 +1,178 @@
+import functools
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+
+# Set to 1 to record timing spans in the GUI (ue_check has --timing)
+TIMING_ENV = "UE_CHECK_TIMING"
+# Set to a file name to write a cProfile dump of each GUI hardware check
+PROFILE_ENV = "UE_CHECK_PROFILE"
+
+_NOT_RECORDING = nullcontext()
+
+# Spans recorded since enable(), or None while timing is off
+_spans = None
+_origin = 0.0
+# cProfile profiles of the check in progress, one per thread, or None
+_profiles = None
+_profiles_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed step. start and end are seconds since timing was enabled."""
+
+    name: str
+    start: float
+    end: float = 0.0
+    outcome: str = "ok"
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    def as_dict(self):
+        return dict(asdict(self), duration=self.duration)
+
+
+def enable():
+    """Start recording spans, forgetting any recorded before."""
+    global _spans, _origin
+    _origin = time.perf_counter()
+    _spans = []
+
+
+def disable():
+    global _spans
+    _spans = None
+
+
+def enabled():
+    return _spans is not None
+
+
+def spans():
+    """Spans recorded so far, in the order they finished."""
+    return list(_spans or ())
+
+
+class _Recorder:
+    __slots__ = ("span",)
+
+    def __enter__(self):
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.end = time.perf_counter() - _origin
+        if exc_type is not None:
+            span.outcome = exc_type.__name__
+        if _spans is not None:
+            _spans.append(span)
+        return False
+
+
+def span(name):
+    """Context manager timing the block as `name`.
+
+    Yields the Span (None when timing is off) so the block can set its
+    outcome, e.g. "timed out"; an exception sets it to the exception name.
+    While timing is off this returns a shared no-op context, so leaving
+    spans in hot paths costs one global lookup and call.
+    """
+    if _spans is None:
+        return _NOT_RECORDING
+    recorder = _Recorder()
+    recorder.span = Span(name, time.perf_counter() - _origin)
+    return recorder
+
+
+def timed(name):
+    """Decorator recording every call of the function as a span named `name`."""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _spans is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def record(name, started, outcome):
+    """Add a span that began at perf_counter() value `started` and ends now."""
+    if _spans is not None:
+        _spans.append(Span(name, started - _origin, time.perf_counter() - _origin, outcome))
+
+
+def as_dicts():
+    """Recorded spans as JSON-friendly dictionaries, in start order."""
+    return [item.as_dict() for item in sorted(spans(), key=lambda s: s.start)]
+
+
+def format_spans(recorded=None):
+    """Spans as the text block shown under Advanced Information."""
+    recorded = spans() if recorded is None else recorded
+    lines = ["\n--- Timing ---"]
+    for item in sorted(recorded, key=lambda s: s.start):
+        lines.append(
+            f"{item.name}: {item.duration * 1000:.1f} ms "
+            f"(at {item.start * 1000:.0f} ms, {item.outcome})"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def thread_profile():
+    """Profile the current thread while a profile() is being taken.
+
+    From Python 3.12 cProfile sees every thread by itself, so nothing is done.
+    """
+    if _profiles is None or sys.version_info >= (3, 12):
+        yield
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        # A probe still running when the check ends is left out of the dump
+        with _profiles_lock:
+            if _profiles is not None:
+                _profiles.append(profiler)
+
+
+@contextmanager
+def profile(path):
+    """Write a cProfile dump of the block, and of probe threads it starts, to path.
+
+    Before Python 3.12 cProfile only sees the thread it runs on, so
+    system_check wraps each probe in thread_profile() and the per-thread
+    profiles are merged here. Open the dump with `python -m pstats`.
+    """
+    global _profiles
+    import cProfile
+    import pstats
+
+    _profiles = []
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        with _profiles_lock:
+            profiles, _profiles = _profiles, None
+        stats = pstats.Stats(profiler)
+        for extra in profiles:
+            stats.add(extra)
+        stats.dump_stats(path)
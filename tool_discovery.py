@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import asdict, dataclass
+
+from app_paths import cache_dir
+from commands import run_commands, PROBE_TIMEOUT
+
+INDEX_FILE = "tools.json"
+
+# Tool name -> (command looked up on PATH, arguments that print its version).
+# VS Code's version is not probed because Code.exe opens a window.
+TOOLS = {
+    "python": ("python", ("--version",)),
+    "python3": ("python3", ("--version",)),
+    "winget": ("winget", ("--version",)),
+    "code": ("code", None),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolInfo:
+    """Where a tool was found and whether its version probe succeeded."""
+
+    name: str
+    path: str | None
+    version: str | None
+    ok: bool
+
+
+def install_locations(name):
+    """Known install paths for tools that are often missing from PATH."""
+    if name != "code" or os.name != "nt":
+        return []
+    locations = []
+    # User-scope installs
+    local = os.environ.get("LOCALAPPDATA")
+    if local:
+        locations.append(os.path.join(local, "Programs", "Microsoft VS Code", "Code.exe"))
+    # System-scope installs
+    for base in (os.environ.get("PROGRAMFILES"), os.environ.get("PROGRAMFILES(X86)")):
+        if base:
+            locations.append(os.path.join(base, "Microsoft VS Code", "Code.exe"))
+    return locations
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def search_fingerprint(name):
+    """Fingerprint of everywhere `name` could be found.
+
+    Covers the PATH value itself and the modification time of every PATH
+    folder and install folder, so installing or removing any executable
+    changes it. Costs one stat per folder.
+    """
+    folders = os.environ.get("PATH", "").split(os.pathsep)
+    folders += [os.path.dirname(location) for location in install_locations(name)]
+    stamps = [(folder, _mtime(folder)) for folder in folders if folder]
+    return hashlib.sha1(json.dumps(stamps).encode("utf-8")).hexdigest()
+
+
+def locate(name):
+    command, _version_args = TOOLS[name]
+    path = shutil.which(command)
+    if path:
+        return path
+    for location in install_locations(name):
+        if os.path.isfile(location):
+            return location
+    return None
+
+
+class ToolIndex:
+    """Persistent record of where each tool lives and its version.
+
+    Entries are saved between launches and trusted until the search
+    fingerprint or the tool binary's mtime changes, so repeat lookups cost a
+    few stat calls instead of new processes.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir(), INDEX_FILE)
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _fresh(self, name):
+        entry = self._entries.get(name)
+        if entry is None or entry["fingerprint"] != search_fingerprint(name):
+            return None
+        if entry["path"] is not None and _mtime(entry["path"]) != entry["mtime"]:
+            return None
+        return ToolInfo(name, entry["path"], entry["version"], entry["ok"])
+
+    def lookup(self, *names, refresh=False):
+        """Return {name: ToolInfo}, probing only tools whose entries are stale.
+
+        Stale tools are version-probed concurrently.
+        """
+        with self._lock:
+            found = {} if refresh else {name: self._fresh(name) for name in names}
+            stale = [name for name in names if found.get(name) is None]
+            if not stale:
+                return found
+
+            paths = {name: locate(name) for name in stale}
+            to_probe = [
+                name for name in stale if paths[name] and TOOLS[name][1] is not None
+            ]
+            results = run_commands(
+                [[paths[name], *TOOLS[name][1]] for name in to_probe], PROBE_TIMEOUT
+            )
+            probes = dict(zip(to_probe, results))
+
+            for name in stale:
+                path = paths[name]
+                probe = probes.get(name)
+                if probe is not None:
+                    lines = probe.output.strip().splitlines()
+                    info = ToolInfo(name, path, lines[0] if lines else None, probe.ok)
+                else:
+                    info = ToolInfo(name, path, None, path is not None)
+                found[name] = info
+                self._entries[name] = dict(
+                    asdict(info),
+                    fingerprint=search_fingerprint(name),
+                    mtime=_mtime(path) if path else None,
+                )
+            self._save()
+            return found
+
+    def forget(self, name=None):
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+            self._save()
+
+    def _save(self):
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass  # The index is only a cache; discovery still works without it
+
+
+_tool_index = None
+_tool_index_lock = threading.Lock()
+
+
+def tool_index():
+    """The shared ToolIndex, loaded from disk on first use."""
+    global _tool_index
+    with _tool_index_lock:
+        if _tool_index is None:
+            _tool_index = ToolIndex()
+        return _tool_index
+
+
+def discover(*names, refresh=False):
+    """Look up tools in the shared index. Returns {name: ToolInfo}."""
+    return tool_index().lookup(*names, refresh=refresh)
@@ -0,0 +1,124 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+import timing
+from resource_sampler import ResourceSampler
+from system_check import check_system_specs, get_gpu_info, is_driver_up_to_date
+from validation import evaluate_tiers, TIERS
+from report import build_report, send_report
+
+TIER_LABELS = {
+    "ue5_recommended": "meets Unreal Engine 5 recommended requirements",
+    "ue5_minimum": "meets Unreal Engine 5 minimum requirements",
+    "ue4_recommended": "can run Unreal Engine 4 (recommended), but not Unreal Engine 5",
+    "ue4_minimum": "can run Unreal Engine 4, but not Unreal Engine 5",
+    None: "cannot run Unreal Engine 4 or 5",
+}
+
+# Exit code per result tier. 1 is left for unexpected errors and 2 for
+# command line usage errors (argparse), so tiers start at 0 and then 3.
+EXIT_CODES = {"ue5_recommended": 0}
+EXIT_CODES.update({name: 3 + i for i, (name, _) in enumerate(TIERS[1:])})
+EXIT_CODES[None] = 3 + len(TIERS) - 1
+
+
+@timing.timed("driver check")
+def driver_status():
+    """Driver verdict for the primary GPU, without opening a browser."""
+    try:
+        gpu_info = get_gpu_info()
+    except Exception:
+        return None
+    if not gpu_info:
+        return None
+    up_to_date, download_link = is_driver_up_to_date(
+        gpu_info["name"], gpu_info["driver_version"]
+    )
+    return dict(gpu_info, up_to_date=up_to_date, download_link=download_link)
+
+
+def summary_line(report):
+    line = f"{report['tier'] or 'none'}: this system {TIER_LABELS[report['tier']]}"
+    failures = report["failures"].get(TIERS[0][0])
+    if failures:
+        line += " (" + " ".join(failures) + ")"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="ue-check",
+        description="Check this machine against the Unreal Engine 4/5 requirements.",
+        epilog="Exit codes: "
+        + ", ".join(f"{code}={tier or 'none'}" for tier, code in EXIT_CODES.items()),
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the full report as JSON"
+    )
+    parser.add_argument(
+        "--collector", metavar="URL", help="also send the report to a fleet collector"
+    )
+    parser.add_argument(
+        "--sample",
+        metavar="SECONDS",
+        type=float,
+        default=0,
+        help="measure free CPU, RAM and GPU for this long before reporting",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="also run the CPU, memory and disk benchmarks (a few seconds)",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="time every probe, validation pass and command and add the spans to the report",
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE", help="write a cProfile dump of the check to FILE"
+    )
+    args = parser.parse_args(argv)
+
+    if args.timing or os.environ.get(timing.TIMING_ENV):
+        timing.enable()
+    with timing.profile(args.profile) if args.profile else nullcontext():
+        report, tier = run_check(args)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(summary_line(report))
+        if timing.enabled():
+            print(timing.format_spans(), end="")
+
+    if args.collector:
+        send_report(report, args.collector)
+
+    return EXIT_CODES[tier]
+
+
+def run_check(args):
+    """Run the check; returns (report, best tier met)."""
+    sampler = None
+    if args.sample > 0:
+        sampler = ResourceSampler().start()
+        time.sleep(args.sample)
+        sampler.stop()
+    specs = check_system_specs(sampler, benchmarks=args.benchmark)
+    tiers = evaluate_tiers(specs)
+    report = build_report(specs, tiers)
+    report["driver"] = driver_status()
+    if timing.enabled():
+        report["timing"] = timing.as_dicts()
+    return report, tiers.tier
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
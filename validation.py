@@ -1,43 +1,317 @@
-def validate_specs(specs, requirements):
-    """Validate system specs against given requirements."""
-    errors = []
+from dataclasses import dataclass
+
+import timing
+from specs import DISK_CLASSES, GIB, as_system_specs
+
+# Unreal Engine Requirements
+REQUIREMENTS_UE5 = {
+    "minimum": {"CPU": 2, "RAM": 4, "Disk Space": 100, "GPU": False},
+    "recommended": {"CPU": 4, "RAM": 8, "Disk Space": 100, "GPU": True},
+}
+
+REQUIREMENTS_UE4 = {
+    "minimum": {"CPU": 2, "RAM": 4, "Disk Space": 50, "GPU": False},
+    "recommended": {"CPU": 4, "RAM": 8, "Disk Space": 50, "GPU": True},
+}
+
+# Requirement tiers, best first. evaluate_tiers reports the first one met.
+TIERS = (
+    ("ue5_recommended", REQUIREMENTS_UE5["recommended"]),
+    ("ue5_minimum", REQUIREMENTS_UE5["minimum"]),
+    ("ue4_recommended", REQUIREMENTS_UE4["recommended"]),
+    ("ue4_minimum", REQUIREMENTS_UE4["minimum"]),
+)
+
+DISK_CLASS_LEVELS = {name: level for level, name in enumerate(DISK_CLASSES)}
+
+# How each requirement key is checked:
+# key -> (SystemSpecs attribute, unit in the spec record, failure message, unreadable message)
+# A spec value passes when it is at least requirement * unit, or at most
+# requirement * unit for the keys in AT_MOST_CHECKS. A dict unit maps named
+# requirements ("SATA SSD") to the number they stand for.
+REQUIREMENT_CHECKS = {
+    "CPU": (
+        "cpu_cores",
+        1,
+        "CPU does not meet the requirement ({} cores).",
+        "Unable to read CPU cores from system specs.",
+    ),
+    "RAM": (
+        "ram_bytes",
+        GIB,
+        "Not enough RAM (at least {} GB required).",
+        "Unable to read RAM from system specs.",
+    ),
+    "Disk Space": (
+        "disk_free_bytes",
+        GIB,
+        "Not enough disk space (at least {} GB required).",
+        "Unable to read Disk Space from system specs.",
+    ),
+    "GPU": (
+        "has_gpu",
+        1,
+        "Dedicated GPU required but not found.",
+        "Unable to read GPU from system specs.",
+    ),
+    # From system_check.disk_benchmark; the requirement is a class name
+    "Disk Class": (
+        "disk_class_level",
+        DISK_CLASS_LEVELS,
+        "Disk is too slow (at least {} class required).",
+        "Unable to read the disk benchmark from system specs.",
+    ),
+    # From system_check.memory_benchmark
+    "Memory Bandwidth": (
+        "mem_triad_gbps",
+        1,
+        "Memory bandwidth is too low (at least {} GB/s required).",
+        "Unable to read the memory benchmark from system specs.",
+    ),
+    "Memory Latency": (
+        "mem_latency_ns",
+        1,
+        "Memory latency is too high (at most {} ns allowed).",
+        "Unable to read the memory benchmark from system specs.",
+    ),
+    # Kernel rounds per second from system_check.cpu_benchmark
+    "CPU Single Score": (
+        "cpu_single_score",
+        1,
+        "Single-core CPU speed is too low (score of at least {} required).",
+        "Unable to read the CPU benchmark from system specs.",
+    ),
+    "CPU Multi Score": (
+        "cpu_multi_score",
+        1,
+        "Multi-core CPU speed is too low (score of at least {} required).",
+        "Unable to read the CPU benchmark from system specs.",
+    ),
+    # Measured by resource_sampler; only readable when sampling was enabled
+    "CPU Headroom": (
+        "cpu_headroom_cores",
+        1,
+        "Not enough idle CPU while in use (at least {} free cores required).",
+        "CPU headroom was not sampled.",
+    ),
+    "RAM Headroom": (
+        "ram_headroom_bytes",
+        GIB,
+        "Not enough free RAM while in use (at least {} GB free required).",
+        "RAM headroom was not sampled.",
+    ),
+    "GPU Headroom": (
+        "gpu_headroom_percent",
+        1,
+        "GPU too busy while in use (at least {}% idle required).",
+        "GPU headroom was not sampled.",
+    ),
+}
+
+# Keys where lower is better
+AT_MOST_CHECKS = {"Memory Latency"}
+
+
+@dataclass(frozen=True, slots=True)
+class Check:
+    """One compiled comparison: spec attribute >= threshold (<= if at_most)."""
+
+    attribute: str
+    threshold: float
+    message: str
+    unreadable: str
+    at_most: bool = False
+
+    def fails(self, value):
+        return value > self.threshold if self.at_most else value < self.threshold
+
 
-    # CPU validation
-    try:
-        if "(" in specs["CPU"]:
-            # Handle cases like "Intel(R) Core(TM) i7-8565U CPU @ 1.80GHz (4 cores)"
-            cpu_cores = int(specs["CPU"].split("(")[-1].split(" ")[0])
+@dataclass(frozen=True, slots=True)
+class CompiledTiers:
+    """Requirement tiers flattened into one list of unique checks.
+
+    `tiers` maps each tier name, in order, to the indices of its checks, so a
+    check shared by several tiers (e.g. "at least 2 cores") is evaluated once.
+    """
+
+    checks: tuple
+    tiers: dict
+
+
+@dataclass(frozen=True, slots=True)
+class TierResult:
+    """Outcome of evaluate_tiers: the best tier met and every tier's failures."""
+
+    tier: str | None
+    failures: dict
+
+    def meets(self, tier):
+        return not self.failures[tier]
+
+
+def compile_checks(requirements):
+    """Turn one requirements dictionary into a list of Check objects."""
+    checks = []
+    for key, (attribute, unit, message, unreadable) in REQUIREMENT_CHECKS.items():
+        required = requirements.get(key)
+        if required is None or required is False:
+            continue
+        if isinstance(unit, dict):
+            threshold = unit[required]
         else:
-            cpu_cores = int(specs["CPU"].split(" ")[0])  # Handle simpler case
-        if cpu_cores < requirements["CPU"]:
-            errors.append(
-                f"CPU does not meet the requirement ({requirements['CPU']} cores)."
-            )
-    except (ValueError, IndexError):
-        errors.append("Unable to parse CPU cores from system specs.")
-
-    # RAM validation
-    try:
-        ram = float(specs["RAM"].split(" ")[0])
-        if ram < requirements["RAM"]:
-            errors.append(
-                f"Not enough RAM (at least {requirements['RAM']} GB required)."
+            threshold = 1 if required is True else required * unit
+        checks.append(
+            Check(
+                attribute,
+                threshold,
+                message.format(required),
+                unreadable,
+                key in AT_MOST_CHECKS,
             )
-    except ValueError:
-        errors.append("Unable to parse RAM from system specs.")
-
-    # Disk Space validation
-    try:
-        disk_space = float(specs["Disk Space"].split(" ")[0])
-        if disk_space < requirements["Disk Space"]:
-            errors.append(
-                f"Not enough disk space (at least {requirements['Disk Space']} GB required)."
-            )
-    except ValueError:
-        errors.append("Unable to parse Disk Space from system specs.")
+        )
+    return checks
+
+
+def compile_tiers(tiers=TIERS):
+    """Compile ordered (name, requirements) tiers into a CompiledTiers."""
+    checks = []
+    index = {}
+    tier_checks = {}
+    for name, requirements in tiers:
+        indices = []
+        for check in compile_checks(requirements):
+            key = (check.attribute, check.threshold, check.at_most)
+            if key not in index:
+                index[key] = len(checks)
+                checks.append(check)
+            indices.append(index[key])
+        tier_checks[name] = tuple(indices)
+    return CompiledTiers(tuple(checks), tier_checks)
+
+
+COMPILED_TIERS = compile_tiers()
 
-    # GPU validation
-    if requirements["GPU"] and "No dedicated GPU" in specs["GPU"]:
-        errors.append("Dedicated GPU required but not found.")
 
+def _failure(check, specs):
+    value = getattr(specs, check.attribute)
+    if value is None:
+        return check.unreadable
+    if check.fails(value):
+        return check.message
+    return None
+
+
+@timing.timed("evaluate_tiers")
+def evaluate_tiers(specs, compiled=None):
+    """Evaluate every requirement tier in a single pass over the specs.
+
+    Returns a TierResult naming the highest tier met (None if none are)
+    along with the failure messages of every tier.
+    """
+    compiled = COMPILED_TIERS if compiled is None else compiled
+    specs = as_system_specs(specs)
+
+    outcomes = [_failure(check, specs) for check in compiled.checks]
+
+    failures = {}
+    best = None
+    for name, indices in compiled.tiers.items():
+        failures[name] = [outcomes[i] for i in indices if outcomes[i] is not None]
+        if best is None and not failures[name]:
+            best = name
+    return TierResult(best, failures)
+
+
+@timing.timed("validate_specs")
+def validate_specs(specs, requirements):
+    """Validate system specs against given requirements.
+
+    `specs` is a SystemSpecs record; older label -> text dictionaries are
+    still accepted and converted first.
+    """
+    specs = as_system_specs(specs)
+    errors = []
+    for check in compile_checks(requirements):
+        failure = _failure(check, specs)
+        if failure is not None:
+            errors.append(failure)
     return errors
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of validate_batch for many spec records at once.
+
+    `tier_codes[i]` is the index into `tier_names` of the best tier met by
+    record i, or -1 if it meets none. Bit j of `failure_bits[i]` is set when
+    record i fails `checks[j]`; tier_failures() narrows that to one tier.
+    """
+
+    tier_codes: object
+    failure_bits: object
+    tier_names: tuple
+    tier_masks: dict
+    checks: tuple
+
+    def tier_failures(self, tier):
+        return self.failure_bits & self.tier_masks[tier]
+
+    def messages(self, bits):
+        """Decode one record's failure bitmask into failure messages."""
+        bits = int(bits)
+        return [check.message for i, check in enumerate(self.checks) if bits >> i & 1]
+
+
+def specs_to_columns(records, compiled=None):
+    """Turn SystemSpecs records into the columns validate_batch expects.
+
+    Unreadable values become NaN, which validate_batch treats as failing.
+    """
+    compiled = COMPILED_TIERS if compiled is None else compiled
+    columns = {}
+    for attribute in {check.attribute for check in compiled.checks}:
+        column = []
+        for specs in records:
+            value = getattr(as_system_specs(specs), attribute)
+            column.append(float("nan") if value is None else float(value))
+        columns[attribute] = column
+    return columns
+
+
+@timing.timed("validate_batch")
+def validate_batch(columns, compiled=None):
+    """Evaluate every requirement tier for many machines with NumPy.
+
+    `columns` maps SystemSpecs attribute names (cpu_cores, ram_bytes,
+    disk_free_bytes, has_gpu) to equal-length sequences, one entry per
+    machine. Each compiled check is one vectorised comparison, so the cost
+    does not depend on the number of tiers sharing it. Results match
+    evaluate_tiers record for record. NumPy is only needed for this function.
+    """
+    import numpy as np
+
+    compiled = COMPILED_TIERS if compiled is None else compiled
+    if len(compiled.checks) > 64:
+        raise ValueError("validate_batch supports at most 64 distinct checks.")
+
+    arrays = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+    count = len(next(iter(arrays.values()))) if arrays else 0
+
+    failure_bits = np.zeros(count, dtype=np.uint64)
+    for i, check in enumerate(compiled.checks):
+        values = arrays[check.attribute]
+        # NaN (unreadable) compares False, so it has to be failed explicitly
+        failed = np.isnan(values) | check.fails(values)
+        failure_bits |= failed.astype(np.uint64) << np.uint64(i)
+
+    tier_names = tuple(compiled.tiers)
+    tier_masks = {
+        name: np.uint64(sum(1 << i for i in set(indices)))
+        for name, indices in compiled.tiers.items()
+    }
+    masks = np.array([tier_masks[name] for name in tier_names], dtype=np.uint64)
+
+    met = (failure_bits[:, None] & masks[None, :]) == 0
+    tier_codes = np.where(met.any(axis=1), met.argmax(axis=1), -1).astype(np.int8)
+
+    return BatchResult(tier_codes, failure_bits, tier_names, tier_masks, compiled.checks)
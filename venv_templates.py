@@ -0,0 +1,193 @@
+import glob
+import hashlib
+import os
+import shutil
+import sys
+import time
+
+from app_paths import cache_dir
+from commands import CommandResult, run_command, stream_command, PROBE_TIMEOUT
+from wheelhouse import PIP_QUIET_ARGS, install_requirements, wheelhouse_dir, wheelhouse_key
+
+COMPLETE_MARKER = ".template-complete"
+
+IDENTITY_SCRIPT = "import sys; print(sys.executable); print(sys.version)"
+
+
+def venv_python(env_dir):
+    if os.name == "nt":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+
+def interpreter_identity(python_exec):
+    """(resolved executable, version string) of python_exec, or None if it does not run."""
+    result = run_command([python_exec, "-c", IDENTITY_SCRIPT], PROBE_TIMEOUT)
+    if not result.ok:
+        return None
+    executable, _, version = result.output.strip().partition("\n")
+    return os.path.realpath(executable), version.strip()
+
+
+def template_key(identity, requirements_file):
+    """Templates are built once per interpreter and requirements file contents."""
+    digest = hashlib.sha256()
+    digest.update("\n".join(identity).encode("utf-8"))
+    with open(requirements_file, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def is_current_interpreter(identity):
+    return not getattr(sys, "frozen", False) and identity[0] == os.path.realpath(
+        sys.executable
+    )
+
+
+def find_pip_wheel(python_exec, identity):
+    """A cached pip wheel usable by python_exec, or None.
+
+    Looks in the wheelhouse for that interpreter and, when it is the
+    interpreter running this code, in ensurepip's bundled wheels.
+    """
+    folders = []
+    key = wheelhouse_key(python_exec)
+    if key:
+        folders.append(wheelhouse_dir(key))
+    if is_current_interpreter(identity):
+        import ensurepip
+
+        folders.append(os.path.join(os.path.dirname(ensurepip.__file__), "_bundled"))
+
+    for folder in folders:
+        wheels = sorted(glob.glob(os.path.join(folder, "pip-*.whl")))
+        if wheels:
+            return wheels[-1]
+    return None
+
+
+def create_venv(python_exec, identity, env_dir, on_output=None):
+    """Create a bare venv with pip at env_dir. Returns a CommandResult.
+
+    When a pip wheel is cached, ensurepip is skipped: the venv is created
+    without pip (in-process with venv.EnvBuilder when env_dir is for the
+    interpreter running this code) and pip, run straight from the wheel,
+    installs itself from it with no index. That also creates the pip
+    launchers, as ensurepip would.
+    """
+    pip_wheel = find_pip_wheel(python_exec, identity)
+
+    if pip_wheel is None:
+        return stream_command([python_exec, "-m", "venv", env_dir], on_output)
+
+    if is_current_interpreter(identity):
+        import venv
+
+        venv.EnvBuilder(with_pip=False, symlinks=os.name != "nt").create(env_dir)
+    else:
+        result = stream_command(
+            [python_exec, "-m", "venv", "--without-pip", env_dir], on_output
+        )
+        if not result.ok:
+            return result
+
+    # A wheel is importable as a zip, so <wheel>/pip runs pip from inside it
+    return stream_command(
+        [
+            venv_python(env_dir), os.path.join(pip_wheel, "pip"), "install",
+            *PIP_QUIET_ARGS, "--no-index", "--find-links", os.path.dirname(pip_wheel), "pip",
+        ],
+        on_output,
+    )
+
+
+def build_template(python_exec, identity, requirements_file, template_dir, on_output=None):
+    """Create the template venv and install the requirements into it."""
+    if os.path.isdir(template_dir):
+        # Left over from an interrupted build
+        shutil.rmtree(template_dir)
+
+    result = create_venv(python_exec, identity, template_dir, on_output)
+    if not result.ok:
+        return result
+
+    result = install_requirements(
+        venv_python(template_dir), ["-r", os.path.abspath(requirements_file)], on_output
+    )
+    if result.ok:
+        open(os.path.join(template_dir, COMPLETE_MARKER), "w").close()
+    return result
+
+
+def _link_or_copy(source, destination):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _rewrite_prefix(path, old, new):
+    with open(path, "rb") as f:
+        data = f.read()
+    if old not in data:
+        return
+    mode = os.stat(path).st_mode
+    # Replace rather than edit in place: the file may be hard-linked to the template
+    os.unlink(path)
+    with open(path, "wb") as f:
+        f.write(data.replace(old, new))
+    os.chmod(path, mode)
+
+
+def clone_environment(template_dir, env_dir):
+    """Clone a template venv to env_dir by hard-linking its files.
+
+    Package files are shared with the template (pip replaces files rather
+    than editing them, so clones cannot change the template). Files that
+    name the template's location - pyvenv.cfg, activate scripts and console
+    script launchers - are rewritten for env_dir.
+    """
+    env_dir = os.path.abspath(env_dir)
+    shutil.copytree(
+        template_dir,
+        env_dir,
+        symlinks=True,
+        copy_function=_link_or_copy,
+        ignore=shutil.ignore_patterns(COMPLETE_MARKER),
+    )
+
+    old = os.path.abspath(template_dir).encode("utf-8")
+    new = env_dir.encode("utf-8")
+    scripts = os.path.join(env_dir, "Scripts" if os.name == "nt" else "bin")
+    candidates = [os.path.join(env_dir, "pyvenv.cfg")]
+    candidates += [os.path.join(scripts, name) for name in os.listdir(scripts)]
+    for path in candidates:
+        if os.path.isfile(path) and not os.path.islink(path):
+            _rewrite_prefix(path, old, new)
+
+
+def provision_environment(python_exec, env_dir, requirements_file, on_output=None):
+    """Create env_dir with requirements_file installed, using a cached template.
+
+    The first call for an interpreter and requirements file builds a template
+    venv in the checker's cache; every later call clones it, which takes
+    seconds instead of a full venv + pip install. Returns a CommandResult
+    (returncode None with `error` set if python_exec does not run).
+    """
+    identity = interpreter_identity(python_exec)
+    if identity is None:
+        return CommandResult((python_exec,), None, 0.0, error=f"{python_exec} is not available")
+
+    template_dir = os.path.join(
+        cache_dir("venv-templates"), template_key(identity, requirements_file)
+    )
+    if not os.path.isfile(os.path.join(template_dir, COMPLETE_MARKER)):
+        result = build_template(
+            python_exec, identity, requirements_file, template_dir, on_output
+        )
+        if not result.ok:
+            return result
+
+    started = time.monotonic()
+    clone_environment(template_dir, env_dir)
+    return CommandResult(("clone", template_dir, env_dir), 0, time.monotonic() - started)
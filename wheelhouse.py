@@ -0,0 +1,89 @@
+import os
+
+from app_paths import cache_dir
+from commands import run_command, stream_command, PROBE_TIMEOUT
+
+# Set to a shared folder (e.g. \\server\wheelhouse) so a whole classroom
+# downloads each wheel once. Defaults to the per-user cache.
+WHEELHOUSE_ENV = "UE_CHECK_WHEELHOUSE"
+
+PIP_QUIET_ARGS = ["--disable-pip-version-check", "--no-input"]
+
+KEY_SCRIPT = (
+    "import sys, sysconfig; "
+    "print(sysconfig.get_platform().replace('-', '_').replace('.', '_'), "
+    "'cp%d%d' % sys.version_info[:2])"
+)
+
+
+def wheelhouse_key(python_exec):
+    """Platform tag and Python version of the interpreter that will install.
+
+    Wheels are only reusable between interpreters with the same key, e.g.
+    "win_amd64-cp312". Returns None if the interpreter cannot be queried.
+    """
+    result = run_command([python_exec, "-c", KEY_SCRIPT], PROBE_TIMEOUT)
+    if not result.ok:
+        return None
+    return "-".join(result.output.split())
+
+
+def wheelhouse_dir(key):
+    base = os.environ.get(WHEELHOUSE_ENV)
+    if base:
+        path = os.path.join(base, key)
+        os.makedirs(path, exist_ok=True)
+        return path
+    return cache_dir("wheelhouse", key)
+
+
+def install_requirements(
+    python_exec,
+    requirements,
+    on_output=None,
+    index_url=None,
+    install_args=(),
+):
+    """pip install `requirements` with `python_exec`, preferring the wheelhouse.
+
+    `requirements` are pip arguments such as ["pygame"] or
+    ["-r", "ai_requirements.txt"]. The install is first tried with no index
+    at all, straight from the wheelhouse. If something is missing, pip builds
+    wheels for the requirements into the wheelhouse (filling it for the next
+    machine, including packages only published as sdists) and installs from
+    there. If that still fails, a plain install from the index is tried.
+    Returns the final CommandResult.
+    """
+    requirements = list(requirements)
+    index_args = ["--index-url", index_url] if index_url else []
+    online_install = [
+        python_exec, "-m", "pip", "install", *PIP_QUIET_ARGS,
+        *index_args, *install_args, *requirements,
+    ]
+    key = wheelhouse_key(python_exec)
+    if key is None:
+        # Cannot tell which wheels fit; fall back to a plain install
+        return stream_command(online_install, on_output)
+
+    folder = wheelhouse_dir(key)
+    offline_install = [
+        python_exec, "-m", "pip", "install", *PIP_QUIET_ARGS,
+        "--no-index", "--find-links", folder, *install_args, *requirements,
+    ]
+
+    if os.listdir(folder):
+        result = stream_command(offline_install, on_output)
+        if result.ok:
+            return result
+
+    build = [
+        python_exec, "-m", "pip", "wheel", *PIP_QUIET_ARGS,
+        "--wheel-dir", folder, *index_args, *requirements,
+    ]
+    if stream_command(build, on_output).ok:
+        result = stream_command(offline_install, on_output)
+        if result.ok:
+            return result
+    # The wheelhouse cannot serve this install (no wheel could be built, or a
+    # build dependency is missing offline); install as before it existed
+    return stream_command(online_install, on_output)